@@ -0,0 +1,67 @@
+"""Benchmark the vectorized batch engine and verify it against the plain one.
+
+Run from anywhere: `python benchmarks/bench_batch.py`.
+"""
+
+import random
+import sys
+from time import perf_counter
+
+import numpy as np
+from chilly_bird.sim import Simulation
+from chilly_bird.sim.batch import BatchSimulation
+
+
+def bot(batch: BatchSimulation) -> np.ndarray:
+    """Jump whenever the bird sinks below the next gap's middle, per run."""
+    r = batch.rules
+    gaps = batch.next_gaps()
+    target = (gaps[1] + gaps[2]) / 2 if gaps else r.screen_height / 2
+    return (batch.bird_top + r.bird_size[1] / 2 > target + 10) & (batch.velocity > 0)
+
+
+def throughput(n: int, max_ticks: int = 60 * 60) -> float:
+    """Return the alive bird-steps per second, playing with the `bot`."""
+    batch = BatchSimulation(n)
+    steps = 0
+    start = perf_counter()
+    while batch.alive.any() and batch.ticks < max_ticks:
+        steps += int(batch.alive.sum())
+        batch.step(bot(batch))
+    return steps / (perf_counter() - start)
+
+
+def verify(n: int, max_ticks: int = 60 * 60) -> None:
+    """Replay the per-run `bot` inputs with the plain engine and compare results.
+
+    Raises
+    ------
+        AssertionError: if any run diverged from the plain engine
+
+    """
+    batch = BatchSimulation(n)
+    inputs = []
+    while batch.alive.any() and batch.ticks < max_ticks:
+        jump = bot(batch)
+        inputs.append(jump)
+        batch.step(jump)
+    recorded = np.array(inputs)
+
+    for i in range(n):
+        sim = Simulation(rng=random.Random(batch.seeds[i]))
+        result = sim.run(recorded[:, i].tolist(), max_ticks=max_ticks)
+        expected = (result.score, result.ticks if result.game_over else -1)
+        actual = (int(batch.score[i]), int(batch.death_tick[i]))
+        assert actual == expected, f"run {i}: {actual} != {expected}"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    verify(300)
+    print("300 runs match the plain engine")
+    for n in (100, 1_000, 10_000, 100_000):
+        print(f"{n:>7} birds: {throughput(n):>14,.0f} bird-steps per second")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
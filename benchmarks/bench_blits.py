@@ -0,0 +1,97 @@
+"""Benchmark the batched, culled sprites drawing against blitting them one by one.
+
+Draws crowds of 10, 100 and 1000 moving bird-sized sprites, a quarter of them
+off the screen, as the ghost birds and dense pipe fields would be drawn.
+
+Run from anywhere: `python benchmarks/bench_blits.py`.
+"""
+
+import os
+import random
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from timeit import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird.assets import registry  # noqa: E402
+from chilly_bird.configs import load_config  # noqa: E402
+from chilly_bird.objects.base import KinematicSprite  # noqa: E402
+from chilly_bird.rendering import draw_rect  # noqa: E402
+from chilly_bird.states.base import BaseState  # noqa: E402
+from loguru import logger  # noqa: E402
+from typing_extensions import override  # noqa: E402
+
+SIZES = (10, 100, 1000)
+OFF_SCREEN = 0.25
+
+
+class Crowd(BaseState):
+    """A state of nothing but the `crowd` group of sprites."""
+
+    @override
+    def on_enter(self, passed_groups: Mapping[str, pg.sprite.AbstractGroup]) -> None:
+        pass
+
+
+def per_sprite_draw(state: BaseState, surface: pg.Surface, alpha: float) -> None:
+    """Draw the `state`'s sprites one by one, as `BaseState.draw` used to."""
+    for group in state.groups.values():
+        for sprite in group.sprites():
+            surface.blit(sprite.image, draw_rect(sprite, alpha))
+
+
+def crowd(n: int, image: pg.Surface, screen: pg.Rect, rng: random.Random) -> Crowd:
+    """Return the state of `n` sprites, `OFF_SCREEN` of them outside the `screen`."""
+    state = Crowd()
+    group = pg.sprite.Group()
+    for i in range(n):
+        sprite = KinematicSprite(group)
+        sprite.image = image
+        sprite.rect = image.get_rect()
+        x, y = rng.randrange(screen.width), rng.randrange(screen.height)
+        if i < n * OFF_SCREEN:
+            x += screen.width + image.get_width()  # ? waiting to scroll in
+        sprite.place((x, y))
+        sprite.move(-2, 0)
+    state.groups["crowd"] = group
+    return state
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+    image = registry.image(
+        cfg.main_scene.bird_aframes[0], size=tuple(cfg.main_scene.bird_size)
+    )
+    rng = random.Random(0)
+    for n in SIZES:
+        state = crowd(n, image, screen.get_rect(), rng)
+        number = max(20_000 // n, 1)
+        costs = {
+            draw: min(
+                timeit(lambda d=draw, s=state: d(s, screen, 0.5), number=number)
+                for _ in range(5)
+            )
+            / number
+            * 1e6
+            for draw in (per_sprite_draw, Crowd.draw)
+        }
+        one_by_one, batched = costs.values()
+        print(
+            f"{n:>5} sprites: one by one {one_by_one:8.1f} us,"
+            f" batched and culled {batched:8.1f} us"
+            f" ({(batched / one_by_one - 1) * 100:+.1f}%)"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
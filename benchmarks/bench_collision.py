@@ -0,0 +1,135 @@
+"""Benchmark the bird vs pipes collision checks.
+
+Compares the scan of all the pipes with the ordered lane on dense pipe lanes,
+then the per-frame cost of the Flying scene with the rect-only collisions and
+with the pixel-perfect narrowphase.
+
+Run from anywhere: `python benchmarks/bench_collision.py`.
+"""
+
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+from timeit import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird.configs import MainConfig, load_config  # noqa: E402
+from chilly_bird.objects.bird import Bird  # noqa: E402
+from chilly_bird.objects.pipes import PipeGroup, PipePool  # noqa: E402
+from chilly_bird.objects.road import Road  # noqa: E402
+from chilly_bird.sim.replay import Replay  # noqa: E402
+from chilly_bird.states import Flying  # noqa: E402
+from loguru import logger  # noqa: E402
+
+BIRDS = 8
+"""Birds checked per tick, as in a multi-bird mode."""
+
+
+def make_lane(cfg: MainConfig, pairs: int, spacing: int = 60) -> PipeGroup:
+    """Return `pairs` pipes pairs, spaced evenly from the left screen edge."""
+    pool = PipePool(2 * pairs, cfg)
+    lane = PipeGroup()
+    for i in range(pairs):
+        for direction in ("down", "up"):
+            lane.add(pool.acquire((i * spacing - 30, 234), direction, 100, 2))
+    return lane
+
+
+def bot(flying: Flying, bird: Bird) -> bool:
+    """Jump whenever the bird sinks below the next gap's middle."""
+    target = flying.rules.screen_height / 2
+    lane = [pipe for pipe in flying.pipes.lane if pipe.rect.right >= bird.rect.left]
+    if len(lane) >= 2:  # noqa: PLR2004
+        target = (lane[0].rect.bottom + lane[1].rect.top) / 2
+    return bird.rect.centery > target + 10 and bird.gravity > 0
+
+
+def frame_cost(
+    cfg: MainConfig,
+    screen: pg.Surface,
+    ticks: int,
+    *,
+    pixel_perfect: bool,
+) -> tuple[float, float]:
+    """Play the Flying scene with the `bot`, restarting it on every death.
+
+    Returns
+    -------
+        Time per tick (update and draw), in us, and the average score.
+
+    """
+    cfg.main_scene.pixel_perfect_collision = pixel_perfect
+    bird = Bird((50, cfg.window.screen_height / 2), cfg)
+    road = Road(cfg)
+    flying = Flying(cfg, "GameOver")
+    scores: list[int] = []
+    elapsed = 0.0
+    seed = 0
+    left = ticks
+    while left > 0:
+        seed += 1
+        bird.reset()
+        # ? an empty replay, to spawn the same pipes in both modes
+        flying.replay = Replay(seed, flying.rules.digest(), 0, 0, b"")
+        flying.on_enter(
+            {"bird": pg.sprite.GroupSingle(bird), "road": pg.sprite.GroupSingle(road)}
+        )
+        flying.input_source = lambda: bot(flying, bird)
+        start = perf_counter()
+        while not flying.done and left > 0:
+            flying.update(flying.rules.tick_ms)
+            flying.draw(screen)
+            left -= 1
+        elapsed += perf_counter() - start
+        flying.done = False
+        scores.append(flying.score)
+    return elapsed / ticks * 1e6, sum(scores) / len(scores)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+    birds = [Bird((50, 100 + 30 * i), cfg) for i in range(BIRDS)]
+
+    print(f"{'pairs':>6} {'spritecollideany':>18} {'PipeGroup.collide':>18}")
+    for pairs in (5, 50, 500):
+        lane = make_lane(cfg, pairs)
+        number = 2000
+        scan = timeit(
+            lambda lane=lane: [pg.sprite.spritecollideany(b, lane) for b in birds],
+            number=number,
+        )
+        ordered = timeit(
+            lambda lane=lane: [lane.collide(b) for b in birds], number=number
+        )
+        for bird in birds:
+            scanned = pg.sprite.spritecollideany(bird, lane)
+            assert (scanned is None) == (lane.collide(bird) is None), "mismatch"
+        print(
+            f"{pairs:>6} {scan / number * 1e6:>15.1f} us"
+            f" {ordered / number * 1e6:>15.1f} us  (per tick, {BIRDS} birds)"
+        )
+
+    ticks = 20_000
+    costs = {False: [], True: []}
+    for _ in range(3):  # ? interleaved, to even out the noise
+        for pixel_perfect, samples in costs.items():
+            samples.append(frame_cost(cfg, screen, ticks, pixel_perfect=pixel_perfect))
+    rect_cost, rect_score = min(costs[False])
+    mask_cost, mask_score = min(costs[True])
+    print(f"rect-only:     {rect_cost:6.1f} us per tick, bot scores {rect_score:.1f}")
+    print(f"pixel-perfect: {mask_cost:6.1f} us per tick, bot scores {mask_score:.1f}")
+    print(f"narrowphase overhead: {(mask_cost / rect_cost - 1) * 100:+.1f}%")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Benchmark the GraphEditor image operations against the per-pixel originals.
+
+Run from anywhere: `python benchmarks/bench_editor.py`.
+"""
+
+import os
+import sys
+from timeit import timeit
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame as pg
+from chilly_bird.graph_editor import GraphEditor
+
+SIZES = [(50, 35), (200, 150), (600, 400)]
+
+
+def ellipsify_per_pixel(image: pg.Surface) -> None:
+    """Run the original `GraphEditor.ellipsify`, calling `set_at` per pixel."""
+    rect = image.get_rect()
+    w, h = rect.w, rect.h
+    mask_surface = pg.Surface((w, h), pg.SRCALPHA)
+    pg.draw.ellipse(mask_surface, (255, 255, 255, 255), rect, 0)
+    ellipse_mask = pg.mask.from_surface(mask_surface)
+    for y in range(h):
+        for x in range(w):
+            if not ellipse_mask.get_at((x, y)):
+                image.set_at((x, y), (0, 0, 0, 0))
+
+
+def checkered_per_tile(size: tuple[int, int], tile_size: int) -> pg.Surface:
+    """Run the original `GraphEditor.create_checkered_background`, tile by tile."""
+    color1 = pg.Color(128, 128, 128)
+    color2 = pg.Color(64, 64, 64)
+    checkered_background = pg.Surface(size)
+    for y in range(0, checkered_background.get_height(), tile_size):
+        for x in range(0, checkered_background.get_width(), tile_size):
+            if (x // tile_size + y // tile_size) % 2 == 0:
+                checkered_background.fill(color1, (x, y, tile_size, tile_size))
+            else:
+                checkered_background.fill(color2, (x, y, tile_size, tile_size))
+    return checkered_background
+
+
+def random_image(size: tuple[int, int], rng: np.random.Generator) -> pg.Surface:
+    """Return a surface with random colors and per-pixel alpha."""
+    image = pg.Surface(size).convert_alpha()
+    pg.surfarray.pixels3d(image)[:] = rng.integers(0, 256, (*size, 3))
+    pg.surfarray.pixels_alpha(image)[:] = rng.integers(0, 256, size)
+    return image
+
+
+def main() -> None:
+    """Run the benchmark."""
+    pg.init()
+    pg.display.set_mode((1, 1))
+    rng = np.random.default_rng(0)
+
+    print(f"{'size':>9} {'ellipsify':>22} {'checkered background':>26}")
+    for size in SIZES:
+        image = random_image(size, rng)
+        before, after = image.copy(), image.copy()
+        ellipsify_per_pixel(before)
+        GraphEditor.ellipsify(after)
+        assert pg.image.tobytes(before, "RGBA") == pg.image.tobytes(after, "RGBA")
+
+        editor = SimpleNamespace(screen=pg.Surface(size))
+        expected = checkered_per_tile(size, 10)
+        actual = GraphEditor.create_checkered_background(editor, 10)  # type: ignore[arg-type]
+        assert pg.image.tobytes(expected, "RGB") == pg.image.tobytes(actual, "RGB")
+
+        slow = timeit(lambda i=image: ellipsify_per_pixel(i.copy()), number=3) / 3
+        fast = timeit(lambda i=image: GraphEditor.ellipsify(i.copy()), number=3) / 3
+        tiles = timeit(lambda s=size: checkered_per_tile(s, 10), number=20) / 20
+        scaled = (
+            timeit(
+                lambda e=editor: GraphEditor.create_checkered_background(e, 10),  # type: ignore[arg-type]
+                number=20,
+            )
+            / 20
+        )
+        print(
+            f"{size[0]:>4}x{size[1]:<4}"
+            f" {slow * 1e3:7.1f} -> {fast * 1e3:5.2f} ms"
+            f" ({slow / fast:4.0f}x)"
+            f" {tiles * 1e3:7.2f} -> {scaled * 1e3:5.2f} ms"
+            f" ({tiles / scaled:4.1f}x)"
+        )
+    print("outputs are identical to the per-pixel originals")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Benchmark the Gym-style environments and the process-pool scaling.
+
+Run from anywhere: `python benchmarks/bench_env.py`.
+"""
+
+import multiprocessing as mp
+import sys
+from time import perf_counter
+
+import numpy as np
+from chilly_bird.sim.env import FlappyEnv, ProcessVectorEnv
+
+
+def policy(obs: np.ndarray) -> np.ndarray:
+    """Jump whenever the bird sinks below the next gap's middle."""
+    obs = np.atleast_2d(obs)
+    gap_middle = (obs[:, 3] + obs[:, 4]) / 2
+    return (obs[:, 0] > gap_middle) & (obs[:, 1] > 0)
+
+
+def single(steps: int = 100_000) -> float:
+    """Return the steps per second of a single in-process environment."""
+    env = FlappyEnv(seed=0)
+    obs = env.reset()
+    start = perf_counter()
+    for _ in range(steps):
+        obs, _, terminated, truncated, _ = env.step(policy(obs)[0])
+        if terminated or truncated:
+            obs = env.reset()
+    return steps / (perf_counter() - start)
+
+
+def vector(k: int, workers: int, steps: int = 2_000) -> float:
+    """Return the environment steps per second of the process-pool env."""
+    with ProcessVectorEnv(k, workers) as envs:
+        obs = envs.reset()
+        start = perf_counter()
+        for _ in range(steps):
+            obs, *_ = envs.step(policy(obs))
+        elapsed = perf_counter() - start
+    return k * steps / elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"single env: {single():>10,.0f} steps per second")
+    cores = mp.cpu_count()
+    workers = 1
+    while workers <= cores:
+        rate = vector(64 * workers, workers)
+        print(f"{workers:>3} workers: {rate:>10,.0f} steps per second")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
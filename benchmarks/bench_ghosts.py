@@ -0,0 +1,107 @@
+"""Benchmark the Flying scene frames racing hundreds of ghosts.
+
+Records the runs of a simple bot with the batch engine, saves them as replays
+and races their ghosts, the best run being played back by the live bird. The
+full frame is timed: the state update and drawing, while the live bird flies.
+The per-frame budget at 60 FPS is 16.7 ms.
+
+Run from anywhere: `python benchmarks/bench_ghosts.py [ghosts]`.
+"""
+
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import numpy as np  # noqa: E402
+import pygame as pg  # noqa: E402
+from chilly_bird.configs import MainConfig, load_config  # noqa: E402
+from chilly_bird.game import Game  # noqa: E402
+from chilly_bird.sim.batch import BatchSimulation  # noqa: E402
+from chilly_bird.sim.ghosts import load_ghosts  # noqa: E402
+from chilly_bird.sim.replay import SUFFIX, ReplayRecorder  # noqa: E402
+from chilly_bird.sim.rules import GameRules  # noqa: E402
+from chilly_bird.states import Flying, GameOver, StartScreen  # noqa: E402
+from loguru import logger  # noqa: E402
+
+FRAMES = 600
+SLIP = 0.002  # ? chance of a random jump per tick, so the runs differ
+
+
+def record_runs(n: int, game_rules: GameRules, path: Path, max_ticks: int) -> None:
+    """Save the `n` runs of a bot jumping below the next gap's middle to `path`."""
+    rng = np.random.default_rng(0)
+    seeds = [random.Random(i).getrandbits(32) for i in range(n)]
+    batch = BatchSimulation(n, game_rules, seeds)
+    recorders = [ReplayRecorder(seed, game_rules) for seed in seeds]
+    bird_h = game_rules.bird_size[1]
+    while batch.alive.any() and batch.ticks < max_ticks:
+        gaps = batch.next_gaps()
+        target = (gaps[1] + gaps[2]) / 2 if gaps else game_rules.screen_height / 2
+        jump = (batch.bird_top + bird_h / 2 > target + 10) & (batch.velocity > 0)
+        jump |= rng.random(n) < SLIP
+        for i in np.flatnonzero(batch.alive).tolist():
+            recorders[i].append(bool(jump[i]))
+        batch.step(jump)
+    for i, recorder in enumerate(recorders):
+        recorder.finish(int(batch.score[i])).save(path / f"{i:04}{SUFFIX}")
+
+
+def frame_cost(cfg: MainConfig, screen: pg.Surface, path: Path) -> tuple[float, float]:
+    """Return the time per Flying frame, in ms, and the average of ghosts drawn."""
+    states = {
+        "Start": StartScreen(cfg, "Flying"),
+        "Flying": Flying(cfg, "GameOver"),
+        "GameOver": GameOver(cfg, "Start"),
+    }
+    game = Game(screen, states, "Start", cfg)
+    pg.mixer.music.stop()
+    flying: Flying = states["Flying"]  # type: ignore[assignment]
+    flying.replay = load_ghosts(path, flying.rules, 1)[0]
+    states["Start"].done = True
+    game.update_state(game.tick_ms)
+
+    frames = drawn = 0
+    start = perf_counter()
+    while game.current_state is flying and frames < FRAMES:
+        game.update_state(game.tick_ms)
+        game.draw(0.5)
+        frames += 1
+        if flying.ghosts is not None:
+            drawn += len(flying.ghosts.drawables(screen.get_rect(), 0.5))
+    return (perf_counter() - start) / frames * 1e3, drawn / frames
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    cfg.main_scene.bg_music = cfg.main_scene.bird_jump_sound  # ? any sound will do
+    cfg.main_scene.pixel_perfect_collision = False
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+
+    with tempfile.TemporaryDirectory() as path:
+        record_runs(n, GameRules.from_config(cfg), Path(path), 2 * FRAMES)
+        no_ghosts, _ = frame_cost(cfg, screen, Path(path))
+        cfg.ghosts.race = True
+        cfg.ghosts.path = Path(path)
+        cfg.ghosts.max_ghosts = n
+        ghosts, drawn = frame_cost(cfg, screen, Path(path))
+    print(
+        f"no ghosts: {no_ghosts:6.2f} ms per frame;"
+        f" {n} ghosts: {ghosts:6.2f} ms per frame, {drawn:.0f} drawn on average"
+        f" ({1e3 / ghosts:.0f} FPS at most)"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
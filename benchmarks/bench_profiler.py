@@ -0,0 +1,81 @@
+"""Benchmark the overhead of the sampling profiler on the Flying scene frames.
+
+Run from anywhere: `python benchmarks/bench_profiler.py [chunks of frames]`.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird.configs import load_config  # noqa: E402
+from chilly_bird.objects.bird import Bird  # noqa: E402
+from chilly_bird.objects.road import Road  # noqa: E402
+from chilly_bird.profiling import profiler  # noqa: E402
+from chilly_bird.states import Flying  # noqa: E402
+from loguru import logger  # noqa: E402
+
+WARMUP_TICKS = 600
+CHUNK_FRAMES = 200
+
+
+def main() -> None:
+    """Run the benchmark."""
+    chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+
+    bird = Bird((50, cfg.window.screen_height / 2), cfg)
+    flying = Flying(cfg, "GameOver")
+    flying.on_enter(
+        {"bird": pg.sprite.GroupSingle(bird), "road": pg.sprite.GroupSingle(Road(cfg))}
+    )
+    flying.input_source = lambda: bird.rect.centery > cfg.window.screen_height / 2
+    flying.handle_collision = lambda: None  # ? invincible
+
+    def frame() -> None:
+        flying.update(flying.rules.tick_ms)
+        flying.draw(screen)
+
+    for _ in range(WARMUP_TICKS):
+        frame()
+    # ? short alternating chunks, so that both modes see the same scenes
+    elapsed = {False: 0.0, True: 0.0}
+    for _ in range(chunks):
+        for enabled in elapsed:
+            if enabled:
+                profiler.start(lambda: "Flying")
+            start = perf_counter()
+            for _ in range(CHUNK_FRAMES):
+                frame()
+            elapsed[enabled] += perf_counter() - start
+            profiler.stop()
+    off, on = (elapsed[enabled] / chunks / CHUNK_FRAMES * 1e6 for enabled in elapsed)
+
+    samples = profiler.total
+    sampling = profiler.sampling_time / samples * 1e6
+    with tempfile.TemporaryDirectory() as tmp:
+        path = profiler.dump(tmp)
+        assert path is not None, "no samples taken"
+        stacks = path.read_text().splitlines()
+    top = max(stacks, key=lambda line: int(line.rsplit(" ", 1)[1]))
+    print(f"profiler off: {off:7.1f} us per frame")
+    print(f"profiler on:  {on:7.1f} us per frame ({(on / off - 1) * 100:+.1f}%)")
+    print(
+        f"{samples} samples every {profiler.interval * 1e3:g} ms,"
+        f" {sampling:.1f} us each ({sampling / profiler.interval / 1e4:.2f}% of time)"
+    )
+    print(f"{len(stacks)} distinct stacks, the hottest: ...{top[-90:]}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark drawing the StartScreen and GameOver scenes over their static layers.
+
+Times the full redraw of a frame, including the state update, with the static
+groups pre-composited and with them blitted one by one, as they used to be.
+
+Run from anywhere: `python benchmarks/bench_static.py [frames]`.
+"""
+
+import os
+import sys
+from pathlib import Path
+from timeit import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird.configs import load_config  # noqa: E402
+from chilly_bird.game import Game  # noqa: E402
+from chilly_bird.states import Flying, GameOver, StartScreen  # noqa: E402
+from loguru import logger  # noqa: E402
+
+SETTLE_TICKS = 120  # ? for the bird to hit the floor and fall down
+
+
+def frame_cost(game: Game, frames: int, *, static: bool) -> tuple[float, int]:
+    """Return the time per frame of the current state, in us, and its blits."""
+    state = game.current_state
+    static_groups = type(state).static_groups if static else frozenset()
+    state.static_groups = static_groups
+    state.invalidate_static()
+
+    def frame() -> None:
+        game.update_state(game.tick_ms)
+        game.draw()
+
+    frame()
+    blits = 1 + sum(
+        len(group) for name, group in state.groups.items() if name not in static_groups
+    )
+    cost = min(timeit(frame, number=frames) for _ in range(5)) / frames * 1e6
+    return cost, blits
+
+
+def main() -> None:
+    """Run the benchmark."""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    cfg.main_scene.bg_music = cfg.main_scene.bird_jump_sound  # ? any sound will do
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+    states = {
+        "Start": StartScreen(cfg, "Flying"),
+        "Flying": Flying(cfg, "GameOver"),
+        "GameOver": GameOver(cfg, "Start"),
+    }
+    game = Game(screen, states, "Start", cfg)
+    pg.mixer.music.stop()
+
+    for name in ("Start", "GameOver"):
+        if name == "GameOver":  # ? by falling down, without ever jumping
+            states["Start"].done = True
+            game.update_state(game.tick_ms)
+            states["Flying"].input_source = lambda: False  # type: ignore[attr-defined]
+            while game.current_state is not states["GameOver"]:
+                game.update_state(game.tick_ms)
+            for _ in range(SETTLE_TICKS):
+                game.update_state(game.tick_ms)
+        per_sprite, sprite_blits = frame_cost(game, frames, static=False)
+        layered, layer_blits = frame_cost(game, frames, static=True)
+        print(
+            f"{type(game.current_state).__name__:<12}"
+            f" sprites: {per_sprite:6.1f} us per frame, {sprite_blits:>2} blits;"
+            f" static layer: {layered:6.1f} us, {layer_blits:>2} blits"
+            f" ({(layered / per_sprite - 1) * 100:+.1f}%)"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
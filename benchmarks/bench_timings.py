@@ -0,0 +1,96 @@
+"""Benchmark the overhead of the per-frame timings on the headless game loop.
+
+Plays the Flying scene with an unlimited frame rate, with the timings off and
+on, and measures the cost of the disabled recording calls alone.
+
+Run from anywhere: `python benchmarks/bench_timings.py [frames]`.
+"""
+
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+from timeit import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird.configs import load_config  # noqa: E402
+from chilly_bird.game import Game  # noqa: E402
+from chilly_bird.instrumentation import timings  # noqa: E402
+from chilly_bird.states import Flying, GameOver, StartScreen  # noqa: E402
+from loguru import logger  # noqa: E402
+
+WARMUP_TICKS = 600
+
+
+def frame_cost(game: Game, frames: int, *, enabled: bool) -> float:
+    """Run the game loop for `frames` frames, returning the time per frame, in us."""
+    timings.reset()
+    timings.enabled = enabled
+    left = frames
+
+    def present() -> None:
+        nonlocal left
+        left -= 1
+        game.running = left > 0
+        pg.display.flip()
+
+    game.present = present  # type: ignore[method-assign]
+    game.running = True
+    start = perf_counter()
+    game.run()
+    return (perf_counter() - start) / frames * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    cfg.window.fps = 0
+    cfg.main_scene.bg_music = cfg.main_scene.bird_jump_sound  # ? any sound will do
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+    states = {
+        "Start": StartScreen(cfg, "Flying"),
+        "Flying": Flying(cfg, "GameOver"),
+        "GameOver": GameOver(cfg, "Start"),
+    }
+    game = Game(screen, states, "Start", cfg)
+    game.states["Start"].done = True
+    game.update_state(game.tick_ms)  # ? straight to the Flying scene
+    flying = game.current_state
+    flying.handle_collision = lambda: None  # type: ignore[attr-defined] # ? invincible
+    for _ in range(WARMUP_TICKS):  # ? until the pipes fill the screen
+        game.update_state(game.tick_ms)
+
+    costs: dict[bool, list[float]] = {False: [], True: []}
+    for _ in range(3):  # ? interleaved, to even out the noise
+        for enabled, samples in costs.items():
+            samples.append(frame_cost(game, frames, enabled=enabled))
+    off, on = min(costs[False]), min(costs[True])
+
+    timings.enabled = False
+    number = 100_000
+    calls = timeit(
+        lambda: (
+            timings.begin_frame("Flying"),
+            *(timings.lap(phase) for phase in ("events", "update", "draw", "present")),
+            timings.end_frame(),
+        ),
+        number=number,
+    )
+    print(f"timings off: {off:7.1f} us per frame")
+    print(f"timings on:  {on:7.1f} us per frame ({(on / off - 1) * 100:+.1f}%)")
+    print(
+        f"disabled recording calls: {calls / number * 1e6:.2f} us per frame"
+        f" ({calls / number * 1e6 / off * 100:.2f}% of the frame)"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
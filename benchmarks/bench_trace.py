@@ -0,0 +1,96 @@
+"""Benchmark the cost of the per-frame trace logs on the Flying scene frames.
+
+The logger is configured as the game does it, without the tracing sink. The
+frames are timed with the trace calls skipped by `trace_enabled`, and with
+them reaching `loguru`, which drops them by their level, as they all did.
+
+Run from anywhere: `python benchmarks/bench_trace.py [chunks of frames]`.
+"""
+
+import os
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird import logging as logs  # noqa: E402
+from chilly_bird.configs import MainConfig, load_config  # noqa: E402
+from chilly_bird.objects.bird import Bird  # noqa: E402
+from chilly_bird.objects.road import Road  # noqa: E402
+from chilly_bird.states import Flying  # noqa: E402
+from loguru import logger  # noqa: E402
+
+WARMUP_TICKS = 600
+CHUNK_FRAMES = 200
+
+
+def flying_scene(cfg: MainConfig, pipe_period: int | None = None) -> Callable[[], None]:
+    """Return a frame of the Flying scene, with an invincible bird, warmed up."""
+    screen = pg.display.get_surface()
+    middle = cfg.window.screen_height / 2
+    bird = Bird((50, middle), cfg)
+    bird.muted = True
+    flying = Flying(cfg, "GameOver")
+    if pipe_period is not None:
+        flying.pipe_period = pipe_period
+    flying.on_enter(
+        {"bird": pg.sprite.GroupSingle(bird), "road": pg.sprite.GroupSingle(Road(cfg))}
+    )
+    flying.input_source = lambda: bird.rect.centery > middle
+    flying.handle_collision = lambda: None  # type: ignore[method-assign] # ? invincible
+
+    def frame() -> None:
+        flying.update(flying.rules.tick_ms)
+        flying.draw(screen)
+
+    for _ in range(WARMUP_TICKS):
+        frame()
+    return frame
+
+
+def frame_costs(frame: Callable[[], None], chunks: int) -> tuple[float, float]:
+    """Return the time per `frame` with the trace calls skipped and not, in us."""
+    # ? short alternating chunks, so that both modes see the same scenes
+    elapsed = {False: 0.0, True: 0.0}
+    for _ in range(chunks):
+        for traced in elapsed:
+            logs.trace_enabled = traced
+            start = perf_counter()
+            for _ in range(CHUNK_FRAMES):
+                frame()
+            elapsed[traced] += perf_counter() - start
+    logs.trace_enabled = False
+    gated, ungated = (
+        elapsed[traced] / chunks / CHUNK_FRAMES * 1e6 for traced in elapsed
+    )
+    return gated, ungated
+
+
+def main() -> None:
+    """Run the benchmark."""
+    chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    pg.init()
+    pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+    with tempfile.TemporaryDirectory() as tmp:
+        logs.configure_logger(logger, logs_path=tmp)
+        assert not logs.trace_enabled, "the TRACE level is logged"
+        for name, pipe_period in (("pipes", None), ("dense pipes", 7)):
+            gated, ungated = frame_costs(flying_scene(cfg, pipe_period), chunks)
+            print(
+                f"{name:<12} trace calls skipped: {gated:7.1f} us per frame,"
+                f" dropped by loguru: {ungated:7.1f} us"
+                f" (saved {ungated - gated:5.1f} us, {1 - gated / ungated:.1%})"
+            )
+        logger.remove()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Benchmark the parallel replay verifier on a backlog of generated replays.
+
+Run from anywhere: `python benchmarks/bench_verify.py [number of replays]`.
+"""
+
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from chilly_bird.sim.batch import BatchSimulation
+from chilly_bird.sim.replay import SUFFIX, ReplayRecorder
+from chilly_bird.sim.verify import verify_replays
+
+
+def bot(batch: BatchSimulation) -> np.ndarray:
+    """Jump whenever the bird sinks below the next gap's middle, per run."""
+    r = batch.rules
+    gaps = batch.next_gaps()
+    target = (gaps[1] + gaps[2]) / 2 if gaps else r.screen_height / 2
+    return (batch.bird_top + r.bird_size[1] / 2 > target + 10) & (batch.velocity > 0)
+
+
+def generate(directory: Path, n: int, tampered: int) -> None:
+    """Write `n` replays of the `bot`, the first `tampered` of them inflated."""
+    batch = BatchSimulation(n, seeds=range(1000, 1000 + n))
+    recorders = [ReplayRecorder(seed, batch.rules) for seed in batch.seeds]
+    while batch.alive.any():
+        alive = batch.alive.copy()
+        jump = bot(batch)
+        for i in np.flatnonzero(alive):
+            recorders[i].append(bool(jump[i]))
+        batch.step(jump)
+    for i, recorder in enumerate(recorders):
+        replay = recorder.finish(int(batch.score[i]))
+        if i < tampered:
+            replay = replace(replay, score=replay.score + 1)
+        replay.save(directory / f"{i:06d}{SUFFIX}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    tampered = 10
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        generate(directory, n, tampered)
+        size = sum(path.stat().st_size for path in directory.iterdir()) / n
+        print(f"{n} replays generated, {size:.0f} bytes on average")
+
+        start = perf_counter()
+        verdicts = list(verify_replays(str(path) for path in directory.iterdir()))
+        elapsed = perf_counter() - start
+
+    rejected = sorted(Path(v.path).stem for v in verdicts if not v.verified)
+    expected = [f"{i:06d}" for i in range(tampered)]
+    assert len(verdicts) == n, f"{len(verdicts)} verdicts for {n} replays"
+    assert rejected == expected, f"rejected {rejected}, expected {expected}"
+    print(f"all {tampered} tampered replays rejected, the rest verified")
+    print(f"{n / elapsed:,.0f} replays per second, 100k in {1e5 / n * elapsed:.0f} s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""Soak the game headlessly, over thousands of StartScreen-Flying-GameOver cycles.
+
+The `Game` is driven one tick per frame by scripted inputs: the buttons are
+pressed with the same events the real buttons post, the bird is flown by a
+bot giving up after a random number of ticks, and the skin editor returns a
+new random skin on some cycles. The RSS, traced memory, surfaces alive and
+sprite groups sizes are sampled over the soak; it fails if the memory grows
+faster than `--max-slope` after the warm-up.
+
+Run from anywhere: `python benchmarks/soak_cycles.py [--cycles N] [--max-slope KIB]`.
+"""
+
+import argparse
+import ctypes
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import numpy as np  # noqa: E402
+import pygame as pg  # noqa: E402
+from chilly_bird import utils  # noqa: E402
+from chilly_bird.configs import load_config  # noqa: E402
+from chilly_bird.game import EventTypes, Game  # noqa: E402
+from chilly_bird.states import Flying, GameOver, StartScreen  # noqa: E402
+from loguru import logger  # noqa: E402
+
+MAX_CYCLE_TICKS = 60 * 60
+"""A cycle stuck for that long fails the soak."""
+
+
+@dataclass
+class Sample:
+    """Process state after some `cycle`."""
+
+    cycle: int
+    rss: int  # ? bytes, 0 where unknown
+    traced: int  # ? bytes allocated by Python, as traced by `tracemalloc`
+    surfaces: int
+    sprites: int  # ? in all the groups of all the states
+
+
+def trim_heap() -> None:
+    """Give the freed heap back to the OS, where the allocator is glibc's."""
+
+
+with suppress(AttributeError, OSError, TypeError):  # ? not glibc, or Windows
+    trim_heap = partial(ctypes.CDLL(None).malloc_trim, 0)  # type: ignore[assignment]
+
+
+def rss() -> int:
+    """Return the resident set size of the process, in bytes (0 if unknown).
+
+    The heap is trimmed first, otherwise the allocator's high-water mark would
+    be mistaken for a leak; the memory of `tracemalloc` itself is excluded.
+    """
+    trim_heap()
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return pages * os.sysconf("SC_PAGE_SIZE") - tracemalloc.get_tracemalloc_memory()
+
+
+def count_surfaces() -> int:
+    """Return the number of surfaces referred to by the Python objects.
+
+    Surfaces, like the containers holding only untracked objects, are not
+    tracked by `gc`, so they are searched for among the referents of the
+    tracked objects and of such containers.
+    """
+    surfaces = set()
+    seen = set()
+    stack = gc.get_objects()
+    while stack:
+        for referent in gc.get_referents(stack.pop()):
+            if type(referent) is pg.Surface:
+                surfaces.add(id(referent))
+            elif not gc.is_tracked(referent) and id(referent) not in seen:
+                seen.add(id(referent))
+                stack.append(referent)
+    return len(surfaces)
+
+
+def slope(samples: list[Sample], field: str) -> float:
+    """Return the least-squares growth of the `field`, in KiB per 1000 cycles."""
+    cycles = np.array([s.cycle for s in samples], dtype=float)
+    values = np.array([getattr(s, field) for s in samples], dtype=float)
+    return float(np.polyfit(cycles, values, 1)[0]) * 1000 / 1024
+
+
+class Driver:
+    """Scripted player, pressing the buttons and flying the bird."""
+
+    def __init__(self, game: Game, rng: random.Random) -> None:
+        """Take control of the `game` inputs."""
+        self.game = game
+        self.rng = rng
+        self.cycles = 0  # ? completed ones
+        self.ticks = 0
+        self.state_ticks = 0
+        self.give_up = 0
+        self.previous: object = None
+        flying = game.states["Flying"]
+        assert isinstance(flying, Flying)
+        self.flying = flying
+
+    def press(self, button: str) -> None:
+        """Post the event of the `button` press, as the `Button` does."""
+        pg.event.post(pg.event.Event(EventTypes.CUSTOM_BUTTON_PRESSED, button=button))
+
+    def jump(self) -> bool:
+        """Jump whenever the bird sinks below the next gap, until giving up."""
+        if self.state_ticks > self.give_up:
+            return False
+        bird = self.flying.groups["bird"].sprites()[0]
+        target = self.flying.rules.screen_height / 2
+        lane = [p for p in self.flying.pipes.lane if p.rect.right >= bird.rect.left]
+        if len(lane) >= 2:  # noqa: PLR2004
+            target = (lane[0].rect.bottom + lane[1].rect.top) / 2
+        return bird.rect.centery > target + 10 and bird.gravity > 0
+
+    def before_tick(self) -> None:
+        """Script the inputs of the current state."""
+        state = self.game.current_state
+        if state is not self.previous:
+            if isinstance(self.previous, GameOver):
+                self.cycles += 1
+            self.previous = state
+            self.state_ticks = 0
+            if isinstance(state, Flying):  # ? it listens to the mouse on enter
+                state.input_source = self.jump
+                self.give_up = self.rng.randint(30, 600)
+        self.state_ticks += 1
+        if self.state_ticks != 10:  # noqa: PLR2004 # ? a moment to look around
+            return
+        if isinstance(state, StartScreen):
+            match self.cycles % 10:
+                case 3:
+                    self.press("reskin")
+                case 7:
+                    self.press("redress")
+            self.press("start")
+        elif isinstance(state, GameOver):
+            self.press("restart")
+
+    def sample(self) -> Sample:
+        """Return the process state after the last completed cycle."""
+        # ? counted first, so that every RSS includes the count's own footprint
+        surfaces = count_surfaces()
+        gc.collect()
+        return Sample(
+            self.cycles,
+            rss(),
+            tracemalloc.get_traced_memory()[0],
+            surfaces,
+            sum(len(g) for s in self.game.states.values() for g in s.groups.values()),
+        )
+
+    def soak(
+        self, cycles: int, warmup: int, sample_every: int
+    ) -> tuple[list[Sample], list[tracemalloc.StatisticDiff]]:
+        """Play `cycles` cycles, one tick per frame, tracing the allocations.
+
+        Returns
+        -------
+            Samples taken once per `sample_every` cycles and the allocations
+            grown since the `warmup` cycles, the largest first.
+
+        """
+        game = self.game
+        tracemalloc.start()
+        samples: list[Sample] = []
+        baseline: tracemalloc.Snapshot | None = None
+        cycle_start = 0
+        print("cycle   RSS MiB  traced KiB  surfaces  sprites")
+        while self.cycles < cycles:
+            cycle = self.cycles
+            self.before_tick()
+            game.handle_events()
+            game.update_state(game.tick_ms)
+            game.draw()
+            game.present()
+            self.ticks += 1
+            if self.cycles == cycle:
+                assert self.ticks - cycle_start < MAX_CYCLE_TICKS, (
+                    f"cycle {cycle} stuck"
+                )
+                continue
+            cycle_start = self.ticks
+            if self.cycles == warmup:
+                baseline = tracemalloc.take_snapshot()
+            if self.cycles % sample_every == 0:
+                samples.append(s := self.sample())
+                print(
+                    f"{s.cycle:>6} {s.rss / 2**20:8.1f} {s.traced / 1024:11.1f}"
+                    f" {s.surfaces:>9} {s.sprites:>8}"
+                )
+        end = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        return samples, end.compare_to(baseline, "lineno") if baseline else []
+
+
+def make_game(rng: random.Random) -> Game:
+    """Create the game of the default config, the skin editor returning random skins."""
+    cfg = load_config("./conf/config.yaml")
+    if not Path(cfg.main_scene.bg_music).exists():  # ? it isn't in the repo
+        cfg.main_scene.bg_music = cfg.main_scene.bird_jump_sound
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+    states = {
+        "Start": StartScreen(cfg, "Flying"),
+        "Flying": Flying(cfg, "GameOver"),
+        "GameOver": GameOver(cfg, "Start"),
+    }
+    game = Game(screen, states, "Start", cfg)
+    pg.mixer.music.stop()
+
+    def new_skin(size: tuple[int, int]) -> pg.Surface:
+        """Return a random skin, as if drawn in the editor."""
+        skin = pg.Surface(size, pg.SRCALPHA)
+        skin.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        return skin
+
+    utils.open_editor = new_skin  # ? the editor's own window can't be scripted
+    return game
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the soak, return 1 if the memory grew too fast."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument(
+        "--warmup", type=int, help="cycles not judged (default: a quarter of them)"
+    )
+    parser.add_argument("--sample-every", type=int, default=50, metavar="CYCLES")
+    parser.add_argument(
+        "--max-slope",
+        type=float,
+        default=256.0,
+        metavar="KIB",
+        help="allowed memory growth per 1000 cycles (default: 256 KiB)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.warmup is None:
+        args.warmup = args.cycles // 4
+
+    logger.remove()
+    os.chdir(ROOT)
+    rng = random.Random(args.seed)
+    driver = Driver(make_game(rng), rng)
+    start = perf_counter()
+    samples, top = driver.soak(args.cycles, args.warmup, args.sample_every)
+    elapsed = perf_counter() - start
+
+    print(f"{args.cycles} cycles, {driver.ticks} ticks in {elapsed:.0f} s")
+    print("sprite groups at the end:")
+    for name, state in driver.game.states.items():
+        sizes = ", ".join(f"{g}={len(group)}" for g, group in state.groups.items())
+        print(f"  {name}: {sizes}")
+    print("top allocators since the warm-up:")
+    for stat in top[:10]:
+        print(f"  {stat}")
+
+    judged = [s for s in samples if s.cycle >= args.warmup]
+    if len(judged) < 3:  # noqa: PLR2004
+        print("too few samples after the warm-up to judge the growth")
+        return 0
+    failed = False
+    for field in ("rss", "traced"):
+        if field == "rss" and not any(s.rss for s in judged):
+            continue
+        growth = slope(judged, field)
+        verdict = "ok"
+        if growth > args.max_slope:
+            verdict, failed = "FAIL", True
+        print(f"{field} growth: {growth:+.1f} KiB per 1000 cycles ({verdict})")
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
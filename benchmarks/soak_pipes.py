@@ -0,0 +1,75 @@
+"""Soak the Flying scene headlessly and measure allocations of steady flight.
+
+The bird is made invincible, so the pipes keep spawning and scrolling away
+for the whole soak. Run from anywhere: `python benchmarks/soak_pipes.py
+[minutes of game time]`.
+"""
+
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+
+import pygame as pg  # noqa: E402
+from chilly_bird.configs import load_config  # noqa: E402
+from chilly_bird.objects.bird import Bird  # noqa: E402
+from chilly_bird.objects.road import Road  # noqa: E402
+from chilly_bird.states import Flying  # noqa: E402
+from loguru import logger  # noqa: E402
+
+WARMUP_TICKS = 600
+
+
+def main() -> None:
+    """Run the soak."""
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = load_config("./conf/config.yaml")
+    pg.init()
+    screen = pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+
+    bird = Bird((50, cfg.window.screen_height / 2), cfg)
+    flying = Flying(cfg, "GameOver")
+    flying.on_enter(
+        {"bird": pg.sprite.GroupSingle(bird), "road": pg.sprite.GroupSingle(Road(cfg))}
+    )
+    flying.input_source = lambda: bird.rect.centery > cfg.window.screen_height / 2
+    flying.handle_collision = lambda: None  # ? invincible
+    pool = flying.pipe_pool
+    ticks = round(minutes * 60 * cfg.window.tick_rate)
+
+    def tick() -> None:
+        flying.update(flying.rules.tick_ms)
+        flying.draw(screen)
+
+    for _ in range(WARMUP_TICKS):
+        tick()
+    allocated = pool.allocated
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = perf_counter()
+    for _ in range(ticks):
+        tick()
+    elapsed = perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "lineno")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    print(f"{ticks} ticks ({minutes:g} min of game time) in {elapsed:.1f} s")
+    print(f"pipes: {pool.acquired} spawned, {pool.allocated} allocated overall")
+    print(f"pipes allocated during the soak: {pool.allocated - allocated}")
+    print(f"memory blocks retained: {blocks} ({size} bytes), top sources:")
+    for stat in stats[:5]:
+        print(f"  {stat}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
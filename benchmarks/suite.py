@@ -0,0 +1,320 @@
+"""Headless benchmark suite, tracking its results in a JSON history.
+
+Every `run` times the cases below and appends their results, along with the
+commit they were measured at, to the history file. `compare` checks a run
+against an earlier one and fails if any case got slower than the threshold.
+
+Run from anywhere:
+    python benchmarks/suite.py run [--only CASE ...] [--label TEXT] [--repeat N]
+    python benchmarks/suite.py compare [--baseline RUN] [--threshold PERCENT]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from timeit import repeat
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parents[1]
+HISTORY = Path(__file__).resolve().parent / "history.json"
+
+import numpy as np  # noqa: E402
+import pygame as pg  # noqa: E402
+from chilly_bird import GameFactory  # noqa: E402
+from chilly_bird.assets import RotationAtlas, registry  # noqa: E402
+from chilly_bird.configs import MainConfig, load_config  # noqa: E402
+from chilly_bird.graph_editor import GraphEditor  # noqa: E402
+from chilly_bird.objects.bird import Bird  # noqa: E402
+from chilly_bird.objects.road import Road  # noqa: E402
+from chilly_bird.objects.textboxes import GlyphTextSprite, TextSprite  # noqa: E402
+from chilly_bird.states import Flying  # noqa: E402
+from loguru import logger  # noqa: E402
+from omegaconf import OmegaConf  # noqa: E402
+
+WARMUP_TICKS = 600
+Case = Callable[[MainConfig], tuple[Callable[[], object], int]]
+"""Sets the case up, returns the timed statement and its runs per measurement."""
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register the decorated function as the `name` case."""
+
+    def register(function: Case) -> Case:
+        CASES[name] = function
+        return function
+
+    return register
+
+
+def bench_config() -> MainConfig:
+    """Return the default config, with any sound for the music if it's missing."""
+    cfg = load_config("./conf/config.yaml")
+    if not Path(cfg.main_scene.bg_music).exists():  # ? it isn't in the repo
+        cfg.main_scene.bg_music = cfg.main_scene.bird_jump_sound
+    return cfg
+
+
+def flying_scene(cfg: MainConfig, pipe_period: int | None = None) -> Callable[[], None]:
+    """Return a frame of the Flying scene, with an invincible bird, warmed up."""
+    screen = pg.display.get_surface()
+    middle = cfg.window.screen_height / 2
+    bird = Bird((50, middle), cfg)
+    bird.muted = True
+    flying = Flying(cfg, "GameOver")
+    if pipe_period is not None:
+        flying.pipe_period = pipe_period
+    flying.on_enter(
+        {"bird": pg.sprite.GroupSingle(bird), "road": pg.sprite.GroupSingle(Road(cfg))}
+    )
+    flying.input_source = lambda: bird.rect.centery > middle
+    flying.handle_collision = lambda: None  # type: ignore[method-assign] # ? invincible
+
+    def frame() -> None:
+        flying.update(flying.rules.tick_ms)
+        flying.draw(screen)
+
+    for _ in range(WARMUP_TICKS):
+        frame()
+    return frame
+
+
+@case("startup")
+def startup(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Construct the whole game with `GameFactory`, from an empty assets registry."""
+    path = Path(tempfile.mkdtemp()) / "config.yaml"
+    OmegaConf.save(cfg, path, resolve=True)
+
+    def start() -> None:
+        registry.clear()
+        GameFactory(str(path))
+        logger.remove()  # ? the factory adds the log files sinks every time
+
+    return start, 1
+
+
+@case("flying_frame")
+def flying_frame(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Update and draw a steady-state frame of the Flying scene."""
+    return flying_scene(cfg), 500
+
+
+@case("dense_pipes_frame")
+def dense_pipes_frame(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Update and draw a frame of the Flying scene, with pipes every 7 ticks."""
+    return flying_scene(cfg, pipe_period=7), 200
+
+
+@case("rotation_atlas")
+def rotation_atlas(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Pre-render the bird's rotated animation frames."""
+    frames = Bird((50, 50), cfg).images
+    return lambda: RotationAtlas(frames, cfg.main_scene.bird_rotation_step), 3
+
+
+@case("bird_update")
+def bird_update(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Update the flying bird, rotating it by its speed."""
+    middle = cfg.window.screen_height / 2
+    bird = Bird((50, middle), cfg)
+    bird.muted = True
+    bird.flying = True
+    bird.jump_input = lambda: bird.rect.centery > middle
+    return bird.update, 10_000
+
+
+@case("text_changed")
+def text_changed(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Update the score text to a new value."""
+    font = pg.font.Font(cfg.fonts.score_font, cfg.fonts.score_font_size)
+    sprite = TextSprite("0", font, cfg.fonts.color, (0, 0))
+    score = iter(range(10**9))
+    return lambda: sprite.update(text=str(next(score))), 2000
+
+
+@case("glyphs_changed")
+def glyphs_changed(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Update the score text to a new value, composed of the cached glyphs."""
+    glyphs = registry.glyphs(
+        cfg.fonts.score_font, cfg.fonts.score_font_size, cfg.fonts.color
+    )
+    sprite = GlyphTextSprite("0", glyphs, (0, 0))
+    score = iter(range(10**9))
+    return lambda: sprite.update(text=str(next(score))), 2000
+
+
+@case("text_unchanged")
+def text_unchanged(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Update the score text to its current value, as the Flying scene does."""
+    font = pg.font.Font(cfg.fonts.score_font, cfg.fonts.score_font_size)
+    sprite = TextSprite("0", font, cfg.fonts.color, (0, 0))
+    sprite.update(text="10")
+    return lambda: sprite.update(text="10"), 2000
+
+
+@case("ellipsify")
+def ellipsify(cfg: MainConfig) -> tuple[Callable[[], object], int]:
+    """Cut the skin image to the ellipse, as the GraphEditor does."""
+    rng = np.random.default_rng(0)
+    image = pg.Surface(cfg.main_scene.bird_size).convert_alpha()
+    pg.surfarray.pixels3d(image)[:] = rng.integers(0, 256, (*image.get_size(), 3))
+    return lambda: GraphEditor.ellipsify(image.copy()), 200
+
+
+def git_commit() -> str:
+    """Return the short hash of the checked out commit, `-dirty` if modified."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "diff", "--quiet", "HEAD", "--", "src"],
+            cwd=ROOT,
+            check=False,
+        ).returncode
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def run(names: list[str], label: str, repeats: int, history: Path) -> int:
+    """Time the `names` cases, best of `repeats`, and append them to the `history`."""
+    logger.remove()
+    os.chdir(ROOT)
+    cfg = bench_config()
+    results = {}
+    for name in names:
+        pg.init()
+        pg.display.set_mode((cfg.window.screen_width, cfg.window.screen_height))
+        statement, number = CASES[name](cfg)
+        times = [
+            t / number * 1e6 for t in repeat(statement, number=number, repeat=repeats)
+        ]
+        results[name] = {
+            "min_us": round(min(times), 3),
+            "median_us": round(statistics.median(times), 3),
+            "number": number,
+            "repeat": repeats,
+        }
+        print(
+            f"{name:<20} {min(times):12.1f} us  (median {statistics.median(times):.1f})"
+        )
+        pg.quit()
+
+    runs = json.loads(history.read_text()) if history.exists() else []
+    runs.append(
+        {
+            "timestamp": f"{datetime.now():%Y-%m-%dT%H:%M:%S}",
+            "commit": git_commit(),
+            "label": label,
+            "python": platform.python_version(),
+            "pygame": pg.version.ver,
+            "machine": platform.machine(),
+            "results": results,
+        }
+    )
+    history.write_text(json.dumps(runs, indent=2) + "\n")
+    print(f"run #{len(runs) - 1} saved to {history}")
+    return 0
+
+
+def find_run(runs: list[dict], ref: str) -> int:
+    """Return the index of the run referred to by its index, commit or label.
+
+    Raises `LookupError` if there's no such run.
+    """
+    try:
+        index = int(ref)
+    except ValueError:
+        matches = [
+            i
+            for i, r in enumerate(runs)
+            if r["commit"].startswith(ref) or r["label"] == ref
+        ]
+        if not matches:
+            raise LookupError(f"No run of commit or label {ref!r}") from None  # noqa: TRY003
+        return matches[-1]  # ? the latest one
+    if not -len(runs) <= index < len(runs):
+        raise LookupError(f"No run #{ref}, there are {len(runs)}")  # noqa: TRY003
+    return index % len(runs)
+
+
+def compare(baseline: str, current: str, threshold: float, history: Path) -> int:
+    """Compare the best times of two runs, return 1 if any case regressed."""
+    runs = json.loads(history.read_text()) if history.exists() else []
+    if len(runs) < 2:  # noqa: PLR2004
+        print(f"{history} needs at least two runs to compare", file=sys.stderr)
+        return 2
+    try:
+        old, new = runs[find_run(runs, baseline)], runs[find_run(runs, current)]
+    except LookupError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    print(f"baseline: {old['commit']} {old['label']} ({old['timestamp']})")
+    print(f"current:  {new['commit']} {new['label']} ({new['timestamp']})")
+    regressed = []
+    for name, result in new["results"].items():
+        if name not in old["results"]:
+            print(f"{name:<20} {'':>12} {result['min_us']:12.1f} us  (new)")
+            continue
+        before, after = old["results"][name]["min_us"], result["min_us"]
+        change = (after / before - 1) * 100
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{name:<20} {before:12.1f} {after:12.1f} us  {change:+7.1f}%{flag}")
+    if regressed:
+        print(f"{len(regressed)} case(s) slower by more than {threshold:g}%")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite's command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=Path, default=HISTORY, help="JSON history")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="time the cases, save the results")
+    run_parser.add_argument(
+        "--only", nargs="+", choices=list(CASES), default=list(CASES), metavar="CASE"
+    )
+    run_parser.add_argument("--label", default="", help="note saved with the run")
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="measurements per case (default: 5)"
+    )
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument(
+        "--baseline", default="-2", help="run index, commit or label (default: -2)"
+    )
+    compare_parser.add_argument(
+        "--current", default="-1", help="run index, commit or label (default: -1)"
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="percent (default: 10)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        return run(args.only, args.label, args.repeat, args.history)
+    return compare(args.baseline, args.current, args.threshold, args.history)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
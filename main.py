@@ -1,5 +1,6 @@
 """Start the game from here."""
 
+import argparse
 import sys
 from os import chdir
 from pathlib import Path
@@ -15,7 +16,33 @@ def main() -> None:
     else:
         print("running in a normal Python process", file=sys.stderr)
 
-    with GameFactory() as game:
+    parser = argparse.ArgumentParser(description="Chilly Bird game")
+    parser.add_argument("--replay", metavar="PATH", help="play back the replay file")
+    parser.add_argument(
+        "--seek",
+        metavar="SECONDS",
+        type=float,
+        default=0.0,
+        help="skip the beginning of the replay",
+    )
+    parser.add_argument(
+        "--ghosts",
+        metavar="DIR",
+        help="race the ghosts of the best replays in the directory",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="sample the game loop stacks into logs/, F4 toggles it in game",
+    )
+    args = parser.parse_args()
+
+    with GameFactory(
+        replay_path=args.replay,
+        seek=args.seek,
+        ghosts_path=args.ghosts,
+        profile=args.profile,
+    ) as game:
         game.run()
 
 
@@ -1,5 +1,17 @@
 """All that is needed to run Chilly Bird game is contained here."""
 
-from .game_factory import GameFactory
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game_factory import GameFactory
 
 __all__ = ["GameFactory"]
+
+
+def __getattr__(name: str) -> object:
+    # ? imported lazily, so the headless `sim` doesn't pull pygame and tkinter in
+    if name == "GameFactory":
+        from .game_factory import GameFactory  # noqa: PLC0415
+
+        return GameFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
@@ -0,0 +1,368 @@
+"""Contains a process-wide registry of shared, pre-converted game assets."""
+
+from __future__ import annotations
+
+import string
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import pygame as pg
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from os import PathLike
+
+    from chilly_bird.types import ColorValue
+
+Conversion = Literal["alpha", "opaque"] | None
+
+
+@dataclass(frozen=True)
+class AssetKey:
+    """Identifies a single surface variant stored in the `AssetRegistry`."""
+
+    path: Path
+    conversion: Conversion = "alpha"
+    flip: tuple[bool, bool] = (False, False)
+    size: tuple[int, int] | None = None
+
+    @property
+    def is_transformed(self) -> bool:
+        """Whether this variant is derived from the plain converted image."""
+        return self.flip != (False, False) or self.size is not None
+
+
+@dataclass
+class AssetStats:
+    """Counters describing the `AssetRegistry` usage."""
+
+    hits: int = 0
+    misses: int = 0
+    surfaces: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        """Return the human-readable stats summary."""
+        return (
+            f"{self.surfaces} surfaces, {self.bytes / 1024:.1f} KiB, "
+            f"{self.hits} hits, {self.misses} misses "
+            f"({self.hit_ratio:.1%} hit ratio)"
+        )
+
+
+class AssetRegistry:
+    """Hands out shared surfaces, keyed by `(path, conversion, transform)`.
+
+    Every image is decoded and converted only once per process, transformed
+    variants (flipped and/or scaled) are derived from the cached base image and
+    cached as well. The returned surfaces are shared, so they must be treated as
+    read-only: copy them before drawing onto them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._surfaces: dict[AssetKey, pg.Surface] = {}
+        self._masks: dict[AssetKey, pg.mask.Mask] = {}
+        self._fonts: dict[tuple[Path, int], pg.font.Font] = {}
+        self._glyphs: dict[tuple[Path, int, tuple[int, ...]], GlyphAtlas] = {}
+        self._rotations: dict[
+            tuple[tuple[Path, ...], tuple[int, int], float, int], RotationAtlas
+        ] = {}
+        self.stats = AssetStats()
+
+    def image(
+        self,
+        path: str | PathLike[str],
+        conversion: Conversion = "alpha",
+        *,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        size: tuple[int, int] | None = None,
+    ) -> pg.Surface:
+        """Return the shared surface for the image at `path`.
+
+        Args:
+        ----
+            path: path to the image file
+            conversion: `"alpha"` for `convert_alpha`, `"opaque"` for `convert`,
+                `None` to keep the pixel format of the file
+            flip_x: whether the image is flipped along the x-axis
+            flip_y: whether the image is flipped along the y-axis
+            size: `(w, h)` to scale the image to, `None` keeps the original size
+
+        Returns:
+        -------
+            The cached surface, loaded and transformed on the first request.
+
+        """
+        key = AssetKey(
+            Path(path),
+            conversion,
+            (flip_x, flip_y),
+            None if size is None else (int(size[0]), int(size[1])),
+        )
+        if (surface := self._surfaces.get(key)) is not None:
+            self.stats.hits += 1
+            return surface
+
+        self.stats.misses += 1
+        surface = self._build(key)
+        self._surfaces[key] = surface
+        self.stats.surfaces += 1
+        self.stats.bytes += surface.get_pitch() * surface.get_height()
+        logger.debug("Asset cached: {}", key)
+        return surface
+
+    def mask(
+        self,
+        path: str | PathLike[str],
+        conversion: Conversion = "alpha",
+        *,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        size: tuple[int, int] | None = None,
+    ) -> pg.mask.Mask:
+        """Return the shared collision mask of the `image` with the same arguments."""
+        key = AssetKey(
+            Path(path),
+            conversion,
+            (flip_x, flip_y),
+            None if size is None else (int(size[0]), int(size[1])),
+        )
+        if (mask := self._masks.get(key)) is None:
+            surface = self.image(
+                path, conversion, flip_x=flip_x, flip_y=flip_y, size=size
+            )
+            mask = self._masks[key] = pg.mask.from_surface(surface)
+        return mask
+
+    def font(self, path: str | PathLike[str], size: int) -> pg.font.Font:
+        """Return the shared font at `path` of the `size`, loaded on the first use."""
+        key = Path(path), int(size)
+        if (font := self._fonts.get(key)) is None:
+            if not self._fonts:  # ? fonts don't outlive `pg.quit`, unlike surfaces
+                pg.register_quit(self._drop_fonts)
+            font = self._fonts[key] = pg.font.Font(*key)
+            logger.debug("Font cached: {}", key)
+        return font
+
+    def glyphs(
+        self, path: str | PathLike[str], size: int, color: ColorValue
+    ) -> GlyphAtlas:
+        """Return the shared `GlyphAtlas` of the `font(path, size)` in the `color`."""
+        key = Path(path), int(size), tuple(pg.Color(color))
+        if (atlas := self._glyphs.get(key)) is None:
+            atlas = self._glyphs[key] = GlyphAtlas(self.font(path, size), color)
+        return atlas
+
+    def rotations(
+        self,
+        paths: Sequence[str | PathLike[str]],
+        size: tuple[int, int],
+        step: float,
+        opacity: int = 255,
+    ) -> RotationAtlas:
+        """Return the shared `RotationAtlas` of the images at `paths`.
+
+        Args:
+        ----
+            paths: paths to the animation frames
+            size: `(w, h)` to scale the frames to
+            step: angle quantization step, in degrees
+            opacity: 0-255, the frames' alpha is multiplied by, once and for all,
+                so the translucent frames are blitted as they are
+
+        """
+        key = (
+            tuple(Path(path) for path in paths),
+            (int(size[0]), int(size[1])),
+            float(step),
+            int(opacity),
+        )
+        if (atlas := self._rotations.get(key)) is None:
+            frames = {path: self.image(path, size=key[1]) for path in key[0]}
+            if opacity < 255:  # noqa: PLR2004
+                for path, frame in frames.items():
+                    faded = frames[path] = frame.copy()
+                    faded.fill(
+                        (255, 255, 255, opacity), special_flags=pg.BLEND_RGBA_MULT
+                    )
+            atlas = self._rotations[key] = RotationAtlas(
+                [frames[path] for path in key[0]], step
+            )
+        return atlas
+
+    def _drop_fonts(self) -> None:
+        self._fonts.clear()
+        self._glyphs.clear()
+
+    def _build(self, key: AssetKey) -> pg.Surface:
+        if key.is_transformed:
+            surface = self.image(key.path, key.conversion)
+            if key.size is not None:
+                surface = pg.transform.scale(surface, key.size)
+            if key.flip != (False, False):
+                surface = pg.transform.flip(surface, *key.flip)
+            return surface
+
+        surface = pg.image.load(key.path)
+        match key.conversion:
+            case "alpha":
+                return surface.convert_alpha()
+            case "opaque":
+                return surface.convert()
+            case _:
+                return surface
+
+    def clear(self) -> None:
+        """Drop all the cached assets, keeping the hit/miss counters."""
+        self._surfaces.clear()
+        self._masks.clear()
+        self._rotations.clear()
+        self._drop_fonts()
+        self.stats.surfaces = 0
+        self.stats.bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached surfaces."""
+        return len(self._surfaces)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether the given `AssetKey` is cached."""
+        return key in self._surfaces
+
+
+registry = AssetRegistry()
+"""The process-wide assets registry."""
+
+
+class RotationAtlas:
+    """Animation frames pre-rotated at every angle quantized to `step` degrees.
+
+    All the `frame x angle` combinations within `[-max_angle, max_angle]` are
+    rendered once on creation, so a lookup never allocates a new surface. Their
+    collision masks are computed on the first request and cached.
+    """
+
+    def __init__(
+        self, frames: Sequence[pg.Surface], step: float, max_angle: float = 90.0
+    ) -> None:
+        """Pre-render the rotated `frames`.
+
+        Args:
+        ----
+            frames: animation frames to rotate
+            step: angle quantization step, in degrees
+            max_angle: the largest rotation angle to pre-render, in degrees
+
+        """
+        if step <= 0:
+            raise ValueError("Rotation `step` must be positive")  # noqa: TRY003
+        self.frames = tuple(frames)
+        self.step = step
+        self.max_index = int(max_angle // step)
+
+        rotated: dict[int, list[pg.Surface]] = {}  # the same frame is rotated once
+        for frame in self.frames:
+            if id(frame) not in rotated:
+                rotated[id(frame)] = [
+                    pg.transform.rotate(frame, index * step)
+                    for index in range(-self.max_index, self.max_index + 1)
+                ]
+        self._surfaces: dict[tuple[int, int], pg.Surface] = {
+            (i, index - self.max_index): surface
+            for i, frame in enumerate(self.frames)
+            for index, surface in enumerate(rotated[id(frame)])
+        }
+        self._masks: dict[tuple[int, int], pg.mask.Mask] = {}
+        logger.debug(
+            "Rotation atlas built: {} frames x {} angles",
+            len(self.frames),
+            2 * self.max_index + 1,
+        )
+
+    def quantize(self, angle: float) -> int:
+        """Return the index of the pre-rendered angle closest to `angle`."""
+        index = round(angle / self.step)
+        return max(-self.max_index, min(index, self.max_index))
+
+    def get(self, frame: int, angle: float) -> pg.Surface:
+        """Return the `frame`-th frame rotated by (about) `angle` degrees."""
+        return self._surfaces[frame, self.quantize(angle)]
+
+    def rotations(self, frame: int) -> tuple[pg.Surface, ...]:
+        """Return the `frame`-th frame at all the angles, by `quantize + max_index`."""
+        return tuple(
+            self._surfaces[frame, index]
+            for index in range(-self.max_index, self.max_index + 1)
+        )
+
+    def mask(self, frame: int, angle: float) -> pg.mask.Mask:
+        """Return the collision mask of the `get(frame, angle)` surface."""
+        key = frame, self.quantize(angle)
+        if (mask := self._masks.get(key)) is None:
+            mask = self._masks[key] = pg.mask.from_surface(self._surfaces[key])
+        return mask
+
+    def __len__(self) -> int:
+        """Return the number of pre-rendered surfaces."""
+        return len(self._surfaces)
+
+
+class GlyphAtlas:
+    """Glyphs of the `font` pre-rendered in the `color`, composed into text by blitting.
+
+    The `chars` are rendered once on creation, any other character on its first
+    use. The glyphs are laid side by side, without kerning, which is what
+    `Font.render` does for the monospaced and pixel fonts, such as the score one.
+    """
+
+    def __init__(
+        self, font: pg.font.Font, color: ColorValue, chars: str = string.digits
+    ) -> None:
+        """Pre-render the `chars` glyphs.
+
+        Args:
+        ----
+            font: font to render the glyphs with
+            color: glyphs color
+            chars: characters to pre-render
+
+        """
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self._glyphs: dict[str, pg.Surface] = {}
+        for char in chars:
+            self.glyph(char)
+        logger.debug("Glyph atlas built: {} glyphs", len(self._glyphs))
+
+    def glyph(self, char: str) -> pg.Surface:
+        """Return the image of the `char`, rendered on the first request."""
+        if (glyph := self._glyphs.get(char)) is None:
+            glyph = self._glyphs[char] = self.font.render(char, True, self.color)  # noqa: FBT003
+        return glyph
+
+    def render(self, text: str) -> pg.Surface:
+        """Return a new image of the `text`, as `Font.render` would render it."""
+        glyphs = [self.glyph(char) for char in text]
+        surface = pg.Surface(
+            (sum(glyph.get_width() for glyph in glyphs), self.height), pg.SRCALPHA
+        )
+        x = 0
+        for glyph in glyphs:  # ? they don't overlap, so their pixels are just copied
+            surface.blit(glyph, (x, 0), special_flags=pg.BLEND_RGBA_MAX)
+            x += glyph.get_width()
+        return surface
+
+    def __len__(self) -> int:
+        """Return the number of rendered glyphs."""
+        return len(self._glyphs)
@@ -23,10 +23,12 @@ class WindowConf:
     """Schema for main window settings config."""
 
     fps: int = 60
+    tick_rate: int = 60
     screen_width: int = 432
     screen_height: int = 468
     caption: str = MISSING
     icon_path: Path = MISSING
+    dirty_rendering: bool = False
 
 
 @dataclass
@@ -47,9 +49,13 @@ class MainSceneAssetsConf:
     bird_aframes: tuple[Path, Path, Path] = MISSING
     bird_jump_sound: Path = MISSING
     bird_size: tuple[int, int] = (50, 35)
+    bird_rotation_step: float = 2.5
+    pixel_perfect_collision: bool = False
     bg_img: Path = MISSING
+    bg_parallax: float = 0.0
     bg_music: Path = MISSING
     road_texture: Path = MISSING
+    road_period: int = 18
     pipe_img: Path = MISSING
     start_button_img: Path = MISSING
     restart_button_img: Path = MISSING
@@ -59,6 +65,53 @@ class MainSceneAssetsConf:
     disappointed_girl_img: Path = MISSING
 
 
+@dataclass
+class ReplaysConf:
+    """Schema for replays recording config."""
+
+    record: bool = False
+    path: Path = Path("./replays/")
+
+
+@dataclass
+class GhostsConf:
+    """Schema for ghost race config."""
+
+    race: bool = False
+    path: Path = Path("./replays/")
+    max_ghosts: int = 500
+    opacity: int = 96
+
+
+@dataclass
+class DiagnosticsConf:
+    """Schema for performance diagnostics config."""
+
+    timings: bool = False
+    timings_overlay: bool = False
+    timings_history: int = 3600
+    timings_export: str = ""
+    profile: bool = False
+    profile_interval_ms: float = 10.0
+    logs_path: Path = Path("./logs/")
+
+
+@dataclass
+class LogsConf:
+    """Schema for the log files config."""
+
+    level: str = "DEBUG"
+    tracing: bool = False
+    background: bool = True
+    queue_size: int = 10_000
+    when_full: str = "drop"
+    flush_interval_ms: float = 500.0
+    rotation_mb: float = 10.0
+    rotation_hours: float = 24.0
+    retention: int = 5
+    compression: bool = True
+
+
 @dataclass
 class MainConfig:
     """Schema for main config."""
@@ -69,6 +122,10 @@ class MainConfig:
     main_scene: MainSceneAssetsConf = field(
         default_factory=lambda: MainSceneAssetsConf()
     )
+    replays: ReplaysConf = field(default_factory=lambda: ReplaysConf())
+    ghosts: GhostsConf = field(default_factory=lambda: GhostsConf())
+    diagnostics: DiagnosticsConf = field(default_factory=lambda: DiagnosticsConf())
+    logs: LogsConf = field(default_factory=lambda: LogsConf())
 
 
 def load_config(path: str) -> MainConfig:
@@ -1,14 +1,18 @@
 """Contains the implementation of the main game loop in the form of FST."""
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 
 import pygame as pg
 import pygame.locals as l
 from loguru import logger
 
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig
-from chilly_bird.states import Flying
+from chilly_bird.instrumentation import EXPORT_FORMATS, timings
+from chilly_bird.profiling import profiler
+from chilly_bird.rendering import DirtyRenderer
 from chilly_bird.states.base import BaseState
+from chilly_bird.types import Coordinate
 
 
 class EventTypes:
@@ -37,17 +41,40 @@ class Game:
         start_state: str,
         cfg: MainConfig,
     ) -> None:
-        """Initialize the Game object."""
+        """Initialize the Game object.
+
+        Raises `ValueError` if the timings export format is not supported.
+        """
 
         self.running = True
         self.screen: pg.Surface = screen
         self.clock = pg.time.Clock()
-        self.fps = 60
+        self.fps = cfg.window.fps
+        self.tick_ms = 1000 / cfg.window.tick_rate
+        self.max_frame_ms = 250  # ? longer frames are slowed down, not caught up
         self.states = states
         self.current_state: BaseState = self.states[start_state]
 
-        self.background: pg.Surface = pg.image.load(cfg.main_scene.bg_img).convert()
-        self.road_img: pg.Surface = pg.image.load(cfg.main_scene.road_texture).convert()
+        self.background: pg.Surface = registry.image(cfg.main_scene.bg_img, "opaque")
+        self.renderer: DirtyRenderer | None = (
+            DirtyRenderer(self.background, self.screen.get_size())
+            if cfg.window.dirty_rendering
+            else None
+        )
+        self.dirty_rects: list[pg.Rect] = []
+
+        diagnostics = cfg.diagnostics
+        if diagnostics.timings_export not in ("", *EXPORT_FORMATS):
+            raise ValueError(  # noqa: TRY003
+                f"Unknown timings export format: {diagnostics.timings_export}"
+            )
+        timings.reset(diagnostics.timings_history)
+        timings.overlay = diagnostics.timings_overlay
+        timings.enabled = diagnostics.timings or diagnostics.timings_overlay
+        self.timings_font = pg.font.Font(None, 18)
+        self.profile = diagnostics.profile
+        profiler.interval = diagnostics.profile_interval_ms / 1000
+        self.logs_path = diagnostics.logs_path
 
         self.music_plays = True
         pg.mixer.music.load(cfg.main_scene.bg_music)
@@ -72,9 +99,22 @@ class Game:
                         # Unmutes the music if right mouse button is pressed
                         self.toggle_music(enable=True)
 
+            case l.KEYDOWN if event.key == l.K_F3:
+                # ? F3 - timings with the overlay, Shift+F3 - only the timings
+                timings.toggle(overlay=not (event.mod & l.KMOD_SHIFT))
+
+            case l.KEYDOWN if event.key == l.K_F4:
+                self.toggle_profiler(enable=not profiler.running)
+
             case EventTypes.TOGGLE_MUSIC:
                 self.toggle_music(enable=not self.music_plays)
 
+            case pg.VIDEOEXPOSE | pg.WINDOWEXPOSED | pg.WINDOWSIZECHANGED:
+                # ? the screen contents can't be trusted anymore
+                if self.renderer is not None:
+                    self.renderer.invalidate()
+                self.current_state.invalidate_static()
+
     def toggle_music(self, *, enable: bool) -> bool:
         """Toggle the global background music.
 
@@ -95,6 +135,21 @@ class Game:
         self.music_plays = False
         return False
 
+    def toggle_profiler(self, *, enable: bool) -> None:
+        """Start or stop the sampling profiler, writing its profile on stop.
+
+        Args:
+        ----
+            enable: whether to start the profiler or to stop it
+
+        """
+        if enable:
+            if not profiler.running:
+                profiler.start(lambda: type(self.current_state).__name__)
+            return
+        profiler.stop()
+        profiler.dump(self.logs_path)
+
     def handle_events(self) -> None:
         """Handle this frames events."""
         for event in pg.event.get():
@@ -116,33 +171,83 @@ class Game:
             logger.debug("Passing groups `{}` to `{}` state", persistent, next_state)
             self.current_state = self.states[next_state]
             self.current_state.on_enter(persistent)
+            if self.renderer is not None:
+                self.renderer.invalidate()
         else:
             logger.critical(
                 "State {} was attempted to flip, while not specifying next state",
                 self.current_state.__class__,
             )
 
-    def update_state(self, dt: int) -> None:
-        """Handle this frames game objects' states updates."""
+    def update_state(self, dt: float) -> None:
+        """Advance the game objects' states by a single simulation tick."""
         if self.current_state.done:
             self.flip_state()
-        self.current_state.update(dt)
+        if not self.current_state.done:  # ? might be finished right on enter
+            self.current_state.update(dt)
 
-    def draw(self) -> None:
-        """Draw the current frame on the `screen`."""
-        self.screen.blit(self.background, (0, 0))
-        self.current_state.draw(self.screen)
+    def overlays(self, alpha: float = 1.0) -> Iterator[tuple[pg.Surface, Coordinate]]:
+        """Yield the images drawn on top of the current state's groups."""
+        if timings.overlay:
+            yield timings.overlay_image(self.timings_font), (4, 4)
 
-        # road scrolling ugly fix 🤦‍♀️🐈🐈‍⬛
-        if isinstance(self.current_state, Flying):
-            self.screen.blit(self.road_img, (self.current_state.road_scroll, 384))
+    def draw(self, alpha: float = 1.0) -> None:
+        """Draw the current frame on the `screen`.
+
+        Args:
+        ----
+            alpha: interpolation factor in between the last two simulation ticks
+
+        """
+        if self.renderer is not None:
+            self.dirty_rects = self.renderer.render(
+                self.screen,
+                self.current_state.groups.values(),
+                list(self.overlays(alpha)),
+                alpha,
+            )
+            return
+
+        self.current_state.draw_background(self.screen, self.background, alpha)
+        self.current_state.draw(self.screen, alpha)
+        for image, pos in self.overlays(alpha):
+            self.screen.blit(image, pos)
+
+    def present(self) -> None:
+        """Show the drawn frame on the display."""
+        if self.renderer is not None:
+            pg.display.update(self.dirty_rects)
+        else:
+            pg.display.flip()
 
     def run(self) -> None:
-        """Run the game loop."""
+        """Run the game loop.
+
+        The game is simulated with a fixed timestep of `tick_ms`, independent of
+        the rendering rate (`fps`); the frames are interpolated in between the
+        simulation ticks. Every phase of the frame is recorded by `timings`.
+        The whole loop is profiled if `profile` is set.
+        """
+        self.toggle_profiler(enable=self.profile)
+        try:
+            self._loop()
+        finally:
+            self.toggle_profiler(enable=False)
+
+    def _loop(self) -> None:
+        """Run the game loop until it's no longer `running`."""
+        accumulator = 0.0
         while self.running:
-            dt: int = self.clock.tick(self.fps)
+            accumulator += min(self.clock.tick(self.fps), self.max_frame_ms)
+            timings.begin_frame(type(self.current_state).__name__)
             self.handle_events()
-            self.update_state(dt)
-            self.draw()
-            # pg.display.update()
-            pg.display.flip()
+            timings.lap("events")
+            while accumulator >= self.tick_ms:
+                self.update_state(self.tick_ms)
+                accumulator -= self.tick_ms
+            timings.lap("update")
+            self.draw(accumulator / self.tick_ms)
+            timings.lap("draw")
+            self.present()
+            timings.lap("present")
+            timings.end_frame()
@@ -2,14 +2,20 @@
 
 import sys
 from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
 from typing import NoReturn
 
 import pygame as pg
 from loguru import logger
 
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig, load_config
 from chilly_bird.game import Game
+from chilly_bird.instrumentation import timings
 from chilly_bird.logging import configure_logger
+from chilly_bird.sim import GameRules
+from chilly_bird.sim.replay import Replay
 from chilly_bird.states import Flying, GameOver, StartScreen
 
 
@@ -25,12 +31,42 @@ class MainScene:
 class GameFactory:
     """Constructs the instance of the `Game` class, supports with-statement."""
 
-    def __init__(self, config_path: str | None = None) -> None:
-        """Initialize the game state, window and logs."""
+    def __init__(
+        self,
+        config_path: str | None = None,
+        replay_path: str | None = None,
+        seek: float = 0.0,
+        ghosts_path: str | None = None,
+        *,
+        profile: bool = False,
+    ) -> None:
+        """Initialize the game state, window and logs.
+
+        Raises `ValueError` if the replay was recorded with other game rules.
+
+        Args:
+        ----
+            config_path: path to the game config, the default one if `None`
+            replay_path: path to the replay to play back instead of the game
+            seek: seconds of the replay to skip
+            ghosts_path: directory of the replays to race the ghosts of
+            profile: whether to profile the whole game loop
+
+        """
 
         # Loading game config
         default_config_path = "./conf/config.yaml"
         self.cfg: MainConfig = load_config(config_path or default_config_path)
+        self.cfg.diagnostics.profile |= profile
+        if ghosts_path is not None:
+            self.cfg.ghosts.race = True
+            self.cfg.ghosts.path = Path(ghosts_path)
+
+        replay = None
+        if replay_path is not None:
+            replay = Replay.load(replay_path)
+            if replay.rules_digest != GameRules.from_config(self.cfg).digest():
+                raise ValueError("Replay was recorded with other game rules")  # noqa: TRY003
 
         # Initializing Pygame window
         pg.init()
@@ -39,7 +75,7 @@ class GameFactory:
             (self.cfg.window.screen_width, self.cfg.window.screen_height)
         )
         pg.display.set_caption(self.cfg.window.caption)
-        pg.display.set_icon(pg.image.load(self.cfg.window.icon_path))
+        pg.display.set_icon(registry.image(self.cfg.window.icon_path, None))
 
         # Creating game states for State Machine
         self.main_scene = MainScene(
@@ -49,7 +85,17 @@ class GameFactory:
         )
 
         # Logger's stuff
-        configure_logger(logger, print_stdout=False)
+        configure_logger(
+            logger,
+            logs_path=self.cfg.diagnostics.logs_path,
+            print_stdout=False,
+            conf=self.cfg.logs,
+        )
+
+        if replay is not None:  # ? straight to the Flying scene
+            self.main_scene.flying.replay = replay
+            self.main_scene.flying.seek_ticks = round(seek * self.cfg.window.tick_rate)
+            self.main_scene.start_screen.done = True
 
         # Creating game core object
         self.game: Game = Game(
@@ -69,5 +115,13 @@ class GameFactory:
 
     def __exit__(self, *exc_details) -> NoReturn:  # noqa: ANN002
         """Shut down the `Game` app."""
+        logger.info("Assets registry: {}", registry.stats)
+        if (fmt := self.cfg.diagnostics.timings_export) and timings.count:
+            path = self.cfg.diagnostics.logs_path
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+                timings.export(path / f"timings_{datetime.now():%Y%m%d-%H%M%S}.{fmt}")
+            except OSError:  # ? the game must still shut down
+                logger.exception("Frame timings could not be exported")
         pg.quit()
         sys.exit()
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+import numpy as np
 import pygame as pg
 from typing_extensions import Self
 
@@ -21,12 +22,12 @@ class GraphEditor:
             max_screen_h: editors screen's height
 
         """
-        self.FPS = 24
         self.circle_color = pg.color.Color("black")
         self.curr_color = pg.color.Color("orangered2")
         self.min_circle_size = 10
         self.selected_rect: pg.Rect | None = None
         self.curr_start: Coordinate = (0, 0)
+        self.overlay_area = pg.Rect(0, 0, 0, 0)  # drawn over the static layer
 
         self.user_image = utils.open_image((max_screen_w, max_screen_h))
         if self.user_image is None:
@@ -36,6 +37,7 @@ class GraphEditor:
         self.previous_screen_mode = pg.display.get_window_size()
         self.screen = pg.display.set_mode((rect.w, rect.h))
         self.background = self.create_checkered_background(10)
+        self.static_layer = self.create_static_layer()
 
     def create_checkered_background(self, tile_size: int = 20) -> pg.Surface:
         """Create a checkered background for the editor.
@@ -53,19 +55,33 @@ class GraphEditor:
         color2 = pg.Color(64, 64, 64)  # Grey color  2
 
         # Create a new surface for the checkered pattern
-        checkered_background = pg.Surface(self.screen.get_size())
-
-        # Draw the checkered pattern
-        for y in range(0, checkered_background.get_height(), tile_size):
-            for x in range(0, checkered_background.get_width(), tile_size):
-                # Choose the color based on the position
-                if (x // tile_size + y // tile_size) % 2 == 0:
-                    checkered_background.fill(color1, (x, y, tile_size, tile_size))
-                else:
-                    checkered_background.fill(color2, (x, y, tile_size, tile_size))
+        w, h = self.screen.get_size()
+        checkered_background = pg.Surface((w, h))
+
+        # Draw the checkered pattern: a pixel per tile, choosing the color based
+        # on the position, then scaled up to the tile size
+        cols, rows = -(-w // tile_size), -(-h // tile_size)
+        tiles = np.arange(cols)[:, np.newaxis] + np.arange(rows)
+        colors = np.array([color1[:3], color2[:3]], dtype=np.uint8)
+        pattern = pg.surfarray.make_surface(colors[tiles % 2])
+        checkered_background.blit(
+            pg.transform.scale(pattern, (cols * tile_size, rows * tile_size)), (0, 0)
+        )
 
         return checkered_background
 
+    def create_static_layer(self) -> pg.Surface:
+        """Composite the background and the user image, they never change.
+
+        Returns
+        -------
+            The screen-sized surface the selections are drawn over.
+
+        """
+        self.draw_background()
+        self.draw_user_image()
+        return self.screen.copy()
+
     def start_selection(self, pos: Coordinate) -> None:
         """Start a new selection at the given position."""
         self.curr_start = pos
@@ -75,7 +91,9 @@ class GraphEditor:
         if pg.math.Vector2(self.curr_start).distance_to(pos) >= self.min_circle_size:
             self.selected_rect = utils.create_rect(self.curr_start, pos)
 
-    def draw_ellipse(self, color: ColorValue, rect: RectValue, width: int = 1) -> None:
+    def draw_ellipse(
+        self, color: ColorValue, rect: RectValue, width: int = 1
+    ) -> pg.Rect:
         """Draw an hollow ellipse on the screen, bounded by the given `rect`.
 
         Args:
@@ -84,18 +102,46 @@ class GraphEditor:
             rect: ellipse's bounding box
             width: width of the ellipse's border, in px
 
+        Returns:
+        -------
+            The screen area changed.
+
         """
-        pg.draw.ellipse(self.screen, color, rect, width=width)
+        return pg.draw.ellipse(self.screen, color, rect, width=width)
 
-    def draw_selection(self) -> None:
-        """Draw the current selection on the screen."""
+    def draw_selection(self) -> pg.Rect | None:
+        """Draw the current selection on the screen, return the area changed."""
         if self.selected_rect:
-            self.draw_ellipse(self.circle_color, self.selected_rect)
+            return self.draw_ellipse(self.circle_color, self.selected_rect)
+        return None
 
-    def draw_current(self, pos: Coordinate) -> None:
+    def draw_current(self, pos: Coordinate) -> pg.Rect:
         """Draw the current selection shape, called when selection changes."""
         rect = utils.create_rect(self.curr_start, pos)
-        self.draw_ellipse(self.curr_color, rect)
+        return self.draw_ellipse(self.curr_color, rect)
+
+    def redraw(self, pos: Coordinate | None, *, full: bool = False) -> pg.Rect:
+        """Restore the static layer under the overlays and draw them anew.
+
+        Args:
+        ----
+            pos: the current selection's corner, `None` if not selecting
+            full: whether to redraw the whole screen, not only the overlays
+
+        Returns:
+        -------
+            The screen area changed.
+
+        """
+        area = self.screen.get_rect() if full else self.overlay_area
+        self.screen.blit(self.static_layer, area, area)
+        drawn = [self.draw_current(pos)] if pos is not None else []
+        if (selection := self.draw_selection()) is not None:
+            drawn.append(selection)
+        self.overlay_area = (
+            drawn[0].unionall(drawn[1:]) if drawn else pg.Rect(0, 0, 0, 0)
+        )
+        return area.union(self.overlay_area)
 
     def draw_user_image(self) -> None:
         """Draw the user-selected image on the screen."""
@@ -129,33 +175,34 @@ class GraphEditor:
         """
         if self.user_image is None:
             return None
-        clock = pg.time.Clock()
         pg.time.wait(300)
         pg.event.clear()
         drawing = False
         pos = (0, 0)
+        pg.display.update(self.redraw(None, full=True))
         while True:
-            for event in pg.event.get():
+            # ? sleeping until anything happens, then handling all the pending events
+            changed = full = False
+            for event in [pg.event.wait(), *pg.event.get()]:
                 if event.type == pg.QUIT:
                     return self.get_image_selected()
                 elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
                     pos = pg.mouse.get_pos()
                     self.start_selection(pos)
-                    drawing = True
+                    drawing = changed = True
                 elif event.type == pg.MOUSEMOTION:
                     if drawing:
                         pos = pg.mouse.get_pos()
+                        changed = True
                 elif event.type == pg.MOUSEBUTTONUP and event.button == 1:
                     self.new_selection(pg.mouse.get_pos())
                     drawing = False
+                    changed = True
+                elif event.type in {pg.VIDEOEXPOSE, pg.WINDOWEXPOSED}:
+                    full = True
 
-            self.draw_background()
-            self.draw_user_image()
-            if drawing:
-                self.draw_current(pos)
-            self.draw_selection()
-            clock.tick(self.FPS)
-            pg.display.update()
+            if changed or full:
+                pg.display.update(self.redraw(pos if drawing else None, full=full))
 
     def __enter__(self) -> Self:
         """Enter the context manager."""
@@ -164,6 +211,7 @@ class GraphEditor:
     def __exit__(self, *exc_details: tuple[Any, ...]) -> None:
         """Exit the context manager, resetting the screen mode (size)."""
         pg.display.set_mode(self.previous_screen_mode)
+        pg.event.post(pg.event.Event(pg.VIDEOEXPOSE))  # ? the screen must be redrawn
 
     @staticmethod
     def ellipsify(image: pg.Surface) -> None:
@@ -173,7 +221,5 @@ class GraphEditor:
         mask_surface = pg.Surface((w, h), pg.SRCALPHA)
         pg.draw.ellipse(mask_surface, (255, 255, 255, 255), rect, 0)
         ellipse_mask = pg.mask.from_surface(mask_surface)
-        for y in range(h):
-            for x in range(w):
-                if not ellipse_mask.get_at((x, y)):
-                    image.set_at((x, y), (0, 0, 0, 0))
+        ellipse_mask.invert()  # ? clearing everything outside the ellipse at once
+        ellipse_mask.to_surface(image, setcolor=(0, 0, 0, 0), unsetcolor=None)
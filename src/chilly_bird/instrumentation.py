@@ -0,0 +1,209 @@
+"""Contains the per-frame timings recorder, its overlay and exporters."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from time import perf_counter_ns
+
+import numpy as np
+import pygame as pg
+from loguru import logger
+
+PHASES = ("events", "update", "draw", "present")
+"""Phases of the game loop frame, in order."""
+PERCENTILES = (50, 95, 99)
+EXPORT_FORMATS = ("csv", "json")
+"""File formats the timings can be exported to."""
+_PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+_NS_PER_MS = 1_000_000
+
+
+class FrameTimings:
+    """Ring buffer of the per-frame timings, measured with `perf_counter_ns`.
+
+    Every frame records its interval from the previous frame start, duration
+    of the game loop phases, the active state and the update and draw time of
+    every sprite group of the state. Only the last `capacity` frames are kept.
+    When not `enabled`, every method returns right away, so the recording
+    calls may stay in the game loop.
+    """
+
+    def __init__(self, capacity: int = 3600) -> None:
+        """Create the disabled recorder.
+
+        Args:
+        ----
+            capacity: number of the last frames to keep
+
+        """
+        self.enabled = False
+        self.overlay = False  # whether to show the percentiles on the screen
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self, capacity: int | None = None) -> None:
+        """Drop all the recorded frames, optionally changing the `capacity`."""
+        self.capacity = n = capacity or self.capacity
+        self.count = 0  # frames recorded so far
+        self.interval_ns = np.zeros(n, dtype=np.int64)
+        self.phase_ns = np.zeros((n, len(PHASES)), dtype=np.int64)
+        self.state = np.zeros(n, dtype=np.int16)
+        self.states: list[str] = []
+        self.groups: dict[tuple[str, str, str], int] = {}  # ? columns of `group_ns`
+        self.group_ns = np.zeros((n, 0), dtype=np.int64)
+        self._frame_start = 0
+        self._lap = 0
+        self._overlay_image: pg.Surface | None = None
+        self._overlay_frame = 0
+
+    def toggle(self, *, overlay: bool) -> None:
+        """Toggle the recording, along with the overlay if `overlay` is set."""
+        if overlay:
+            self.overlay = not self.overlay
+            self.enabled = self.enabled or self.overlay
+        else:
+            self.enabled = not self.enabled
+            self.overlay = self.overlay and self.enabled
+        self._frame_start = 0
+        logger.info("Frame timings: enabled={}, overlay={}", self.enabled, self.overlay)
+
+    def begin_frame(self, state: str) -> None:
+        """Start recording the frame, with `state` being the active one."""
+        if not self.enabled:
+            return
+        now = perf_counter_ns()
+        i = self.count % self.capacity
+        self.interval_ns[i] = now - self._frame_start if self._frame_start else 0
+        self.phase_ns[i] = 0
+        self.group_ns[i] = 0
+        if state not in self.states:
+            self.states.append(state)
+        self.state[i] = self.states.index(state)
+        self._frame_start = self._lap = now
+
+    def lap(self, phase: str) -> None:
+        """Record the `phase` as the one finished right now."""
+        if not self.enabled or not self._frame_start:
+            return
+        now = perf_counter_ns()
+        self.phase_ns[self.count % self.capacity, _PHASE_INDEX[phase]] += (
+            now - self._lap
+        )
+        self._lap = now
+
+    def end_frame(self) -> None:
+        """Finish recording the frame."""
+        if self.enabled and self._frame_start:
+            self.count += 1
+
+    def add_group(self, state: str, group: str, kind: str, ns: int) -> None:
+        """Account `ns` spent on `kind` (update or draw) of the `state`'s `group`."""
+        if not self.enabled or not self._frame_start:
+            return
+        key = state, group, kind
+        if (column := self.groups.get(key)) is None:
+            column = self.groups[key] = self.group_ns.shape[1]
+            self.group_ns = np.pad(self.group_ns, ((0, 0), (0, 1)))
+        self.group_ns[self.count % self.capacity, column] += ns
+
+    def _order(self) -> np.ndarray:
+        """Return the ring buffer indices of the recorded frames, oldest first."""
+        if self.count <= self.capacity:
+            return np.arange(self.count)
+        return np.roll(np.arange(self.capacity), -(self.count % self.capacity))
+
+    def percentiles(self) -> dict[str, list[float]]:
+        """Return the `PERCENTILES` of the frame intervals and the phases, in ms.
+
+        The `work` entry is the time spent in all the phases together, that is,
+        excluding the time the loop slept waiting for the next frame.
+        """
+        order = self._order()
+        if not len(order):
+            return {}
+        intervals = self.interval_ns[order]
+        phases = self.phase_ns[order]
+        series = {
+            "frame": intervals[intervals > 0],
+            "work": phases.sum(axis=1),
+            **{phase: phases[:, i] for i, phase in enumerate(PHASES)},
+        }
+        return {
+            name: (np.percentile(values, PERCENTILES) / _NS_PER_MS).round(3).tolist()
+            for name, values in series.items()
+            if len(values)
+        }
+
+    def overlay_image(self, font: pg.font.Font, every: int = 30) -> pg.Surface:
+        """Return the percentiles table, re-rendered once per `every` frames."""
+        if self._overlay_image is None or self.count - self._overlay_frame >= every:
+            stats = self.percentiles()
+            header = "ms     " + "  ".join(f"p{q:<4}" for q in PERCENTILES)
+            lines = [header] + [
+                f"{name:<7}" + "  ".join(f"{value:5.2f}" for value in values)
+                for name, values in stats.items()
+            ]
+            images = [font.render(line, True, "white") for line in lines]  # noqa: FBT003
+            width = max(image.get_width() for image in images) + 8
+            height = sum(image.get_height() for image in images) + 8
+            surface = pg.Surface((width, height), pg.SRCALPHA)
+            surface.fill((0, 0, 0, 160))
+            y = 4
+            for image in images:
+                surface.blit(image, (4, y))
+                y += image.get_height()
+            self._overlay_image = surface
+            self._overlay_frame = self.count
+        return self._overlay_image
+
+    def rows(self) -> tuple[list[str], list[list[object]]]:
+        """Return the columns and the rows of the recorded frames, oldest first."""
+        columns = [
+            "frame",
+            "state",
+            "interval_ms",
+            *(f"{phase}_ms" for phase in PHASES),
+            *(f"{state}.{group}.{kind}_ms" for state, group, kind in self.groups),
+        ]
+        first = self.count - len(self._order())
+        rows = [
+            [
+                first + n,
+                self.states[self.state[i]],
+                self.interval_ns[i] / _NS_PER_MS,
+                *(self.phase_ns[i] / _NS_PER_MS).tolist(),
+                *(self.group_ns[i] / _NS_PER_MS).tolist(),
+            ]
+            for n, i in enumerate(self._order().tolist())
+        ]
+        return columns, rows
+
+    def export(self, path: str | Path) -> None:
+        """Write the recorded frames to the `.csv` or `.json` file at `path`.
+
+        Raises `ValueError` if the file extension is not supported.
+        """
+        path = Path(path)
+        columns, rows = self.rows()
+        match path.suffix:
+            case ".csv":
+                with path.open("w", newline="") as file:
+                    writer = csv.writer(file)
+                    writer.writerow(columns)
+                    writer.writerows(rows)
+            case ".json":
+                data = {
+                    "percentiles": PERCENTILES,
+                    "summary_ms": self.percentiles(),
+                    "frames": [dict(zip(columns, row, strict=True)) for row in rows],
+                }
+                path.write_text(json.dumps(data))
+            case _:
+                raise ValueError(f"Unsupported timings format: {path.suffix}")  # noqa: TRY003
+        logger.info("Frame timings of {} frames exported to {}", len(rows), path)
+
+
+timings = FrameTimings()
+"""The process-wide frame timings recorder."""
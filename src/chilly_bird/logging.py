@@ -2,24 +2,248 @@
 
 from __future__ import annotations
 
+import gzip
+import queue
+import shutil
 import sys
+import threading
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from time import monotonic
+from typing import TYPE_CHECKING, TextIO
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import loguru
 
+    from chilly_bird.configs import LogsConf
+
+trace_enabled = False
+"""Whether any sink logs the TRACE level; the per-frame code checks it first,
+so that the disabled `logger.trace` calls cost nothing but this check."""
+
+
+class QueuedFileSink:
+    """`loguru` sink handing the messages over to a thread writing them to a file.
+
+    The thread writes the queued messages in batches, once per
+    `flush_interval`, so the logging threads never wait on the disk. When the
+    queue is full, the messages are dropped and counted, unless `block` is
+    set, in which case the logging thread waits for the next batch to make room,
+    though no longer than `block_timeout` seconds and never for a dead writer.
+
+    A failing write or rotation, e.g. on a full disk, is reported to `stderr`
+    once; the file is reopened on the next batch, while the messages that can't
+    be written are discarded, so the queue keeps being drained.
+
+    The file is rotated once it grows over `max_bytes` or gets older than
+    `max_age` seconds; the rotated files are renamed with the time of the
+    rotation, optionally gzipped, and only the last `retention` of them are kept.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | Path,
+        *,
+        queue_size: int = 10_000,
+        block: bool = False,
+        flush_interval: float = 0.5,
+        max_bytes: int = 0,
+        max_age: float = 0.0,
+        retention: int = 5,
+        compression: bool = True,
+    ) -> None:
+        """Open the file and start the writing thread.
+
+        Args:
+        ----
+            path: path to the log file
+            queue_size: number of the messages waiting to be written
+            block: whether to wait instead of dropping the messages on a full queue
+            flush_interval: time in between the batches, in seconds
+            max_bytes: file size to rotate it at, 0 for never
+            max_age: file age to rotate it at, in seconds, 0 for never
+            retention: number of the rotated files to keep
+            compression: whether to gzip the rotated files
+
+        """
+        self.path = Path(path)
+        self.block = block
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.retention = retention
+        self.compression = compression
+        self.block_timeout = max(2 * flush_interval, 1.0)
+        self.dropped = 0  # messages dropped so far, on a full queue
+        self.lost = 0  # messages discarded so far, on the file errors
+        self._failing = False  # whether the last write failed, reported once
+        self._reported = 0  # dropped messages noted in the file so far
+        self._queue: queue.Queue[str] = queue.Queue(queue_size)
+        self._stopping = threading.Event()
+        self._file: TextIO | None
+        self._file, self._opened = self._open()
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Queue the `message`, called by `loguru` in the logging thread."""
+        block = self.block and self._thread.is_alive()
+        try:  # ? without the record
+            self._queue.put(str(message), block=block, timeout=self.block_timeout)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self) -> None:
+        """Write the queued messages and close the file, called by `loguru`."""
+        self._stopping.set()
+        self._thread.join()
+
+    def _open(self) -> tuple[TextIO, float]:
+        """Open the log file for appending, return it with its opening time."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return self.path.open("a", encoding="utf-8"), monotonic()
+
+    def _run(self) -> None:
+        """Write the queued messages in batches, until stopped."""
+        while not self._stopping.wait(self.flush_interval):
+            self._write_batch()
+        self._write_batch()
+        self._close()
 
-def configure_logger(
+    def _write_batch(self) -> None:
+        """Write all the queued messages at once, then rotate the file if due."""
+        batch = []
+        with self._queue.mutex:  # ? taking them all at once, not one lock per message
+            batch.extend(self._queue.queue)
+            self._queue.queue.clear()
+            self._queue.not_full.notify_all()
+        if (dropped := self.dropped) > self._reported:
+            batch.append(
+                f"{datetime.now():%Y-%m-%d %H:%M:%S.%f} | {dropped - self._reported}"
+                " log messages dropped, the queue was full\n"
+            )
+        if not batch:
+            return
+        written = False
+        try:
+            if self._file is None:  # ? it failed, trying again
+                self._file, self._opened = self._open()
+            self._file.write("".join(batch))
+            self._file.flush()
+            written = True
+            self._reported = dropped
+            if (self.max_bytes and self._file.tell() >= self.max_bytes) or (
+                self.max_age and monotonic() - self._opened >= self.max_age
+            ):
+                self._rotate()
+        except (OSError, ValueError) as exc:
+            self.lost += 0 if written else len(batch)
+            self._close()
+            if not self._failing:
+                print(
+                    f"Failed to write the log file {self.path}: {exc}; the messages"
+                    " are discarded until it can be reopened",
+                    file=sys.stderr,
+                )
+            self._failing = True
+        else:
+            self._failing = False
+
+    def _close(self) -> None:
+        """Close the file, if open, ignoring the errors: it's reopened on demand."""
+        file, self._file = self._file, None
+        if file is not None:
+            try:
+                file.close()
+            except (OSError, ValueError):
+                pass
+
+    def _rotate(self) -> None:
+        """Move the file aside, compressing it, and start a new one."""
+        self._close()
+        path = self.path
+        now = datetime.now()
+        rotated = path.rename(
+            path.with_name(f"{path.stem}.{now:%Y%m%d-%H%M%S-%f}{path.suffix}")
+        )
+        if self.compression:
+            with rotated.open("rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+        # ? the timestamps sort chronologically, so the oldest files come first
+        old = sorted(path.parent.glob(f"{path.stem}.*{path.suffix}*"))
+        for stale in old[: max(len(old) - self.retention, 0)]:
+            stale.unlink()
+        self._file, self._opened = self._open()
+
+
+def rotation(max_bytes: int, max_age: float) -> Callable[[str, TextIO], bool]:
+    """Return `loguru`'s rotation condition of the file size or age, 0 for never."""
+    opened = monotonic()
+
+    def due(message: str, file: TextIO) -> bool:
+        nonlocal opened
+        if (max_bytes and file.tell() + len(message) > max_bytes) or (
+            max_age and monotonic() - opened >= max_age
+        ):
+            opened = monotonic()
+            return True
+        return False
+
+    return due
+
+
+def add_file_sink(
+    logger_: loguru.Logger, path: Path, level: str, conf: LogsConf
+) -> None:
+    """Add the log file sink at `path`, writing in the background if configured.
+
+    Raises `ValueError` if the queue full policy is neither "drop" nor "block".
+    """
+    max_bytes = round(conf.rotation_mb * 2**20)
+    max_age = conf.rotation_hours * 3600
+    if not conf.background:
+        logger_.add(
+            path,
+            level=level,
+            rotation=rotation(max_bytes, max_age),
+            retention=conf.retention,
+            compression="gz" if conf.compression else None,
+        )
+        return
+    if conf.when_full not in ("drop", "block"):
+        raise ValueError(f"Unknown full queue policy: {conf.when_full}")  # noqa: TRY003
+    sink = QueuedFileSink(
+        path,
+        queue_size=conf.queue_size,
+        block=conf.when_full == "block",
+        flush_interval=conf.flush_interval_ms / 1000,
+        max_bytes=max_bytes,
+        max_age=max_age,
+        retention=conf.retention,
+        compression=conf.compression,
+    )
+    logger_.add(sink, level=level, colorize=False)
+
+
+def configure_logger(  # noqa: PLR0913
     logger_: loguru.Logger,
     level: str = "DEBUG",
-    logs_path: str = "./logs/",
+    logs_path: str | Path = "./logs/",
     *,
     print_stdout: bool = False,
     tracing: bool = False,
+    conf: LogsConf | None = None,
 ) -> None:
     """Configure `loguru`'s logger with specific level and logs path.
 
+    Also sets `trace_enabled` to whether the sinks added now log the TRACE level,
+    those added before are expected to be removed by the caller.
+
     Args:
     ----
         logger_: `loguru`'s logger instance
@@ -27,11 +251,19 @@ def configure_logger(
         logs_path: path to store logs
         print_stdout: whether to print DEBUG level logs to stdout
         tracing: whether to save tracing logs to file
+        conf: log files config, overriding `level` and `tracing`; synchronous
+            files without rotation are written if `None`
 
     """
+    global trace_enabled  # noqa: PLW0603
     path = Path(logs_path).resolve()
     path.mkdir(parents=True, exist_ok=True)
-    logger_.add(path / "game.log", level=level)
+    if conf is None:
+        logger_.add(path / "game.log", level=level)
+    else:
+        level, tracing = conf.level, conf.tracing
+        add_file_sink(logger_, path / "game.log", level, conf)
+    tracing_sink = logger_.level(level).no <= logger_.level("TRACE").no
 
     try:  # trying to remove the default handler
         logger_.remove(0)
@@ -39,8 +271,13 @@ def configure_logger(
         pass
     else:
         if tracing:  # whether to enable tracing logs
-            tracing_path = path / "runtime_{time}.log"
-            logger_.add(tracing_path, level="TRACE", retention=5)
+            if conf is None:
+                tracing_path = path / "runtime_{time}.log"
+                logger_.add(tracing_path, level="TRACE", retention=5)
+            else:
+                add_file_sink(logger_, path / "runtime.log", "TRACE", conf)
+            tracing_sink = True
 
         if print_stdout:
             logger_.add(sys.stderr, level="DEBUG")
+    trace_enabled = tracing_sink
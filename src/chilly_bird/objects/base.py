@@ -0,0 +1,69 @@
+"""Contains base classes shared by the in-game objects."""
+
+from typing import Any
+
+import pygame as pg
+from typing_extensions import override
+
+from chilly_bird.sim.rules import to_px
+from chilly_bird.types import Coordinate
+
+
+class KinematicSprite(pg.sprite.Sprite):
+    """A sprite that moves with sub-pixel precision.
+
+    The simulation position is kept as floats in `pos`, while `rect` holds its
+    snapped to the pixel grid copy, used for collisions. The position from the
+    previous simulation tick is kept in `prev_pos`, so rendering can interpolate
+    in between the ticks.
+    """
+
+    rect: pg.Rect
+
+    @override
+    def __init__(self, *groups: Any) -> None:
+        super().__init__(*groups)
+        self.pos = pg.Vector2()
+        self.prev_pos = pg.Vector2()
+
+    def place(self, topleft: Coordinate) -> None:
+        """Teleport the sprite, so it won't be interpolated from the old position."""
+        self.pos.update(topleft)
+        self.prev_pos.update(topleft)
+        self.sync_rect()
+
+    def move(self, dx: float, dy: float) -> None:
+        """Move the sprite by `(dx, dy)`."""
+        self.pos.x += dx
+        self.pos.y += dy
+        self.sync_rect()
+
+    def begin_tick(self) -> None:
+        """Remember the current position as the previous tick one."""
+        self.prev_pos.update(self.pos)
+
+    def sync_rect(self) -> None:
+        """Snap the `rect` to the current position."""
+        self.rect.topleft = (to_px(self.pos.x), to_px(self.pos.y))
+
+    def render_rect(self, alpha: float) -> pg.Rect:
+        """Return the `rect` interpolated in between the last two ticks.
+
+        Args:
+        ----
+            alpha: interpolation factor, 0 - previous tick, 1 - current tick
+
+        """
+        x, y = self.render_pos(alpha)
+        return self.rect.move(x - self.rect.x, y - self.rect.y)
+
+    def render_pos(self, alpha: float) -> tuple[int, int]:
+        """Return the top left corner of the `render_rect`, skipping the rect.
+
+        Args:
+        ----
+            alpha: interpolation factor, 0 - previous tick, 1 - current tick
+
+        """
+        pos = self.prev_pos.lerp(self.pos, alpha)
+        return to_px(pos.x), to_px(pos.y)
@@ -1,16 +1,31 @@
 """Contains an implementation of the main player controller."""
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import pygame as pg
 from loguru import logger
 from typing_extensions import override
 
+from chilly_bird import logging as logs
+from chilly_bird.assets import RotationAtlas, registry
 from chilly_bird.configs import MainConfig
+from chilly_bird.objects.base import KinematicSprite
+from chilly_bird.sim import rules
 from chilly_bird.types import Coordinate
 
+TILT = -1.25
+"""Bird's rotation per its vertical speed, in degrees per px/tick."""
+FLAP_TICKS = 6
+"""Ticks each of the bird's flapping animation frames is shown for."""
 
-class Bird(pg.sprite.Sprite):
+
+def mouse_pressed() -> bool:
+    """Check whether the jump (left mouse) button is held down."""
+    return pg.mouse.get_pressed()[0] == 1
+
+
+class Bird(KinematicSprite):
     """Player controller with drawing and game logic."""
 
     @override
@@ -26,24 +41,27 @@ class Bird(pg.sprite.Sprite):
         super().__init__()
         self.initial_pos = initial_pos
         self.scale = cfg.main_scene.bird_size
+        self.rotation_step = cfg.main_scene.bird_rotation_step
+        self._atlas: RotationAtlas | None = None
 
         self.images = [  # ? Creates the bird animation frames:
-            pg.transform.scale(frame, self.scale)
-            for frame in [
-                pg.image.load(frame).convert_alpha()
-                for frame in cfg.main_scene.bird_aframes
-            ]
+            registry.image(frame, size=self.scale)
+            for frame in cfg.main_scene.bird_aframes
         ]
         self.initial_images = self.images[:]  # shallow copy
 
         self.jump_sound = pg.mixer.Sound(cfg.main_scene.bird_jump_sound)
-        self.road_y_pos = 384
+        self.road_y_pos = rules.FLOOR_Y
+        self.jump_input: Callable[[], bool] = mouse_pressed
+        self.muted = False
 
         # region Setting the starting parameters:
         self.i = 0  # Index of the image in the self.images list
+        self.angle = 0.0  # Rotation of the image, in degrees
         self.anim_spd = 0  # Speed at which the animation runs
         self.image = self.images[self.i]
         self.rect = self.image.get_rect(center=initial_pos)
+        self.place(self.rect.topleft)
         self.gravity = 0.0
         self.clicked = False
         self.flying = False
@@ -52,9 +70,37 @@ class Bird(pg.sprite.Sprite):
 
         logger.info(f"{self.__class__} initialized")
 
+    @property
+    def images(self) -> list[pg.Surface]:
+        """Animation frames of the bird."""
+        return self._images
+
+    @images.setter
+    def images(self, frames: Sequence[pg.Surface]) -> None:
+        self._images = list(frames)
+        self._atlas = None  # ? rebuilt lazily on the next rotated frame request
+
+    @property
+    def atlas(self) -> RotationAtlas:
+        """Pre-rotated animation frames, built for the current `images`."""
+        if self._atlas is None:
+            self._atlas = RotationAtlas(self._images, self.rotation_step)
+        return self._atlas
+
+    @property
+    def mask(self) -> pg.mask.Mask:
+        """Collision mask of the current `image`, cached by the `atlas`."""
+        return self.atlas.mask(self.i, self.angle)
+
+    @property
+    def bounds(self) -> pg.Rect:
+        """Area of the current `image`, it outgrows the `rect` when rotated."""
+        return self.image.get_rect(topleft=self.rect.topleft)
+
     def reset(self) -> None:
         """Reset the bird state to the starting one."""
         self.i = 0
+        self.angle = 0.0
         self.anim_spd = 0  # Speed at which the animation runs
         self.image = self.images[self.i]
         self.position(self.initial_pos)
@@ -74,28 +120,33 @@ class Bird(pg.sprite.Sprite):
         if pos is None:
             pos = self.initial_pos
         self.rect = self.image.get_rect(center=pos)
+        self.place(self.rect.topleft)
 
     @override
     def update(self, *args: Any, **kwargs: Any) -> None:
-        logger.trace("Bird updating")
+        if logs.trace_enabled:
+            logger.trace("Bird updating")
+        self.begin_tick()
         if self.flying:
             self.fly()
 
         if self.visible:
             if self.flying:
                 # ? Creating the bird's ability to jump
-                if pg.mouse.get_pressed()[0] == 1 and not self.clicked:
-                    logger.trace("Fly key pressed")
+                pressed = self.jump_input()
+                if pressed and not self.clicked:
+                    if logs.trace_enabled:
+                        logger.trace("Fly key pressed")
                     self.clicked = True
-                    self.gravity = -3.5
-                    self.jump_sound.play()
-                if not pg.mouse.get_pressed()[0] == 1:
+                    self.gravity = rules.JUMP_SPEED
+                    if not self.muted:
+                        self.jump_sound.play()
+                if not pressed:
                     self.clicked = False
 
             # ? Flapping animation
             self.anim_spd += 1
-            anim_spd_limit = 5  # flapping animation speed
-            if self.anim_spd > anim_spd_limit:
+            if self.anim_spd >= FLAP_TICKS:
                 # Otherwise the speed of the wings flapping
                 # would be indefinitely increasing
                 self.anim_spd = 0
@@ -106,22 +157,23 @@ class Bird(pg.sprite.Sprite):
                     # the first iteration of the list
                     self.i = 0
             # Improving the animation of jumping:
-            self.image = pg.transform.rotate(self.images[self.i], self.gravity * -1.25)
+            self.angle = self.gravity * TILT
         else:
             # Animation of the bird falling:
-            self.image = pg.transform.rotate(self.images[self.i], -75)
+            self.angle = -75
             self.gravity = 10
+        self.image = self.atlas.get(self.i, self.angle)
 
     def fly(self) -> None:
         """Process the bird flying movement.
 
         Creates the force that pulls the bird down (essentially gravity).
         """
-        logger.trace("Bird is flying down")
-        self.gravity += 0.17
-        self.gravity = min(self.gravity, 2.6)
+        if logs.trace_enabled:
+            logger.trace("Bird is flying down")
+        self.gravity = rules.fall(self.gravity)
         if self.rect.bottom < self.road_y_pos:
-            self.rect.y += int(self.gravity)
+            self.move(0, rules.displacement(self.gravity))
 
     def redress(self) -> None:
         """Change the current bird skin to the original one."""
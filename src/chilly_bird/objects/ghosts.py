@@ -0,0 +1,79 @@
+"""Contains the ghosts of the recorded runs, raced against in the Flying scene."""
+
+from typing import Any
+
+import numpy as np
+import pygame as pg
+from typing_extensions import override
+
+from chilly_bird.assets import RotationAtlas
+from chilly_bird.objects.bird import FLAP_TICKS, TILT
+from chilly_bird.rendering import BatchedGroup
+from chilly_bird.sim.ghosts import GhostRace
+
+
+class Ghosts(BatchedGroup):
+    """Translucent birds repeating the runs of the `race`, if any.
+
+    The ghosts are drawn straight from the arrays of the `GhostRace`, all of
+    them with the frames of a single, already translucent, `RotationAtlas`:
+    each ghost is rotated by its speed, as the `Bird` is, while they all flap
+    their wings in sync. The dead ghosts disappear.
+    """
+
+    @override
+    def __init__(self, atlas: RotationAtlas) -> None:
+        """Create the group, racing no ghosts yet.
+
+        Args:
+        ----
+            atlas: the ghosts' pre-rotated animation frames
+
+        """
+        super().__init__()
+        self.atlas = atlas
+        self.race: GhostRace | None = None
+        self._frames = [atlas.rotations(i) for i in range(len(atlas.frames))]
+        self._size = (  # ? of the largest rotated frame, to cull the ghosts with
+            max(image.get_width() for images in self._frames for image in images),
+            max(image.get_height() for images in self._frames for image in images),
+        )
+
+    def start(self, race: GhostRace | None) -> None:
+        """Race the ghosts of the `race` from the beginning, none if `None`."""
+        self.race = race
+        if race is not None:
+            race.reset()
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        if self.race is not None:
+            self.race.step()
+
+    @override
+    def drawables(
+        self, clip: pg.Rect, alpha: float = 1.0
+    ) -> list[tuple[pg.Surface, tuple[int, int]]]:
+        race = self.race
+        if race is None:
+            return []
+        batch = race.batch
+        left = batch.bird_left
+        width, height = self._size
+        if left >= clip.right or left + width <= clip.left:
+            return []
+        tops = race.tops(alpha)
+        visible = batch.alive & (tops < clip.bottom) & (tops + height > clip.top)
+        max_index = self.atlas.max_index
+        angles = np.clip(
+            np.round(batch.velocity[visible] * TILT / self.atlas.step),
+            -max_index,
+            max_index,
+        ).astype(np.int64)
+        images = self._frames[race.ticks // FLAP_TICKS % len(self._frames)]
+        return [
+            (images[angle], (left, top))
+            for angle, top in zip(
+                (angles + max_index).tolist(), tops[visible].tolist(), strict=True
+            )
+        ]
@@ -0,0 +1,85 @@
+"""Contains endlessly scrolling scenery layers, such as the road."""
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+import pygame as pg
+from pygame.sprite import AbstractGroup
+from typing_extensions import override
+
+from chilly_bird.objects.base import KinematicSprite
+
+
+class ScrollingLayer(KinematicSprite):
+    """A horizontal strip of scenery, scrolling to the left and wrapping around.
+
+    The `image` is tiled once into a strip covering the `width` of the screen
+    plus one `period` of its pattern, so the layer is always drawn with a single
+    blit: it's moved back by the `period` once it has scrolled that far. Being
+    a sprite, it's drawn by any state and renderer, interpolated in between the
+    ticks.
+
+    The layer scrolls at `scroll_speed * parallax` px/tick: the scene sets the
+    `scroll_speed` of all its layers at once with `set_scroll_speed`, while the
+    more distant layers have the smaller `parallax`.
+    """
+
+    @override
+    def __init__(
+        self,
+        image: pg.Surface,
+        y: int,
+        width: int,
+        parallax: float = 1.0,
+        period: int | None = None,
+    ) -> None:
+        """Tile the `image` into the layer's strip.
+
+        Args:
+        ----
+            image: the layer's texture, tiled horizontally
+            y: vertical position of the layer
+            width: width of the screen to cover
+            parallax: scrolling speed relative to the scene's
+            period: px the texture repeats itself after, its width if `None`
+
+        """
+        super().__init__()
+        self.parallax = parallax
+        self.period = period or image.get_width()
+        self.scroll_speed = 0.0
+        tiles = math.ceil((width + self.period) / image.get_width())
+        if tiles == 1:
+            self.image = image
+        else:
+            self.image = pg.Surface(
+                (image.get_width() * tiles, image.get_height()),
+                image.get_flags() & pg.SRCALPHA,
+                image,
+            )
+            for i in range(tiles):
+                self.image.blit(image, (i * image.get_width(), 0))
+        self.rect = self.image.get_rect(topleft=(0, y))
+        self.reset()
+
+    def reset(self) -> None:
+        """Scroll the layer back to its initial position."""
+        self.place((0, self.rect.y))
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.begin_tick()
+        if not (speed := self.scroll_speed * self.parallax):
+            return
+        self.move(-speed, 0)
+        if self.pos.x <= -self.period:  # ? the strip looks the same from there
+            self.place((self.pos.x + self.period, self.pos.y))
+
+
+def set_scroll_speed(groups: Iterable[AbstractGroup], speed: float) -> None:
+    """Set the `speed` of the scene scrolling to all the layers in the `groups`."""
+    for group in groups:
+        for sprite in group.sprites():
+            if isinstance(sprite, ScrollingLayer):
+                sprite.scroll_speed = speed
@@ -1,16 +1,23 @@
 """Contains implementations of game pipe-like obstacles."""
 
+from collections import deque
+from collections.abc import Callable
 from typing import Any, Literal
 
 import pygame as pg
 from loguru import logger
+from pygame.sprite import AbstractGroup
 from typing_extensions import override
 
+from chilly_bird import logging as logs
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig
+from chilly_bird.objects.base import KinematicSprite
+from chilly_bird.sim import rules
 from chilly_bird.types import Coordinate
 
 
-class Pipe(pg.sprite.Sprite):
+class Pipe(KinematicSprite):
     """The generic pipe, but with a little jiggle."""
 
     @override
@@ -34,40 +41,85 @@ class Pipe(pg.sprite.Sprite):
 
         """
         super().__init__()
+        self.pool: PipePool | None = None
 
-        self.image = pg.image.load(cfg.main_scene.pipe_img).convert_alpha()
+        self.images = {
+            "up": registry.image(cfg.main_scene.pipe_img),
+            "down": registry.image(cfg.main_scene.pipe_img, flip_y=True),
+        }
+        self.masks = {
+            "up": registry.mask(cfg.main_scene.pipe_img),
+            "down": registry.mask(cfg.main_scene.pipe_img, flip_y=True),
+        }
+        self.image = self.images["up"]
+        self.mask = self.masks["up"]
         self.rect = self.image.get_rect()
+        self.reset(pos, direction, pipe_gap, scroll_speed)
 
+    def reset(
+        self,
+        pos: Coordinate,
+        direction: Literal["up", "down"],
+        pipe_gap: int,
+        scroll_speed: int,
+    ) -> None:
+        """Place the pipe anew, e.g. when it's recycled by the `PipePool`.
+
+        Args:
+        ----
+            pos: a position to place the pipe at
+            direction: where pipe will be pointing
+            pipe_gap: a gap between consecutive pipes, in px
+            scroll_speed: of pipe, in px/frame
+
+        """
         self.pipe_gap = pipe_gap
         self.scroll_speed = scroll_speed
 
-        self.counter = 0
-        self.div = 10
-        self.step = 1
+        self.counter = 0  # vertical jiggle counter
 
         x, y = pos
         match direction:
             case "up":
+                self.image = self.images["up"]
+                self.mask = self.masks["up"]
                 # ? +35 pixels in order to create a gap
                 self.rect.topleft = (round(x), round(y + self.pipe_gap / 2))
             case "down":
-                # Flipping not by the x-axis (False), but by the y-axis (True)
-                self.image = pg.transform.flip(self.image, flip_x=False, flip_y=True)
+                self.image = self.images["down"]
+                self.mask = self.masks["down"]
                 # ? -35 pixels in order to create a gap (70 pixels overall)
                 self.rect.bottomleft = (round(x), round(y - self.pipe_gap / 2))
             case _:
                 raise ValueError(  # noqa: TRY003
                     "`direction` must be either 'up' or 'down'"
                 )
+        self.place(self.rect.topleft)
 
         # if location == 1:  # Pipe pointing up
         # if location == -1:  # Pipe pointing down
-        logger.trace("Pipe initialized at ({}, {}), direction={}", x, y, direction)
+        if logs.trace_enabled:
+            logger.trace("Pipe placed at ({}, {}), direction={}", x, y, direction)
+
+    @override
+    def kill(self) -> None:
+        was_alive = self.alive()
+        super().kill()
+        if self.pool is not None and was_alive:
+            self.pool.release(self)
+
+    @override
+    def remove_internal(self, group: AbstractGroup) -> None:
+        super().remove_internal(group)
+        if self.pool is not None and not self.alive():
+            self.pool.release(self)
 
     @override
     def update(self, *args: Any, **kwargs: Any) -> None:
         # Pipes are scrolled here
-        logger.trace("Pipe updating")
+        if logs.trace_enabled:
+            logger.trace("Pipe updating")
+        self.begin_tick()
         # new_scroll_speed = kwargs.get("scroll_speed")
         if (new_scroll_speed := kwargs.get("scroll_speed")) is not None:
             logger.debug(
@@ -80,19 +132,138 @@ class Pipe(pg.sprite.Sprite):
         if self.scroll_speed == 0:
             return
 
-        self.rect.x -= self.scroll_speed  # Forces pipes to constantly move to the left
-
-        if self.counter >= 0:
-            self.rect.y -= self.step
-            if self.counter >= self.div:
-                self.counter -= 2 * self.div
-        else:
-            self.rect.y += self.step
-        self.counter += self.step
+        dy, self.counter = rules.jiggle(self.counter)
+        # Forces pipes to constantly move to the left
+        self.move(-self.scroll_speed, dy)
 
         if self.rect.right < 0:
-            logger.trace("Pipe moved out of screen, killing it")
+            if logs.trace_enabled:
+                logger.trace("Pipe moved out of screen, killing it")
             # As soon as the rightmost point of a pipe disappears
-            # from the screen, it is deleted. Otherwise, disappeared
-            # pipes remain in the game memory
+            # from the screen, it is removed from the groups and
+            # returned to its pool, if any, to be spawned again
             self.kill()
+
+
+class PipePool:
+    """A fixed-capacity pool of `Pipe`s, recycled instead of being re-created.
+
+    Pipes are returned to the pool as soon as they're removed from all of their
+    groups, e.g. killed after leaving the screen or emptied with the group. The
+    pool grows when exhausted, though with the capacity sized after
+    `GameRules.max_pairs` it never does during the regular flight.
+    """
+
+    def __init__(self, capacity: int, cfg: MainConfig) -> None:
+        """Allocate the pipes upfront.
+
+        Args:
+        ----
+            capacity: number of the pipes to allocate
+            cfg: main config object
+
+        """
+        self.cfg = cfg
+        self.free: list[Pipe] = []
+        self.allocated = 0  # ? `Pipe`s ever created
+        self.acquired = 0
+        self.released = 0
+        for _ in range(capacity):
+            self.free.append(self._allocate())
+
+    def _allocate(self) -> Pipe:
+        pipe = Pipe((0, 0), "up", 0, 0, self.cfg)
+        pipe.pool = self
+        self.allocated += 1
+        return pipe
+
+    def acquire(
+        self,
+        pos: Coordinate,
+        direction: Literal["up", "down"],
+        pipe_gap: int,
+        scroll_speed: int,
+    ) -> Pipe:
+        """Return a free pipe, placed as the `Pipe.reset` arguments say."""
+        if self.free:
+            pipe = self.free.pop()
+        else:
+            logger.warning("Pipe pool is exhausted, growing it")
+            pipe = self._allocate()
+        pipe.reset(pos, direction, pipe_gap, scroll_speed)
+        self.acquired += 1
+        return pipe
+
+    def release(self, pipe: Pipe) -> None:
+        """Return the `pipe`, not in any group anymore, to the pool."""
+        self.free.append(pipe)
+        self.released += 1
+
+    def __len__(self) -> int:
+        """Return the number of the free pipes."""
+        return len(self.free)
+
+    @property
+    def in_use(self) -> int:
+        """Number of the pipes acquired and not released yet."""
+        return self.acquired - self.released
+
+
+class PipeGroup(pg.sprite.Group):
+    """A group of `Pipe`s, also kept in a deque ordered by `x`.
+
+    Pipes are spawned at the right edge one pair after another and scroll to
+    the left together, so the order they were added in is their `x` order.
+    Thus the front pipe is read in O(1), and a collision check stops as soon
+    as the pipes are past the sprite's `x` span, no matter how many of them
+    are on the screen.
+    """
+
+    @override
+    def __init__(self, *sprites: Any) -> None:
+        self.lane: deque[Pipe] = deque()
+        super().__init__(*sprites)
+
+    @override
+    def add_internal(self, sprite: Any, layer: None = None) -> None:
+        super().add_internal(sprite, layer)
+        self.lane.append(sprite)
+
+    @override
+    def remove_internal(self, sprite: Any) -> None:
+        super().remove_internal(sprite)
+        if self.lane[0] is sprite:  # ? pipes leave the screen from the front
+            self.lane.popleft()
+        else:
+            self.lane.remove(sprite)
+
+    def front(self) -> Pipe | None:
+        """Return the leftmost pipe, if any."""
+        return self.lane[0] if self.lane else None
+
+    def collide(
+        self,
+        sprite: pg.sprite.Sprite,
+        collided: Callable[[pg.sprite.Sprite, Pipe], bool] | None = None,
+        bounds: pg.Rect | None = None,
+    ) -> Pipe | None:
+        """Return a pipe colliding with the `sprite`, like `spritecollideany`.
+
+        Only the pipes overlapping the `sprite`'s `x` span are checked.
+
+        Args:
+        ----
+            sprite: to check the collision with, must have a `rect`
+            collided: the narrowphase check, run after the rects overlap
+            bounds: the `sprite`'s area for the rects check, its `rect` if `None`
+
+        """
+        rect: pg.Rect = bounds or sprite.rect  # type: ignore[assignment]
+        for pipe in self.lane:
+            if pipe.rect.left >= rect.right:
+                break  # ? the rest are even further to the right
+            if rect.colliderect(pipe.rect) and (
+                collided is None or collided(sprite, pipe)
+            ):
+                return pipe
+        return None
@@ -1,20 +1,23 @@
 """Contains game's floor objects implementations."""
 
-import pygame as pg
 from loguru import logger
 from typing_extensions import override
 
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig
+from chilly_bird.objects.layers import ScrollingLayer
+from chilly_bird.sim import rules
 
 
-class Road(pg.sprite.Sprite):
-    """A road, acting as a game floor, implemented on top of pygame's `Sprite`."""
+class Road(ScrollingLayer):
+    """A road, acting as a game floor, scrolling along with the pipes."""
 
     @override
     def __init__(self, cfg: MainConfig) -> None:
-        super().__init__()
+        super().__init__(
+            registry.image(cfg.main_scene.road_texture, "opaque"),
+            rules.FLOOR_Y,
+            cfg.window.screen_width,
+            period=cfg.main_scene.road_period,
+        )
         logger.info("{} initialized", self.__class__)
-        self.image = pg.image.load(cfg.main_scene.road_texture).convert()
-        self.y_pos = 384
-        self.initial_scroll = 0
-        self.rect = self.image.get_rect(topleft=(0, self.y_pos))
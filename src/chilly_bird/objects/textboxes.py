@@ -5,6 +5,7 @@ from typing import Any
 import pygame as pg
 from typing_extensions import override
 
+from chilly_bird.assets import GlyphAtlas
 from chilly_bird.types import ColorValue, Coordinate
 
 
@@ -34,13 +35,43 @@ class TextSprite(pg.sprite.Sprite):
         self.previous_text: str | None = None
         self.current_text = text
         self.color = color
-        self.image = self.font.render(text, True, self.color)  # noqa: FBT003
+        self.image = self.render(text)
         self.rect = self.image.get_rect(topleft=pos)
 
+    def render(self, text: str) -> pg.Surface:
+        """Return the image of the `text`."""
+        return self.font.render(text, True, self.color)  # noqa: FBT003
+
     @override
     def update(self, *args: Any, **kwargs: Any) -> None:
         new_text: str | None = kwargs.get("text")
-        if new_text is not None and new_text != self.previous_text:
+        if new_text is not None and new_text != self.current_text:
             self.previous_text = self.current_text
             self.current_text = new_text
-            self.image = self.font.render(new_text, True, self.color)  # noqa: FBT003
+            self.image = self.render(new_text)
+
+
+class GlyphTextSprite(TextSprite):
+    """A `TextSprite` composing its text of the glyphs of a `GlyphAtlas`.
+
+    Meant for the frequently changing texts made of a few characters, such as
+    the score, which are never rasterized again once their glyphs are.
+    """
+
+    @override
+    def __init__(self, text: str, glyphs: GlyphAtlas, pos: Coordinate) -> None:
+        """Construct new textbox `Sprite`.
+
+        Args:
+        ----
+            text: text to display
+            glyphs: pre-rendered glyphs of the text's font and color
+            pos: where to draw the text
+
+        """
+        self.glyphs = glyphs
+        super().__init__(text, glyphs.font, glyphs.color, pos)
+
+    @override
+    def render(self, text: str) -> pg.Surface:
+        return self.glyphs.render(text)
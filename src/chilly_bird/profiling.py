@@ -0,0 +1,180 @@
+"""Contains the sampling profiler of the game loop."""
+
+from __future__ import annotations
+
+import signal
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import CodeType, FrameType
+
+SUFFIX = ".folded"
+"""Extension of the written profiles, in the collapsed stacks format."""
+
+
+class StackSampler:
+    """Sampling profiler, capturing the stack of the profiled thread periodically.
+
+    Where `signal.setitimer` is available and the sampler is started from the
+    main thread, the stack is captured by the `SIGPROF` handler once per
+    `interval` of the process CPU time. Otherwise, a background thread
+    captures it once per `interval` of the wall time, but only when the
+    profiled thread releases the GIL, which skews the samples towards the
+    calls releasing it.
+
+    The samples are tagged by the value of the `tag` callable, which becomes
+    the root frame of the stacks, and are written in the collapsed stacks
+    (`folded`) format, understood by `speedscope`, `flamegraph.pl` and the like.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Create the stopped sampler.
+
+        Args:
+        ----
+            interval: time in between the samples, in seconds
+
+        """
+        self.interval = interval
+        self.sampling_time = 0.0  # ? spent by the sampler itself, in seconds
+        # ? stacks are keyed by the tag and the ids of the code objects, leaf first;
+        # ? codes are kept alive until `clear`, so that their ids aren't reused
+        self._samples: Counter[tuple[str | int, ...]] = Counter()
+        self._codes: dict[int, CodeType] = {}
+        self._tag: Callable[[], str] = lambda: "main"
+        self._running = False
+        self._previous_handler: Any = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampler is running."""
+        return self._running
+
+    @property
+    def total(self) -> int:
+        """Number of the samples taken so far."""
+        return self._samples.total()
+
+    def start(self, tag: Callable[[], str] = lambda: "main") -> None:
+        """Start sampling the calling thread, tagging the samples with `tag()`.
+
+        Raises `RuntimeError` if the sampler is already running.
+        """
+        if self._running:
+            raise RuntimeError("Sampler is already running")  # noqa: TRY003
+        self._tag = tag
+        self._running = True
+        if hasattr(signal, "setitimer") and (
+            threading.current_thread() is threading.main_thread()
+        ):
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+            logger.info("Sampling profiler started, every {} s of CPU", self.interval)
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._sample,
+            args=(threading.get_ident(),),
+            name="stack-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Sampling profiler started, every {} s on a thread", self.interval)
+
+    def stop(self) -> None:
+        """Stop sampling, keeping the samples taken so far."""
+        if not self._running:
+            return
+        if self._thread is None:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+        else:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._running = False
+        logger.info(
+            "Sampling profiler stopped, {} samples taken in {:.3f} s",
+            self.total,
+            self.sampling_time,
+        )
+
+    @staticmethod
+    def _name(code: CodeType) -> str:
+        """Return the frame name of the `code`."""
+        qualname = getattr(code, "co_qualname", code.co_name)  # ? Python 3.11+
+        return f"{qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+    def _record(self, frame: FrameType | None) -> None:
+        """Count the sample of the stack ending with the `frame`."""
+        start = perf_counter()
+        codes = self._codes
+        stack: list[str | int] = [self._tag()]
+        while frame is not None:
+            code = frame.f_code
+            if (key := id(code)) not in codes:
+                codes[key] = code
+            stack.append(key)
+            frame = frame.f_back
+        self._samples[tuple(stack)] += 1
+        self.sampling_time += perf_counter() - start
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        """Sample the main thread's stack, interrupted by the `SIGPROF`."""
+        self._record(frame)
+
+    def _sample(self, thread_id: int) -> None:
+        """Sample the stack of the `thread_id` thread until stopped."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:  # ? the profiled thread is gone
+                break
+            self._record(frame)
+
+    def stacks(self) -> Counter[tuple[str, ...]]:
+        """Return the numbers of the samples per stack, named root first."""
+        stacks: Counter[tuple[str, ...]] = Counter()
+        names = {key: self._name(code) for key, code in list(self._codes.items())}
+        for (tag, *keys), n in list(self._samples.items()):
+            stacks[(str(tag), *(names[key] for key in reversed(keys)))] += n
+        return stacks
+
+    def clear(self) -> None:
+        """Drop the samples taken so far."""
+        self._samples.clear()
+        self._codes.clear()
+        self.sampling_time = 0.0
+
+    def dump(self, directory: str | Path) -> Path | None:
+        """Write the samples to a new profile in `directory` and clear them.
+
+        Returns
+        -------
+            Path to the written profile, `None` if there were no samples.
+
+        """
+        if not self._samples:
+            return None
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"profile_{datetime.now():%Y%m%d-%H%M%S-%f}{SUFFIX}"
+        lines = (f"{';'.join(stack)} {n}\n" for stack, n in self.stacks().items())
+        path.write_text("".join(lines))
+        logger.info("Profile of {} samples written to {}", self.total, path)
+        self.clear()
+        return path
+
+
+profiler = StackSampler()
+"""The process-wide sampling profiler."""
@@ -0,0 +1,211 @@
+"""Contains alternative frame renderers used by the game loop."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from chilly_bird.objects.base import KinematicSprite
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from chilly_bird.types import Coordinate
+
+
+def draw_rect(sprite: pg.sprite.Sprite, alpha: float = 1.0) -> pg.Rect:
+    """Return the rect to draw the `sprite` at, interpolated when it moves.
+
+    Args:
+    ----
+        sprite: sprite to be drawn
+        alpha: interpolation factor in between the last two simulation ticks
+
+    """
+    if isinstance(sprite, KinematicSprite):
+        return sprite.render_rect(alpha)
+    return sprite.rect  # type: ignore[return-value]
+
+
+def visible_drawables(
+    sprites: Iterable[pg.sprite.Sprite], clip: pg.Rect, alpha: float = 1.0
+) -> list[tuple[pg.Surface, tuple[int, int]]]:
+    """Return the `(image, topleft)` pairs of the `sprites` overlapping the `clip`.
+
+    The pairs are in the `sprites` order, ready for a single `Surface.blits`.
+
+    Args:
+    ----
+        sprites: sprites to be drawn, in z-order
+        clip: area of the surface to be drawn onto
+        alpha: interpolation factor in between the last two simulation ticks
+
+    """
+    left, top, right, bottom = clip.left, clip.top, clip.right, clip.bottom
+    drawables = []
+    for sprite in sprites:
+        image = sprite.image
+        if isinstance(sprite, KinematicSprite):
+            x, y = sprite.render_pos(alpha)
+        else:
+            x, y = sprite.rect.topleft  # type: ignore[union-attr]
+        w, h = image.get_size()  # ? the image may outgrow the rect, e.g. rotated
+        if x < right and y < bottom and x + w > left and y + h > top:
+            drawables.append((image, (x, y)))
+    return drawables
+
+
+class BatchedGroup(pg.sprite.AbstractGroup, ABC):
+    """A group of many look-alike objects, drawn without being sprites.
+
+    It holds no sprites, its objects are kept in whatever compact form suits
+    them, e.g. arrays, and are turned straight into the `drawables`. They are
+    all repainted every frame by the `DirtyRenderer`.
+    """
+
+    @abstractmethod
+    def drawables(
+        self, clip: pg.Rect, alpha: float = 1.0
+    ) -> list[tuple[pg.Surface, tuple[int, int]]]:
+        """Return the `(image, topleft)` pairs of the objects overlapping the `clip`.
+
+        Args:
+        ----
+            clip: area of the surface to be drawn onto
+            alpha: interpolation factor in between the last two simulation ticks
+
+        """
+        pass
+
+
+def group_drawables(
+    group: pg.sprite.AbstractGroup, clip: pg.Rect, alpha: float = 1.0
+) -> list[tuple[pg.Surface, tuple[int, int]]]:
+    """Return the `(image, topleft)` pairs of the `group` overlapping the `clip`.
+
+    Args:
+    ----
+        group: sprites or a `BatchedGroup` to be drawn
+        clip: area of the surface to be drawn onto
+        alpha: interpolation factor in between the last two simulation ticks
+
+    """
+    if isinstance(group, BatchedGroup):
+        return group.drawables(clip, alpha)
+    return visible_drawables(group.sprites(), clip, alpha)
+
+
+class DirtyRenderer:
+    """Repaints only the screen areas that changed since the previous frame.
+
+    A sprite is considered changed when its `image` was swapped or its `rect`
+    was moved; removed and added sprites are changed as well. Overlays are
+    drawn on top of the sprites and, as the objects of the `BatchedGroup`s, are
+    repainted every frame. The returned rectangles are meant to be passed to
+    `pg.display.update`.
+    """
+
+    def __init__(self, background: pg.Surface, screen_size: Coordinate) -> None:
+        """Create the renderer.
+
+        Args:
+        ----
+            background: image the screen is cleared with, drawn at `(0, 0)`
+            screen_size: size `(w, h)` of the screen to render onto
+
+        """
+        self.background = pg.Surface(screen_size).convert()
+        self.background.blit(background, (0, 0))
+        self._previous: dict[pg.sprite.Sprite, tuple[pg.Surface, pg.Rect]] = {}
+        self._previous_overlays: list[pg.Rect] = []
+        self._full_repaint = True
+
+    def invalidate(self) -> None:
+        """Repaint the whole screen on the next frame."""
+        self._full_repaint = True
+
+    def render(
+        self,
+        surface: pg.Surface,
+        groups: Iterable[pg.sprite.AbstractGroup],
+        overlays: Sequence[tuple[pg.Surface, Coordinate]] = (),
+        alpha: float = 1.0,
+    ) -> list[pg.Rect]:
+        """Repaint the changed areas of the `surface`.
+
+        Args:
+        ----
+            surface: to draw onto
+            groups: sprite groups to draw, in z-order
+            overlays: `(image, topleft)` pairs drawn on top of the groups
+            alpha: interpolation factor in between the last two simulation ticks
+
+        Returns:
+        -------
+            Areas of the `surface` that were repainted.
+
+        """
+        drawables: list[tuple[pg.Surface, pg.Rect]] = []
+        current: dict[pg.sprite.Sprite, tuple[pg.Surface, pg.Rect]] = {}
+        dirty: list[pg.Rect] = []
+        previous = self._previous
+
+        screen_rect = surface.get_rect()
+        overlay_rects = []
+        for group in groups:
+            if isinstance(group, BatchedGroup):  # ? drawn in z-order, like overlays
+                for image, pos in group.drawables(screen_rect, alpha):
+                    rect = image.get_rect(topleft=pos)
+                    drawables.append((image, rect))
+                    overlay_rects.append(rect)
+                continue
+            for sprite in group.sprites():
+                image = sprite.image
+                # ? the image may outgrow the rect, e.g. when rotated
+                rect = image.get_rect(topleft=draw_rect(sprite, alpha).topleft)
+                drawables.append((image, rect))
+                state = previous.pop(sprite, None)
+                if state is None:
+                    dirty.append(rect)
+                elif state[0] is not image or state[1] != rect:
+                    dirty.extend((state[1], rect))  # ? merged if they overlap
+                current[sprite] = (image, rect)
+        dirty.extend(rect for _, rect in previous.values())  # ? removed sprites
+        self._previous = current
+
+        for image, pos in overlays:
+            rect = image.get_rect(topleft=pos)
+            drawables.append((image, rect))
+            overlay_rects.append(rect)
+        dirty.extend(self._previous_overlays)
+        dirty.extend(overlay_rects)
+        self._previous_overlays = overlay_rects
+
+        if self._full_repaint:
+            self._full_repaint = False
+            dirty = [screen_rect]
+        else:
+            dirty = _merge(rect.clip(screen_rect) for rect in dirty)
+
+        for area in dirty:
+            surface.set_clip(area)
+            surface.blit(self.background, area, area)
+            for image, rect in drawables:
+                if rect.colliderect(area):
+                    surface.blit(image, rect)
+        surface.set_clip(None)
+        return dirty
+
+
+def _merge(rects: Iterable[pg.Rect]) -> list[pg.Rect]:
+    """Union the overlapping rectangles, dropping the empty ones."""
+    merged: list[pg.Rect] = []
+    for rect in rects:
+        if not rect.w or not rect.h:
+            continue
+        while (i := rect.collidelist(merged)) != -1:
+            rect.union_ip(merged.pop(i))
+        merged.append(rect)
+    return merged
@@ -0,0 +1,6 @@
+"""Contains the headless, display-free implementation of the game rules."""
+
+from .engine import PipePair, Simulation, SimulationResult
+from .rules import GameRules
+
+__all__ = ["GameRules", "PipePair", "Simulation", "SimulationResult"]
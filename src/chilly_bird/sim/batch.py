@@ -0,0 +1,222 @@
+"""Contains the vectorized engine stepping many independent Flying scene runs."""
+
+from __future__ import annotations
+
+import random
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from chilly_bird.sim import rules
+from chilly_bird.sim.rules import GameRules
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+class _PairSlot:
+    """Pipes pair state shared by all the runs: they spawn and scroll in sync."""
+
+    __slots__ = ("counter", "dy", "serial", "slot", "x")
+
+    def __init__(self, x: int, serial: int, slot: int) -> None:
+        self.x = x
+        self.counter = 0
+        self.dy = 0  # accumulated vertical jiggle
+        self.serial = serial
+        self.slot = slot  # column of the per-run gap arrays
+
+
+class BatchSimulation:
+    """`n` independent Flying scene runs, stepped at once with NumPy.
+
+    Every run follows exactly the rules of the `Simulation` engine and, given
+    the same seed and inputs, yields the same score and the tick of death.
+    Since all the runs start together, the pipes spawn, scroll and jiggle in
+    sync, so only their gaps are stored per run; the birds are stored as arrays
+    of positions, speeds and flags. Dead runs are frozen.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        game_rules: GameRules | None = None,
+        seeds: Sequence[int] | None = None,
+    ) -> None:
+        """Create the runs, ready to be stepped.
+
+        Raises `ValueError` if the rules require pixel-perfect collisions.
+
+        Args:
+        ----
+            n: number of the runs
+            game_rules: gameplay parameters, the defaults if `None`
+            seeds: per-run seeds of the pipes generators, `range(n)` if `None`
+
+        """
+        self.n = n
+        self.rules = game_rules or GameRules()
+        if self.rules.pixel_perfect:
+            raise ValueError("Pixel-perfect collisions need the sprites")  # noqa: TRY003
+        seeds = range(n) if seeds is None else seeds
+        if len(seeds) != n:
+            raise ValueError("A seed is required for each run")  # noqa: TRY003
+        self.seeds = list(seeds)
+
+        self.capacity = self.rules.max_pairs
+        self.gap_bottom = np.zeros((n, self.capacity), dtype=np.int64)
+        self.gap_top = np.zeros((n, self.capacity), dtype=np.int64)
+        self.pairs: deque[_PairSlot] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """Return all the runs to the beginning of the Flying scene."""
+        n = self.n
+        left, top = self.rules.bird_start
+        self.rngs = [random.Random(seed) for seed in self.seeds]
+        self.bird_left = left
+        self.bird_y = np.full(n, float(top))
+        self.bird_top = np.full(n, top, dtype=np.int64)
+        self.velocity = np.zeros(n)
+        self.clicked = np.zeros(n, dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.death_tick = np.full(n, -1, dtype=np.int64)
+        self.ticks = 0
+        self.pairs.clear()
+        self.spawned = 0
+        self.last_spawn: int | None = None
+        self.passed = -1
+
+    def step(self, jump: ArrayLike) -> NDArray[np.bool_]:
+        """Advance all the alive runs by a single tick.
+
+        Args:
+        ----
+            jump: per-run jump input, whether the button is held down
+
+        Returns:
+        -------
+            Mask of the runs that are still going on.
+
+        """
+        r = self.rules
+        alive = self.alive
+        jump = np.asarray(jump, dtype=bool)
+        pipe_w = r.pipe_size[0]
+        bird_h = r.bird_size[1]
+        self.ticks += 1
+
+        # ? Flying.inc_score
+        pairs = self.pairs
+        if pairs:
+            front = pairs[0]
+            if front.serial != self.passed and self.bird_left > front.x + pipe_w:
+                self.passed = front.serial
+                self.score += alive
+
+        # ? Flying.handle_collision
+        top = self.bird_top
+        bottom = top + bird_h
+        dead = (top < 0) | (bottom >= rules.FLOOR_Y) | self._hits_pipe(top, bottom)
+        dead &= alive
+        if dead.any():
+            alive &= ~dead
+            self.death_tick[dead] = self.ticks
+
+        # ? Flying.generate_pipes
+        since_spawn = None if self.last_spawn is None else self.ticks - self.last_spawn
+        if rules.pipes_due(since_spawn, r.pipe_period):
+            self._spawn(alive)
+
+        # ? Pipe.update
+        for pair in pairs:
+            dy, pair.counter = rules.jiggle(pair.counter)
+            pair.x -= r.scroll_speed
+            pair.dy += dy
+        while pairs and pairs[0].x + pipe_w < 0:
+            pairs.popleft()
+
+        # ? Bird.update
+        self.velocity = np.where(
+            alive,
+            np.minimum(self.velocity + rules.GRAVITY, rules.MAX_FALL_SPEED),
+            self.velocity,
+        )
+        self.bird_y = np.where(  # ? rules.displacement
+            alive, self.bird_y + np.trunc(self.velocity), self.bird_y
+        )
+        self.bird_top = np.floor(self.bird_y + 0.5).astype(np.int64)  # ? to_px
+        flap = alive & jump & ~self.clicked
+        self.velocity[flap] = rules.JUMP_SPEED
+        self.clicked = np.where(alive, jump, self.clicked)
+        return alive
+
+    def _hits_pipe(
+        self, top: NDArray[np.int64], bottom: NDArray[np.int64]
+    ) -> NDArray[np.bool_]:
+        pipe_w, pipe_h = self.rules.pipe_size
+        left = self.bird_left
+        right = left + self.rules.bird_size[0]
+        hit = np.zeros(self.n, dtype=bool)
+        for pair in self.pairs:
+            if pair.x >= right:
+                break  # ? the pipes are ordered by x
+            if left < pair.x + pipe_w:
+                gap_bottom = self.gap_bottom[:, pair.slot] + pair.dy
+                gap_top = self.gap_top[:, pair.slot] + pair.dy
+                hit |= (top < gap_bottom) & (bottom > gap_bottom - pipe_h)
+                hit |= (top < gap_top + pipe_h) & (bottom > gap_top)
+        return hit
+
+    def _spawn(self, alive: NDArray[np.bool_]) -> None:
+        r = self.rules
+        if len(self.pairs) >= self.capacity:
+            raise RuntimeError("Too many pipes on the screen")  # noqa: TRY003
+        slot = self.spawned % self.capacity
+        offsets = np.zeros(self.n)
+        spread = r.pipe_spread
+        for i in np.flatnonzero(alive):  # ? in sync with the per-run generators
+            offsets[i] = self.rngs[i].randint(-spread, spread)
+        center = np.round(r.screen_height / 2 + offsets)
+        self.gap_bottom[:, slot] = np.round(center - r.pipe_gap / 2)
+        self.gap_top[:, slot] = np.round(center + r.pipe_gap / 2)
+        self.pairs.append(_PairSlot(r.screen_width, self.spawned, slot))
+        self.spawned += 1
+        self.last_spawn = self.ticks
+
+    def run(
+        self,
+        policy: Callable[[BatchSimulation], ArrayLike],
+        max_ticks: int | None = None,
+    ) -> NDArray[np.int64]:
+        """Step the runs until all of them are over.
+
+        Args:
+        ----
+            policy: returns the per-run jump input for the current tick
+            max_ticks: stop after that many ticks, even if some birds are alive
+
+        Returns:
+        -------
+            Per-run scores.
+
+        """
+        while self.alive.any() and (max_ticks is None or self.ticks < max_ticks):
+            self.step(policy(self))
+        return self.score
+
+    def next_gaps(self) -> tuple[int, NDArray[np.int64], NDArray[np.int64]] | None:
+        """Return `x` and per-run gap bounds of the closest pipes not passed yet."""
+        pipe_w = self.rules.pipe_size[0]
+        for pair in self.pairs:
+            if pair.x + pipe_w >= self.bird_left:
+                return (
+                    pair.x,
+                    self.gap_bottom[:, pair.slot] + pair.dy,
+                    self.gap_top[:, pair.slot] + pair.dy,
+                )
+        return None
@@ -0,0 +1,206 @@
+"""Contains the headless engine running the Flying scene rules without pygame."""
+
+from __future__ import annotations
+
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from chilly_bird.sim import rules
+from chilly_bird.sim.rules import GameRules, to_px
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class PipePair:
+    """A pair of pipes, sharing `x` and the jiggle, with a gap in between."""
+
+    __slots__ = ("bottom", "counter", "serial", "top", "x")
+
+    def __init__(self, x: int, center_y: int, gap: int, serial: int) -> None:
+        """Create a pair, its gap centered around `center_y`.
+
+        Args:
+        ----
+            x: pipes' left side
+            center_y: the gap center
+            gap: the gap height
+            serial: the pair's sequential number, starts at 0
+
+        """
+        self.x = x
+        self.bottom = round(center_y - gap / 2)  # of the upper (down-facing) pipe
+        self.top = round(center_y + gap / 2)  # of the lower (up-facing) pipe
+        self.counter = 0
+        self.serial = serial
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Outcome of a simulated run."""
+
+    score: int
+    ticks: int
+    game_over: bool
+
+
+class Simulation:
+    """A single Flying scene run, simulated tick by tick.
+
+    The rules, the order of the updates and the collision checks are exactly
+    those of the `Flying` state with its `Bird` and `Pipe` sprites, though no
+    display, assets or wall clock is involved: the jump input is passed to
+    `step` and the time advances by one tick per call.
+    """
+
+    def __init__(
+        self, game_rules: GameRules | None = None, rng: random.Random | None = None
+    ) -> None:
+        """Create the simulation, ready to be stepped.
+
+        Raises `ValueError` if the rules require pixel-perfect collisions.
+
+        Args:
+        ----
+            game_rules: gameplay parameters, the defaults if `None`
+            rng: random generator to spawn the pipes with
+
+        """
+        self.rules = game_rules or GameRules()
+        if self.rules.pixel_perfect:
+            raise ValueError("Pixel-perfect collisions need the sprites")  # noqa: TRY003
+        self.rng = rng or random.Random()
+        self.pipes: deque[PipePair] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """Return to the state at the beginning of the Flying scene."""
+        left, top = self.rules.bird_start
+        self.bird_left = left
+        self.bird_y = float(top)
+        self.bird_top = top
+        self.velocity = 0.0
+        self.clicked = False
+        self.score = 0
+        self.ticks = 0
+        self.game_over = False
+        self.pipes.clear()
+        self.spawned = 0
+        self.last_spawn: int | None = None
+        self.passed = -1  # serial of the last scored pair
+
+    def step(self, jump: bool) -> bool:  # noqa: FBT001
+        """Advance the simulation by a single tick.
+
+        Args:
+        ----
+            jump: whether the jump button is held down during this tick
+
+        Returns:
+        -------
+            Whether the game is still going on.
+
+        """
+        if self.game_over:
+            return False
+        game_rules = self.rules
+        pipe_w = game_rules.pipe_size[0]
+        bird_h = game_rules.bird_size[1]
+        self.ticks += 1
+
+        # ? Flying.inc_score
+        pipes = self.pipes
+        if pipes:
+            front = pipes[0]
+            if front.serial != self.passed and self.bird_left > front.x + pipe_w:
+                self.passed = front.serial
+                self.score += 1
+
+        # ? Flying.handle_collision
+        bottom = self.bird_top + bird_h
+        if self.bird_top < 0 or bottom >= rules.FLOOR_Y or self.hits_pipe():
+            self.game_over = True
+            return False
+
+        # ? Flying.generate_pipes
+        since_spawn = None if self.last_spawn is None else self.ticks - self.last_spawn
+        if rules.pipes_due(since_spawn, game_rules.pipe_period):
+            spread = game_rules.pipe_spread
+            center_y = round(
+                game_rules.screen_height / 2 + self.rng.randint(-spread, spread)
+            )
+            pipes.append(
+                PipePair(
+                    game_rules.screen_width, center_y, game_rules.pipe_gap, self.spawned
+                )
+            )
+            self.spawned += 1
+            self.last_spawn = self.ticks
+
+        # ? Pipe.update
+        for pair in pipes:
+            dy, pair.counter = rules.jiggle(pair.counter)
+            pair.x -= game_rules.scroll_speed
+            pair.top += dy
+            pair.bottom += dy
+        while pipes and pipes[0].x + pipe_w < 0:
+            pipes.popleft()
+
+        # ? Bird.update
+        self.velocity = rules.fall(self.velocity)
+        if bottom < rules.FLOOR_Y:
+            self.bird_y += rules.displacement(self.velocity)
+            self.bird_top = to_px(self.bird_y)
+        if jump and not self.clicked:
+            self.clicked = True
+            self.velocity = rules.JUMP_SPEED
+        if not jump:
+            self.clicked = False
+        return True
+
+    def run(
+        self, inputs: Iterable[bool], max_ticks: int | None = None
+    ) -> SimulationResult:
+        """Step the simulation with `inputs` until the game is over.
+
+        Args:
+        ----
+            inputs: jump input per tick, released if exhausted
+            max_ticks: stop after that many ticks, even if the bird's alive
+
+        Returns:
+        -------
+            The score and the duration of the run.
+
+        """
+        inputs = iter(inputs)
+        while not self.game_over and (max_ticks is None or self.ticks < max_ticks):
+            self.step(next(inputs, False))
+        return SimulationResult(self.score, self.ticks, self.game_over)
+
+    def hits_pipe(self) -> bool:
+        """Check whether the bird's rect overlaps any pipe's one."""
+        pipe_w, pipe_h = self.rules.pipe_size
+        bird_w, bird_h = self.rules.bird_size
+        left, top = self.bird_left, self.bird_top
+        right, bottom = left + bird_w, top + bird_h
+        for pair in self.pipes:
+            if pair.x >= right:
+                break  # ? the pipes are ordered by x
+            if left < pair.x + pipe_w and (
+                (top < pair.bottom and bottom > pair.bottom - pipe_h)  # ? down pipe
+                or (top < pair.top + pipe_h and bottom > pair.top)  # ? up pipe
+            ):
+                return True
+        return False
+
+    def next_pair(self) -> PipePair | None:
+        """Return the closest pipes pair the bird has not passed yet."""
+        bird_left = self.bird_left
+        pipe_w = self.rules.pipe_size[0]
+        for pair in self.pipes:
+            if pair.x + pipe_w >= bird_left:
+                return pair
+        return None
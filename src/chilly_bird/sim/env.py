@@ -0,0 +1,311 @@
+"""Contains Gym-style environments built on top of the headless engine."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import random
+from collections import deque
+from itertools import pairwise
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from chilly_bird.sim import rules
+from chilly_bird.sim.engine import Simulation
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.connection import Connection
+
+    from numpy.typing import ArrayLike, NDArray
+
+    from chilly_bird.sim.rules import GameRules
+
+OBSERVATION_SIZE = 8
+"""Bird's y and speed, then `x` distance and gap bounds of the next two pairs."""
+
+
+class FlappyEnv:
+    """A single Flying scene run, exposed via the `reset()/step(action)` API.
+
+    The observation is a `float32` vector of `OBSERVATION_SIZE`, normalized to
+    about `[-1, 1]`: bird's top and speed, followed by the distance to and the
+    gap bounds of the two closest pipes pairs not passed yet (a missing pair
+    is seen as a wide open gap right at the screen edge). The action is
+    whether to hold the jump button down during the tick.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        game_rules: GameRules | None = None,
+        *,
+        seed: int | None = None,
+        max_ticks: int | None = None,
+        alive_reward: float = 0.01,
+        score_reward: float = 1.0,
+        death_reward: float = -1.0,
+    ) -> None:
+        """Create the environment, `reset` must be called before stepping.
+
+        Args:
+        ----
+            game_rules: gameplay parameters, the defaults if `None`
+            seed: seed of the first episode, random if `None`
+            max_ticks: episodes are truncated after that many ticks
+            alive_reward: reward for every tick survived
+            score_reward: reward for every point of the `Flying.score`
+            death_reward: reward for dying
+
+        """
+        self.sim = Simulation(game_rules, random.Random(seed))
+        self.max_ticks = max_ticks
+        self.alive_reward = alive_reward
+        self.score_reward = score_reward
+        self.death_reward = death_reward
+        self._observation = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+    def reset(self, seed: int | None = None) -> NDArray[np.float32]:
+        """Start a new episode and return its first observation."""
+        if seed is not None:
+            self.sim.rng.seed(seed)
+        self.sim.reset()
+        return self.observe()
+
+    def step(
+        self, action: object
+    ) -> tuple[NDArray[np.float32], float, bool, bool, dict[str, int]]:
+        """Advance the episode by a single tick.
+
+        Args:
+        ----
+            action: truthy to hold the jump button down
+
+        Returns:
+        -------
+            Observation, reward, whether the bird died, whether the episode was
+            truncated and the info with the `score` and `ticks` so far.
+
+        """
+        sim = self.sim
+        score = sim.score
+        alive = sim.step(bool(action))
+        reward = (sim.score - score) * self.score_reward
+        reward += self.alive_reward if alive else self.death_reward
+        truncated = alive and self.max_ticks is not None and sim.ticks >= self.max_ticks
+        info = {"score": sim.score, "ticks": sim.ticks}
+        return self.observe(), reward, not alive, truncated, info
+
+    def observe(self, out: NDArray[np.float32] | None = None) -> NDArray[np.float32]:
+        """Write the current observation into `out` (or a new array) and return it."""
+        sim = self.sim
+        r = sim.rules
+        obs = self._observation.copy() if out is None else out
+        obs[0] = sim.bird_top / r.screen_height
+        obs[1] = sim.velocity / rules.MAX_FALL_SPEED
+        pipe_w = r.pipe_size[0]
+        pairs = [pair for pair in sim.pipes if pair.x + pipe_w >= sim.bird_left][:2]
+        for i in range(2):
+            if i < len(pairs):
+                pair = pairs[i]
+                obs[2 + 3 * i] = (pair.x - sim.bird_left) / r.screen_width
+                obs[3 + 3 * i] = pair.bottom / r.screen_height
+                obs[4 + 3 * i] = pair.top / r.screen_height
+            else:
+                obs[2 + 3 * i] = (r.screen_width - sim.bird_left) / r.screen_width
+                obs[3 + 3 * i] = 0.0
+                obs[4 + 3 * i] = rules.FLOOR_Y / r.screen_height
+        return obs
+
+
+def _worker(  # noqa: PLR0913, PLR0917
+    conn: Connection,
+    buffers: str,
+    total: int,
+    indices: range,
+    seeds: Sequence[int],
+    env_kwargs: dict[str, Any],
+) -> None:
+    """Step the `indices` environments, exchanging data via the shared memory."""
+    shm = SharedMemory(buffers)
+    views = _views(shm, total)
+    try:
+        envs = [FlappyEnv(seed=seed, **env_kwargs) for seed in seeds]
+        while True:
+            command = conn.recv()
+            finished: list[tuple[int, int, int]] = []
+            if command == "reset":
+                for i, env in zip(indices, envs, strict=True):
+                    env.reset()
+                    env.observe(views["obs"][i])
+            elif command == "step":
+                for i, env in zip(indices, envs, strict=True):
+                    _, reward, terminated, truncated, info = env.step(
+                        views["action"][i]
+                    )
+                    views["reward"][i] = reward
+                    views["terminated"][i] = terminated
+                    views["truncated"][i] = truncated
+                    if terminated or truncated:  # ? auto-reset
+                        finished.append((i, info["score"], info["ticks"]))
+                        env.reset()
+                    env.observe(views["obs"][i])
+            else:
+                break
+            conn.send(finished)
+    finally:
+        del views
+        shm.close()
+        conn.close()
+
+
+def _views(shm: SharedMemory, total: int) -> dict[str, np.ndarray]:
+    """Lay the vector environment buffers out in the shared memory block."""
+    layout = [
+        ("obs", np.float32, (total, OBSERVATION_SIZE)),
+        ("reward", np.float32, (total,)),
+        ("terminated", np.bool_, (total,)),
+        ("truncated", np.bool_, (total,)),
+        ("action", np.uint8, (total,)),
+    ]
+    views, offset = {}, 0
+    for name, dtype, shape in layout:
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+        views[name] = array
+        offset += array.nbytes
+    return views
+
+
+def _buffers_size(total: int) -> int:
+    return total * (OBSERVATION_SIZE * 4 + 4 + 1 + 1 + 1)
+
+
+class ProcessVectorEnv:
+    """`k` `FlappyEnv`s, stepped in parallel by a pool of worker processes.
+
+    Observations, rewards, flags and actions are exchanged through a single
+    shared memory block, the pipes only carry the commands and the results of
+    the finished episodes, so the throughput scales with the number of cores.
+    Finished episodes are reset automatically; their `(env index, score,
+    ticks)` are collected in `finished`, to be drained with `pop_finished`.
+    Only the last `max_finished` of them are kept, so the memory stays bounded
+    in the long runs that never drain them.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        workers: int | None = None,
+        seeds: Sequence[int] | None = None,
+        max_finished: int = 10_000,
+        **env_kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Start the worker processes.
+
+        Args:
+        ----
+            k: number of the environments
+            workers: number of the worker processes, CPU count if `None`
+            seeds: per-environment seeds of the first episodes, `range(k)` if `None`
+            max_finished: the most finished episodes kept until drained
+            env_kwargs: passed to every `FlappyEnv`
+
+        """
+        self.k = k
+        seeds = list(range(k) if seeds is None else seeds)
+        workers = min(workers or mp.cpu_count(), k)
+        self._shm = SharedMemory(create=True, size=_buffers_size(k))
+        views = _views(self._shm, k)
+        self.observations = views["obs"]
+        self.rewards = views["reward"]
+        self.terminated = views["terminated"]
+        self.truncated = views["truncated"]
+        self._actions = views["action"]
+        self.finished: deque[tuple[int, int, int]] = deque(maxlen=max_finished)
+
+        self._connections: list[Connection] = []
+        self._processes: list[mp.Process] = []
+        bounds = np.linspace(0, k, workers + 1).astype(int)
+        for start, stop in pairwise(bounds):
+            parent, child = mp.Pipe()
+            process = mp.Process(
+                target=_worker,
+                args=(
+                    child,
+                    self._shm.name,
+                    k,
+                    range(start, stop),
+                    seeds[start:stop],
+                    env_kwargs,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def _broadcast(self, command: str) -> None:
+        for conn in self._connections:
+            conn.send(command)
+        for conn in self._connections:
+            self.finished.extend(conn.recv())
+
+    def pop_finished(self) -> list[tuple[int, int, int]]:
+        """Return the episodes finished since the last call, emptying `finished`."""
+        finished = list(self.finished)
+        self.finished.clear()
+        return finished
+
+    def reset(self) -> NDArray[np.float32]:
+        """Reset all the environments and return their observations."""
+        self._broadcast("reset")
+        return self.observations.copy()
+
+    def step(
+        self, actions: ArrayLike
+    ) -> tuple[
+        NDArray[np.float32], NDArray[np.float32], NDArray[np.bool_], NDArray[np.bool_]
+    ]:
+        """Advance all the environments by a single tick.
+
+        Args:
+        ----
+            actions: per-environment jump input
+
+        Returns:
+        -------
+            Observations, rewards, terminated and truncated flags; the arrays are
+            copies, so they stay valid after the next step.
+
+        """
+        self._actions[:] = np.asarray(actions, dtype=bool)
+        self._broadcast("step")
+        return (
+            self.observations.copy(),
+            self.rewards.copy(),
+            self.terminated.copy(),
+            self.truncated.copy(),
+        )
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        for conn in self._connections:
+            conn.send("close")
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._connections.clear()
+        self._processes.clear()
+        del self.observations, self.rewards, self.terminated, self.truncated
+        del self._actions
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> ProcessVectorEnv:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_details: object) -> None:
+        """Exit the context manager, stopping the workers."""
+        self.close()
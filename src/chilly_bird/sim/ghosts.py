@@ -0,0 +1,145 @@
+"""Contains the recorded runs raced against, replayed at once as the ghosts.
+
+The ghosts are stepped by the `BatchSimulation` in lockstep with the Flying
+scene, each one against the pipes of its own seed, so they are just arrays of
+positions and speeds rather than `Bird` sprites. Their inputs are kept as the
+ticks the jump button toggles at, those of all the replays in one flat array,
+and are decoded a tick at a time.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from chilly_bird.sim.batch import BatchSimulation
+from chilly_bird.sim.replay import SUFFIX, Replay, ReplayError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from numpy.typing import NDArray
+
+    from chilly_bird.sim.rules import GameRules
+
+_NEVER = np.iinfo(np.int64).max
+
+
+def best_runs(replays: Iterable[Replay], limit: int) -> list[Replay]:
+    """Return up to `limit` of the `replays`, the best scored and longest first."""
+    runs = sorted(
+        replays, key=lambda replay: (replay.score, replay.ticks), reverse=True
+    )
+    return runs[:limit]
+
+
+def load_ghosts(path: str | Path, game_rules: GameRules, limit: int) -> list[Replay]:
+    """Return up to `limit` of the best runs among the replays in the `path` directory.
+
+    The malformed replays and the ones recorded with other game rules are skipped.
+
+    Args:
+    ----
+        path: directory of `*.cbr` replays, searched non-recursively
+        game_rules: the replays must be recorded with
+        limit: the most ghosts to race
+
+    """
+    digest = game_rules.digest()
+    replays = []
+    for file in sorted(Path(path).glob(f"*{SUFFIX}")):
+        try:
+            replay = Replay.load(file)
+        except (OSError, ReplayError):
+            continue
+        if replay.rules_digest == digest:
+            replays.append(replay)
+    return best_runs(replays, limit)
+
+
+class GhostRace:
+    """The `replays` runs, replayed at once tick by tick.
+
+    Every ghost repeats its recorded run exactly, given the same game rules,
+    and is frozen once dead. The previous tick positions are kept, so the
+    ghosts can be interpolated in between the ticks, as the sprites are.
+    """
+
+    def __init__(
+        self, replays: Sequence[Replay], game_rules: GameRules | None = None
+    ) -> None:
+        """Decode the inputs of the `replays`, ready to be stepped.
+
+        Raises `ValueError` if the rules require pixel-perfect collisions.
+
+        Args:
+        ----
+            replays: runs to race against
+            game_rules: gameplay parameters, the defaults if `None`
+
+        """
+        self.replays = list(replays)
+        self.batch = BatchSimulation(
+            len(self.replays), game_rules, [replay.seed for replay in self.replays]
+        )
+        toggles = [replay.toggles() for replay in self.replays]
+        # ? every ghost's toggles are followed by a sentinel one, never reached
+        lengths = np.array([len(ticks) + 1 for ticks in toggles], dtype=np.int64)
+        self._end = np.cumsum(lengths) - 1  # ? where the sentinels are
+        self._start = self._end - lengths + 1
+        self._toggles = np.full(int(lengths.sum()), _NEVER, dtype=np.int64)
+        for start, ticks in zip(self._start.tolist(), toggles, strict=True):
+            self._toggles[start : start + len(ticks)] = ticks
+        self.reset()
+
+    def reset(self) -> None:
+        """Return all the ghosts to the beginning of their runs."""
+        self.batch.reset()
+        self._next = self._start.copy()  # ? the ghosts' next toggles
+        self.prev_y = self.batch.bird_y
+
+    def __len__(self) -> int:
+        """Return the number of the ghosts."""
+        return len(self.replays)
+
+    @property
+    def ticks(self) -> int:
+        """Ticks the ghosts have been flying for."""
+        return self.batch.ticks
+
+    def inputs(self) -> NDArray[np.bool_]:
+        """Return the ghosts' jump input of the upcoming tick.
+
+        Must be called once per tick: past the first run, which may be empty,
+        the input toggles at most once per tick.
+        """
+        self._next += self._toggles[self._next] <= self.batch.ticks
+        toggled = self._next - self._start
+        # ? released once the inputs are exhausted, as in `Replay.inputs`
+        return (toggled % 2 == 1) & (self._next < self._end)
+
+    def step(self) -> NDArray[np.bool_]:
+        """Advance all the alive ghosts by a single tick.
+
+        Returns
+        -------
+            Mask of the ghosts that are still flying.
+
+        """
+        self.prev_y = self.batch.bird_y  # ? `step` replaces, not updates, it
+        if not self.batch.alive.any():
+            return self.batch.alive
+        return self.batch.step(self.inputs())
+
+    def tops(self, alpha: float = 1.0) -> NDArray[np.int64]:
+        """Return the ghosts' rect tops, interpolated in between the last two ticks.
+
+        Args:
+        ----
+            alpha: interpolation factor, 0 - previous tick, 1 - current tick
+
+        """
+        y = self.prev_y + (self.batch.bird_y - self.prev_y) * alpha
+        return np.floor(y + 0.5).astype(np.int64)  # ? to_px
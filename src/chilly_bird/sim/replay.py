@@ -0,0 +1,153 @@
+"""Contains the compact binary replay format and its recording utilities.
+
+A replay file is a fixed header followed by the run-length encoded jump input
+stream. The header holds the format version, the seed of the pipes generator,
+the digest of the `GameRules` the run was played with, its length in ticks and
+the score. The runs are LEB128 varints, alternating between released and held
+down states of the jump button, starting with the released one.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from chilly_bird.sim.engine import Simulation, SimulationResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from chilly_bird.sim.rules import GameRules
+
+MAGIC = b"CBRP"
+VERSION = 1
+SUFFIX = ".cbr"
+_HEADER = struct.Struct("<4sBQ8sII")
+
+
+class ReplayError(ValueError):
+    """Raised when the replay data is malformed."""
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:  # noqa: PLR2004
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varints(data: bytes) -> Iterator[int]:
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+    if shift:
+        raise ReplayError("Truncated input stream")  # noqa: TRY003
+
+
+@dataclass(frozen=True)
+class Replay:
+    """A recorded Flying scene run."""
+
+    seed: int
+    rules_digest: bytes
+    ticks: int
+    score: int
+    runs: bytes  # ? encoded run lengths
+
+    def inputs(self) -> Iterator[bool]:
+        """Yield the jump input of every tick, lazily decoding the runs."""
+        pressed = False
+        for length in _decode_varints(self.runs):
+            for _ in range(length):
+                yield pressed
+            pressed = not pressed
+
+    def toggles(self) -> list[int]:
+        """Return the ticks the jump input toggles at, starting from released."""
+        return list(accumulate(_decode_varints(self.runs)))
+
+    def simulate(
+        self, game_rules: GameRules | None = None, max_ticks: int | None = None
+    ) -> SimulationResult:
+        """Re-run the replay with the headless engine.
+
+        Args:
+        ----
+            game_rules: to simulate with, the defaults if `None`
+            max_ticks: stop after that many ticks, e.g. to seek
+
+        """
+        sim = Simulation(game_rules, random.Random(self.seed))
+        return sim.run(self.inputs(), max_ticks)
+
+    def encode(self) -> bytes:
+        """Return the binary representation of the replay."""
+        header = _HEADER.pack(
+            MAGIC, VERSION, self.seed, self.rules_digest, self.ticks, self.score
+        )
+        return header + self.runs
+
+    @classmethod
+    def decode(cls, data: bytes) -> Replay:
+        """Parse the replay from its binary representation."""
+        if len(data) < _HEADER.size:
+            raise ReplayError("Replay is too short")  # noqa: TRY003
+        magic, version, seed, digest, ticks, score = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("Not a replay")  # noqa: TRY003
+        if version != VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")  # noqa: TRY003
+        return cls(seed, digest, ticks, score, bytes(data[_HEADER.size :]))
+
+    def save(self, path: str | Path) -> None:
+        """Write the replay to the file at `path`."""
+        Path(path).write_bytes(self.encode())
+
+    @classmethod
+    def load(cls, path: str | Path) -> Replay:
+        """Read the replay from the file at `path`."""
+        return cls.decode(Path(path).read_bytes())
+
+
+class ReplayRecorder:
+    """Accumulates the per-tick jump input into the run-length encoded stream."""
+
+    def __init__(self, seed: int, game_rules: GameRules) -> None:
+        """Start recording a run.
+
+        Args:
+        ----
+            seed: of the pipes generator the run is played with
+            game_rules: the run is played with
+
+        """
+        self.seed = seed
+        self.rules_digest = game_rules.digest()
+        self.ticks = 0
+        self._runs = bytearray()
+        self._pressed = False
+        self._run = 0
+
+    def append(self, pressed: bool) -> None:  # noqa: FBT001
+        """Record the jump input of the next tick."""
+        if pressed != self._pressed:
+            _encode_varint(self._run, self._runs)
+            self._pressed = pressed
+            self._run = 0
+        self._run += 1
+        self.ticks += 1
+
+    def finish(self, score: int) -> Replay:
+        """Return the replay of the run recorded so far, ended with `score`."""
+        runs = bytearray(self._runs)
+        _encode_varint(self._run, runs)
+        return Replay(self.seed, self.rules_digest, self.ticks, score, bytes(runs))
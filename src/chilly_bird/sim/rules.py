@@ -0,0 +1,140 @@
+"""Contains the gameplay rules shared by the sprites and the headless engine."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+from dataclasses import astuple, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chilly_bird.configs import MainConfig
+
+FLOOR_Y = 384
+"""The road level, the bird dies when touching it."""
+GRAVITY = 0.17
+"""Bird's vertical speed increment per tick, in px/tick."""
+MAX_FALL_SPEED = 2.6
+"""Bird's vertical speed limit, in px/tick."""
+JUMP_SPEED = -3.5
+"""Bird's vertical speed right after the jump, in px/tick."""
+JIGGLE_DIV = 10
+"""Pipes move in one vertical direction for that many ticks."""
+JIGGLE_STEP = 1
+"""Pipes vertical jiggle speed, in px/tick."""
+
+
+def to_px(value: float) -> int:
+    """Snap the sub-pixel coordinate `value` to the pixel grid (rounding half up)."""
+    return math.floor(value + 0.5)
+
+
+def fall(velocity: float) -> float:
+    """Return the bird's vertical speed after a single tick of falling."""
+    return min(velocity + GRAVITY, MAX_FALL_SPEED)
+
+
+def displacement(velocity: float) -> int:
+    """Return the bird's vertical move in a tick, the `velocity` truncated to px.
+
+    The fractions of the speed are dropped, not accumulated, as the game has
+    always done: it's what its jump height and fall speed are tuned for.
+    """
+    return int(velocity)
+
+
+def jiggle(counter: int) -> tuple[int, int]:
+    """Return the pipe's vertical shift for this tick and the next jiggle counter.
+
+    Args:
+    ----
+        counter: the pipe's jiggle counter, starts at 0
+
+    """
+    dy = -JIGGLE_STEP if counter >= 0 else JIGGLE_STEP
+    if counter >= JIGGLE_DIV:
+        counter -= 2 * JIGGLE_DIV
+    return dy, counter + JIGGLE_STEP
+
+
+def pipes_due(ticks_since_spawn: int | None, pipe_period: int) -> bool:
+    """Check whether it's time to spawn the next pipes pair.
+
+    Args:
+    ----
+        ticks_since_spawn: ticks passed since the last spawn, `None` if none was
+        pipe_period: pipes spawn period, in ticks
+
+    """
+    return ticks_since_spawn is None or ticks_since_spawn >= pipe_period
+
+
+def png_size(path: str | Path) -> tuple[int, int]:
+    """Read the `(w, h)` of the PNG image from its header, without decoding it."""
+    with Path(path).open("rb") as file:
+        header = file.read(24)
+    if header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        raise ValueError(f"{path} is not a PNG image")  # noqa: TRY003
+    width, height = struct.unpack(">II", header[16:24])
+    return width, height
+
+
+@dataclass(frozen=True)
+class GameRules:
+    """Tunable parameters of the Flying scene.
+
+    All the lengths are in px and the durations in ticks, as are the speeds
+    of the `rules` constants, so the `tick_rate` scales the game's pace as a
+    whole: the pipes are always the same distance apart.
+    """
+
+    screen_width: int = 432
+    screen_height: int = 468
+    tick_rate: int = 60
+    bird_x: int = 50
+    bird_size: tuple[int, int] = (50, 35)
+    pipe_size: tuple[int, int] = (39, 280)
+    scroll_speed: int = 2
+    pipe_period: int = 76  # ? ~1.25 s at 60 ticks per second
+    pipe_gap: int = 100
+    pipe_spread: int = 50
+    pixel_perfect: bool = False  # ? not supported by the headless engines
+
+    @classmethod
+    def from_config(cls, cfg: MainConfig) -> GameRules:
+        """Create the rules matching the main config, without decoding assets."""
+        bird_w, bird_h = cfg.main_scene.bird_size
+        return cls(
+            screen_width=cfg.window.screen_width,
+            screen_height=cfg.window.screen_height,
+            tick_rate=cfg.window.tick_rate,
+            bird_size=(bird_w, bird_h),
+            pipe_size=png_size(cfg.main_scene.pipe_img),
+            pixel_perfect=cfg.main_scene.pixel_perfect_collision,
+        )
+
+    def digest(self) -> bytes:
+        """Return the 8-byte fingerprint of the rules, e.g. to validate replays."""
+        return hashlib.blake2b(repr(astuple(self)).encode(), digest_size=8).digest()
+
+    @property
+    def tick_ms(self) -> float:
+        """Duration of the simulation tick, in ms."""
+        return 1000 / self.tick_rate
+
+    @property
+    def max_pairs(self) -> int:
+        """Pipes pairs on the screen at the same time, at most."""
+        spawn_ticks = self.pipe_period
+        travel_ticks = math.ceil(
+            (self.screen_width + self.pipe_size[0]) / self.scroll_speed
+        )
+        return travel_ticks // spawn_ticks + 2
+
+    @property
+    def bird_start(self) -> tuple[int, int]:
+        """Bird's initial rect top-left corner."""
+        bird_w, bird_h = self.bird_size
+        return self.bird_x - bird_w // 2, to_px(self.screen_height / 2) - bird_h // 2
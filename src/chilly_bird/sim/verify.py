@@ -0,0 +1,226 @@
+"""Contains the parallel replay verifier, e.g. for the leaderboard submissions.
+
+Every replay is re-simulated from its seed and inputs and the outcome is
+compared with the claimed one. The replays are verified in chunks, each chunk
+is stepped at once by the `BatchSimulation` in a worker process, and the
+verdicts are streamed as JSON lines as soon as their chunk is done.
+
+Run `python -m chilly_bird.sim.verify --help` for the usage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from chilly_bird.sim.batch import BatchSimulation
+from chilly_bird.sim.replay import SUFFIX, Replay, ReplayError
+from chilly_bird.sim.rules import GameRules
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+MAX_REPLAY_BYTES = 64 * 1024
+"""Larger files are rejected without being simulated."""
+MAX_TICKS = 60 * 60 * 60
+"""Runs still alive after that many ticks are stopped."""
+
+
+@dataclass(frozen=True)
+class Verdict:
+    """Outcome of the replay verification."""
+
+    path: str
+    verified: bool
+    score: int | None = None  # ? verified ones, `None` if not simulated
+    ticks: int | None = None  # ? of the death
+    claimed_score: int | None = None
+    claimed_ticks: int | None = None
+    divergence: str | None = None  # ? why the replay was not verified
+
+    def to_json(self) -> str:
+        """Return the verdict as a single-line JSON object."""
+        return json.dumps(asdict(self))
+
+
+def verify_chunk(
+    paths: Sequence[str],
+    game_rules: GameRules | None = None,
+    max_ticks: int = MAX_TICKS,
+) -> list[Verdict]:
+    """Re-simulate the replays at once and compare them with the claimed outcomes.
+
+    Only a single chunk of the replays is in memory at a time, their inputs are
+    decoded tick by tick.
+
+    Args:
+    ----
+        paths: to the replay files
+        game_rules: the replays must be recorded with, the defaults if `None`
+        max_ticks: runs still alive after that many ticks are stopped
+
+    """
+    game_rules = game_rules or GameRules()
+    digest = game_rules.digest()
+    verdicts: dict[str, Verdict] = {}
+    replays: dict[str, Replay] = {}
+    for path in paths:
+        try:
+            if Path(path).stat().st_size > MAX_REPLAY_BYTES:
+                raise ReplayError("Replay is too large")  # noqa: TRY003, TRY301
+            replay = Replay.load(path)
+        except (OSError, ReplayError) as exc:
+            verdicts[path] = Verdict(path, verified=False, divergence=str(exc))
+            continue
+        if replay.rules_digest != digest:
+            verdicts[path] = Verdict(
+                path,
+                verified=False,
+                claimed_score=replay.score,
+                claimed_ticks=replay.ticks,
+                divergence="recorded with other game rules",
+            )
+        else:
+            replays[path] = replay
+
+    if replays:
+        batch = BatchSimulation(
+            len(replays), game_rules, [replay.seed for replay in replays.values()]
+        )
+        inputs = [replay.inputs() for replay in replays.values()]
+        while batch.alive.any() and batch.ticks < max_ticks:
+            batch.step([next(stream, False) for stream in inputs])
+        for i, (path, replay) in enumerate(replays.items()):
+            score, ticks = int(batch.score[i]), int(batch.death_tick[i])
+            if ticks < 0:
+                divergence = f"still alive after {batch.ticks} ticks"
+            elif (score, ticks) != (replay.score, replay.ticks):
+                divergence = f"died at tick {ticks} with score {score}"
+            else:
+                divergence = None
+            verdicts[path] = Verdict(
+                path,
+                verified=divergence is None,
+                score=score,
+                ticks=ticks if ticks >= 0 else None,
+                claimed_score=replay.score,
+                claimed_ticks=replay.ticks,
+                divergence=divergence,
+            )
+    return [verdicts[path] for path in paths]
+
+
+def find_replays(sources: Iterable[str]) -> Iterator[str]:
+    """Yield the replay files, directories are searched recursively.
+
+    Args:
+    ----
+        sources: paths to the replays or directories, `-` to read the paths
+        from the standard input, one per line
+
+    """
+    for source in sources:
+        if source == "-":
+            yield from (line.strip() for line in sys.stdin if line.strip())
+        elif Path(source).is_dir():
+            for root, _, files in os.walk(source):
+                for name in sorted(files):
+                    if name.endswith(SUFFIX):
+                        yield os.path.join(root, name)  # noqa: PTH118
+        else:
+            yield source
+
+
+def verify_replays(
+    paths: Iterable[str],
+    game_rules: GameRules | None = None,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 256,
+    max_ticks: int = MAX_TICKS,
+) -> Iterator[Verdict]:
+    """Verify the replays in a process pool, yielding the verdicts as they come.
+
+    The `paths` are consumed lazily: only a couple of chunks per worker are in
+    flight, so the memory use doesn't depend on the number of the replays.
+    The verdicts are yielded in order of the chunks completion.
+
+    Args:
+    ----
+        paths: to the replay files
+        game_rules: the replays must be recorded with, the defaults if `None`
+        workers: number of the worker processes, CPU count if `None`
+        chunk_size: number of the replays simulated at once
+        max_ticks: runs still alive after that many ticks are stopped
+
+    """
+    workers = workers or os.cpu_count() or 1
+    paths = iter(paths)
+    with ProcessPoolExecutor(workers) as pool:
+        pending: set[Future[list[Verdict]]] = set()
+        while True:
+            while len(pending) < 2 * workers and (
+                chunk := list(islice(paths, chunk_size))
+            ):
+                pending.add(pool.submit(verify_chunk, chunk, game_rules, max_ticks))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Verify the replays, printing the verdicts as JSON lines.
+
+    Returns
+    -------
+        Exit code, 1 if any replay failed the verification.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m chilly_bird.sim.verify",
+        description="Verify the replays by re-simulating them.",
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        default=["-"],
+        help=f"replay files or directories of `*{SUFFIX}` ones, `-` for stdin",
+    )
+    parser.add_argument("--config", help="game config the replays must match")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    args = parser.parse_args(argv)
+
+    game_rules = None
+    if args.config is not None:
+        from chilly_bird.configs import load_config  # noqa: PLC0415
+
+        game_rules = GameRules.from_config(load_config(args.config))
+        if game_rules.pixel_perfect:
+            parser.error("pixel-perfect collisions can't be verified in batches")
+
+    all_verified = True
+    for verdict in verify_replays(
+        find_replays(args.sources),
+        game_rules,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_ticks=args.max_ticks,
+    ):
+        all_verified &= verdict.verified
+        print(verdict.to_json(), flush=True)
+    return 0 if all_verified else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,26 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
+from time import perf_counter_ns
 
 import pygame as pg
 
 from chilly_bird.configs import MainConfig
+from chilly_bird.instrumentation import timings
+from chilly_bird.rendering import draw_rect, group_drawables
 
 
 class BaseState(ABC):
     """Abstract base state designed for use with the state machine."""
 
+    static_groups: frozenset[str] = frozenset()
+    """Groups pre-composited with the background by `draw_background`.
+
+    They are drawn beneath the other groups, so they must not overlap the ones
+    before them. The composite is rebuilt only when the image or the position
+    of any of their sprites changes.
+    """
+
     def __init__(
         self, cfg: MainConfig | None = None, next_state: str | None = None
     ) -> None:
@@ -26,6 +37,8 @@ class BaseState(ABC):
         self.next_state = next_state
         self.screen_rect = pg.display.get_surface().get_rect()
         self.groups: dict[str, pg.sprite.AbstractGroup] = {}
+        self._static_layer: pg.Surface | None = None
+        self._static_key: list[tuple[pg.Surface, tuple[int, int]]] = []  # ? its state
 
     def handle_event(self, event: pg.event.Event) -> None:
         """Event handling happens here.
@@ -37,27 +50,91 @@ class BaseState(ABC):
         """
         return None
 
-    def update(self, dt: int) -> None:
-        """State internal (Groups) are updated here.
+    def update(self, dt: float) -> None:
+        """State internal (Groups) are updated here, once per simulation tick.
 
         Args:
         ----
-            dt: time elapsed since last frame
+            dt: duration of the simulation tick, in ms
 
         """
-        for group in self.groups.values():
+        timed = timings.enabled
+        for name, group in self.groups.items():
+            start = perf_counter_ns() if timed else 0
             group.update()
+            if timed:
+                timings.add_group(
+                    type(self).__name__, name, "update", perf_counter_ns() - start
+                )
+
+    def invalidate_static(self) -> None:
+        """Rebuild the static groups composite on the next frame."""
+        self._static_layer = None
+
+    def draw_background(
+        self, surface: pg.Surface, background: pg.Surface, alpha: float = 1.0
+    ) -> None:
+        """Draw the `background` along with the `static_groups` onto the `surface`.
 
-    def draw(self, surface: pg.Surface) -> None:
-        """Draw the objects belonging to this state.
+        Args:
+        ----
+            surface: to draw onto
+            background: image drawn at the top left corner of the `surface`
+            alpha: interpolation factor in between the last two simulation ticks
+
+        """
+        if not self.static_groups:
+            surface.blit(background, (0, 0))
+            return
+        start = perf_counter_ns()
+        drawables = [
+            (sprite.image, draw_rect(sprite, alpha))
+            for name, group in self.groups.items()
+            if name in self.static_groups
+            for sprite in group.sprites()
+        ]
+        key = [(background, surface.get_size())] + [
+            (image, rect.topleft) for image, rect in drawables
+        ]
+        if self._static_layer is None or key != self._static_key:
+            self._static_layer = layer = pg.Surface(surface.get_size(), 0, surface)
+            layer.blit(background, (0, 0))
+            layer.blits(drawables, doreturn=False)
+            self._static_key = key
+        surface.blit(self._static_layer, (0, 0))
+        if timings.enabled:
+            timings.add_group(
+                type(self).__name__, "static", "draw", perf_counter_ns() - start
+            )
+
+    def draw(self, surface: pg.Surface, alpha: float = 1.0) -> None:
+        """Draw the objects belonging to this state, but the `static_groups`.
+
+        The objects overlapping the `surface` clip area are blitted in z-order by
+        a single `Surface.blits` call, or by one per group when the `timings`
+        are recorded.
 
         Args:
         ----
             surface: to draw onto
+            alpha: interpolation factor in between the last two simulation ticks
 
         """
-        for group in self.groups.values():
-            group.draw(surface)
+        clip = surface.get_clip()
+        timed = timings.enabled
+        drawables: list[tuple[pg.Surface, tuple[int, int]]] = []
+        for name, group in self.groups.items():
+            if name in self.static_groups:
+                continue
+            start = perf_counter_ns() if timed else 0
+            drawables += group_drawables(group, clip, alpha)
+            if timed:  # ? the group is blitted on its own, to be timed apart
+                surface.blits(drawables, doreturn=False)
+                drawables = []
+                timings.add_group(
+                    type(self).__name__, name, "draw", perf_counter_ns() - start
+                )
+        surface.blits(drawables, doreturn=False)
 
     @abstractmethod
     def on_enter(self, passed_groups: Mapping[str, pg.sprite.AbstractGroup]) -> None:
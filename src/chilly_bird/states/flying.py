@@ -1,7 +1,10 @@
 """Contains implemented state of the Flying scene."""
 
-from collections.abc import Mapping
-from random import randint
+import dataclasses
+import random
+import secrets
+from collections.abc import Callable, Mapping
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 import pygame as pg
@@ -9,9 +12,18 @@ from loguru import logger
 from pygame.sprite import AbstractGroup
 from typing_extensions import override
 
+from chilly_bird import logging as logs
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig
-from chilly_bird.objects.pipes import Pipe
-from chilly_bird.objects.textboxes import TextSprite
+from chilly_bird.objects.bird import mouse_pressed
+from chilly_bird.objects.ghosts import Ghosts
+from chilly_bird.objects.layers import ScrollingLayer, set_scroll_speed
+from chilly_bird.objects.pipes import Pipe, PipeGroup, PipePool
+from chilly_bird.objects.textboxes import GlyphTextSprite
+from chilly_bird.sim import rules
+from chilly_bird.sim.ghosts import GhostRace, best_runs, load_ghosts
+from chilly_bird.sim.replay import SUFFIX, Replay, ReplayRecorder
+from chilly_bird.sim.rules import GameRules
 from chilly_bird.states.base import BaseState
 
 if TYPE_CHECKING:
@@ -33,105 +45,246 @@ class Flying(BaseState):
         if cfg is None:
             raise ValueError("cfg argument can't be None")  # noqa: TRY003
         self.cfg = cfg
+        self.rules = GameRules.from_config(cfg)
         # ? Init params
         self.score = 0
         self.game_is_over = False
-        self.road_scroll = 0
         self.within_pipe = False
 
-        self.scroll_speed = 2
-        self.pipe_freq = 1250  # New pipes appear every 1.25 seconds
-        self.gap_btw_pipes = 100
-        self.leftmost_pipe = pg.time.get_ticks() - self.pipe_freq
+        self.scroll_speed = self.rules.scroll_speed
+        self.pipe_period = self.rules.pipe_period  # New pipes appear every 76 ticks
+        self.gap_btw_pipes = self.rules.pipe_gap
+        self.ticks = 0  # simulation clock
+        self.leftmost_pipe: int | None = None  # tick of the last pipes spawn
         self.passed_leftmost_pipe: Pipe | None = None
+        # ? off-screen pipes are recycled, two per pair
+        self.pipe_pool = PipePool(2 * self.rules.max_pairs, cfg)
+        self.pipes = PipeGroup()  # ? ordered by x, for O(1) scoring and collisions
 
+        # ? Determinism and replays
+        self.rng = random.Random()
+        self.seed = 0
+        self.input_source: Callable[[], bool] = mouse_pressed
+        self.pressed = False  # jump input of the current tick
+        self.recorder = ReplayRecorder(self.seed, self.rules)
+        self.replay: Replay | None = None  # to be played back on the next enter
+        self.playing: Replay | None = None
+        self.last_replay: Replay | None = None
+        self.seek_ticks = 0  # to be skipped on the next enter
+
+        # ? Ghost race, the batch engine collides the ghosts by their rects
+        self.ghost_rules = dataclasses.replace(self.rules, pixel_perfect=False)
+        self.ghost_replays: list[Replay] = []
+        self.ghost_race: GhostRace | None = None  # rebuilt once the replays change
+        if cfg.ghosts.race:
+            self.ghost_replays = load_ghosts(
+                cfg.ghosts.path, self.rules, cfg.ghosts.max_ghosts
+            )
+            logger.info(
+                "Racing {} ghosts from {}", len(self.ghost_replays), cfg.ghosts.path
+            )
+
+        if cfg.main_scene.bg_parallax:  # ? the background scrolls too, behind all
+            self.groups["sky"] = pg.sprite.GroupSingle(
+                ScrollingLayer(
+                    registry.image(cfg.main_scene.bg_img, "opaque"),
+                    0,
+                    self.screen_rect.width,
+                    cfg.main_scene.bg_parallax,
+                )
+            )
         self.groups.update(
             {
-                "pipes": pg.sprite.Group(),
+                "pipes": self.pipes,
                 "score": pg.sprite.GroupSingle(
-                    TextSprite(
+                    GlyphTextSprite(
                         str(self.score),
-                        pg.font.Font(cfg.fonts.score_font, cfg.fonts.score_font_size),
-                        cfg.fonts.color,
+                        registry.glyphs(
+                            cfg.fonts.score_font,
+                            cfg.fonts.score_font_size,
+                            cfg.fonts.color,
+                        ),
                         (self.screen_rect.width / 2, 12),  # type: ignore
                     )
                 ),
             }
         )
+        self.ghosts: Ghosts | None = None
+        if cfg.ghosts.race:  # ? behind the live bird, added on enter
+            self.groups["ghosts"] = self.ghosts = Ghosts(
+                registry.rotations(
+                    cfg.main_scene.bird_aframes,
+                    cfg.main_scene.bird_size,
+                    cfg.main_scene.bird_rotation_step,
+                    cfg.ghosts.opacity,
+                )
+            )
+
+    @property
+    def bird(self) -> "Bird":
+        """The live bird, the one the player controls."""
+        return self.groups["bird"].sprites()[0]
 
     @override
     def on_enter(self, passed_groups: Mapping[str, AbstractGroup]) -> None:
         self.score = 0
         self.game_is_over = False
-        self.road_scroll = 0
+        self.ticks = 0
+        self.leftmost_pipe = None
+        self.passed_leftmost_pipe = None
 
         self.groups["pipes"].empty()
+        self.groups["score"].update(text=str(self.score))
 
         bird_group: pg.sprite.GroupSingle[Bird] = passed_groups["bird"]  # type: ignore
         bird_group.sprite.flying = True
+        bird_group.sprite.jump_input = self.jump_pressed
         self.groups.update({"bird": bird_group, "road": passed_groups["road"]})
         self.groups["pipes"].update(scroll_speed=self.scroll_speed)
+        set_scroll_speed(self.groups.values(), self.scroll_speed)
+
+        self.playing, self.replay = self.replay, None
+        if self.playing is not None:
+            if self.playing.rules_digest != self.rules.digest():
+                logger.warning("Replay was recorded with different game rules")
+            logger.info("Playing back the replay, seed={}", self.playing.seed)
+            self.seed = self.playing.seed
+            inputs = self.playing.inputs()
+            self.input_source = lambda: next(inputs, False)
+        else:
+            self.seed = secrets.randbits(32)
+            self.input_source = mouse_pressed
+        self.rng.seed(self.seed)
+        self.recorder = ReplayRecorder(self.seed, self.rules)
+
+        if self.ghosts is not None:
+            if self.ghost_race is None and self.ghost_replays:
+                self.ghost_race = GhostRace(self.ghost_replays, self.ghost_rules)
+            self.ghosts.start(self.ghost_race)
+
+        if self.seek_ticks > 0:
+            self.fast_forward(self.seek_ticks)
+            self.seek_ticks = 0
 
     @override
-    def update(self, dt: int) -> None:
+    def update(self, dt: float) -> None:
+        self.pressed = self.input_source()
+        self.recorder.append(self.pressed)
+        self.ticks += 1
         self.inc_score()
-        self.groups["score"].update(text=str(self.score))
         self.handle_collision()
-        self.generate_pipes()
+        self.generate_pipes(dt)
         super().update(dt)
 
     @override
-    def draw(self, surface: pg.Surface) -> None:
-        return super().draw(surface)
+    def draw(self, surface: pg.Surface, alpha: float = 1.0) -> None:
+        return super().draw(surface, alpha)
 
     @override
     def on_exit(self) -> dict[str, AbstractGroup]:
+        self.last_replay = self.recorder.finish(self.score)
+        if self.playing is not None:
+            logger.info(
+                "Replay played back: score {} at tick {}, recorded {} at tick {}",
+                self.score,
+                self.ticks,
+                self.playing.score,
+                self.playing.ticks,
+            )
+        if self.cfg.replays.record:
+            self.save_replay(self.last_replay)
+        if self.ghosts is not None and self.playing is None:  # ? raced next time
+            self.ghost_replays = best_runs(
+                [*self.ghost_replays, self.last_replay], self.cfg.ghosts.max_ghosts
+            )
+            self.ghost_race = None
         return self.groups
 
+    def jump_pressed(self) -> bool:
+        """Return the jump input of the current tick, the `Bird`'s input source."""
+        return self.pressed
+
+    def fast_forward(self, ticks: int) -> None:
+        """Simulate up to `ticks` ticks at once, without rendering or sleeping."""
+        logger.info("Fast-forwarding {} ticks", ticks)
+        bird = self.bird
+        bird.muted = True
+        for _ in range(ticks):
+            if self.done:
+                break
+            self.update(self.rules.tick_ms)
+        bird.muted = False
+
+    def save_replay(self, replay: Replay) -> None:
+        """Save the `replay` into the configured replays directory."""
+        path = self.cfg.replays.path
+        path.mkdir(parents=True, exist_ok=True)
+        name = f"{datetime.now():%Y%m%d-%H%M%S}-{replay.seed:08x}{SUFFIX}"
+        replay.save(path / name)
+        logger.info("Replay saved to {}", path / name)
+
     def inc_score(self) -> None:
-        """Increments the score when needed."""
-        if len(self.groups["pipes"]) > 0:  # Some pipes had been created
-            current_pipe: Pipe = self.groups["pipes"].sprites()[0]
-            bird = self.groups["bird"].sprites()[0]
+        """Increments the score when needed, updating its text only then."""
+        current_pipe = self.pipes.front()
+        if current_pipe is not None:  # Some pipes had been created
+            bird = self.bird
             if (
                 current_pipe != self.passed_leftmost_pipe
                 and bird.rect.left > current_pipe.rect.right
             ):
                 self.passed_leftmost_pipe = current_pipe
                 self.score += 1
+                self.groups["score"].update(text=str(self.score))
 
     def handle_collision(self) -> None:
         """Handle collisions between Bird and Pipes."""
         # ? Collision handling
-        bird = self.groups["bird"].sprites()[0]
-        pipe_group = self.groups["pipes"]
-        bird_collided_pipe = pg.sprite.spritecollideany(bird, pipe_group)
+        bird = self.bird
+        if self.rules.pixel_perfect:  # ? the masks are checked if the bounds overlap
+            bird_collided_pipe = self.pipes.collide(
+                bird, pg.sprite.collide_mask, bird.bounds
+            )
+        else:
+            bird_collided_pipe = self.pipes.collide(bird)
         bird_touched_screen_top = bird.rect.top < 0
         if bird_collided_pipe or bird_touched_screen_top:
             self.game_is_over = True
             self.done = True
             bird.visible = False
 
-        floor_level = 384
-        if bird.rect.bottom >= floor_level:
+        if bird.rect.bottom >= rules.FLOOR_Y:
             self.game_is_over = True
             self.done = True
             bird.flying = False
             bird.visible = False
 
-    def generate_pipes(self) -> None:
-        """Spawn and move pipes."""
-        bird = self.groups["bird"].sprites()[0]
+        if self.game_is_over:  # ? the road stops right away, unlike the pipes
+            set_scroll_speed(self.groups.values(), 0)
+
+    def generate_pipes(self, dt: float) -> None:
+        """Spawn and move pipes.
+
+        Args:
+        ----
+            dt: duration of the simulation tick, in ms
+
+        """
+        bird = self.bird
         pipe_group = self.groups["pipes"]
         if not self.game_is_over and bird.flying:
-            logger.trace("Generating new pipes")
-            current_time = pg.time.get_ticks()
+            if logs.trace_enabled:
+                logger.trace("Generating new pipes")
 
             # Enough time has passed -> creating new pipes:
-            if current_time - self.leftmost_pipe > self.pipe_freq:
+            since_spawn = (
+                None if self.leftmost_pipe is None else self.ticks - self.leftmost_pipe
+            )
+            if rules.pipes_due(since_spawn, self.pipe_period):
                 # Pipes are randomly generated within the range of 100 pixels:
-                pipe_distance = randint(-50, 50)
-                pipe_down = Pipe(
+                pipe_distance = self.rng.randint(
+                    -self.rules.pipe_spread, self.rules.pipe_spread
+                )
+                pipe_down = self.pipe_pool.acquire(
                     pos=(
                         self.screen_rect.width,
                         round(self.screen_rect.height / 2 + pipe_distance),
@@ -139,9 +292,8 @@ class Flying(BaseState):
                     direction="down",
                     pipe_gap=self.gap_btw_pipes,
                     scroll_speed=self.scroll_speed,
-                    cfg=self.cfg,
                 )
-                pipe_up = Pipe(
+                pipe_up = self.pipe_pool.acquire(
                     pos=(
                         self.screen_rect.width,
                         round(self.screen_rect.height / 2 + pipe_distance),
@@ -149,14 +301,7 @@ class Flying(BaseState):
                     direction="up",
                     pipe_gap=self.gap_btw_pipes,
                     scroll_speed=self.scroll_speed,
-                    cfg=self.cfg,
                 )
 
-                pipe_group.add([pipe_down, pipe_up])
-                self.leftmost_pipe = current_time
-
-            # Making the road scroll:
-            self.road_scroll -= self.scroll_speed
-            max_scroll_speed = 17
-            if abs(self.road_scroll) > max_scroll_speed:
-                self.road_scroll = 0
+                pipe_group.add(pipe_down, pipe_up)
+                self.leftmost_pipe = self.ticks
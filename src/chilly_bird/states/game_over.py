@@ -8,6 +8,7 @@ from pygame.sprite import AbstractGroup
 from typing_extensions import override
 
 from chilly_bird import game
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig
 from chilly_bird.objects.buttons import Button
 from chilly_bird.objects.girls import Girl
@@ -17,6 +18,11 @@ from chilly_bird.states.base import BaseState
 class GameOver(BaseState):
     """GameOver scene."""
 
+    # ? the whole scene is frozen, once the bird has fallen down
+    static_groups = frozenset(
+        {"sky", "bird", "pipes", "road", "score", "girl", "restart_button"}
+    )
+
     @override
     def __init__(
         self, cfg: MainConfig | None = None, next_state: str | None = None
@@ -34,9 +40,7 @@ class GameOver(BaseState):
                 "girl": pg.sprite.GroupSingle(
                     Girl(
                         pos=(120, 240),
-                        image=pg.image.load(
-                            cfg.main_scene.disappointed_girl_img
-                        ).convert_alpha(),
+                        image=registry.image(cfg.main_scene.disappointed_girl_img),
                     )
                 ),
                 "restart_button": pg.sprite.GroupSingle(
@@ -45,9 +49,7 @@ class GameOver(BaseState):
                             self.screen_rect.width // 2 - 40,
                             self.screen_rect.height // 2 - 80,
                         ),
-                        image=pg.image.load(
-                            cfg.main_scene.restart_button_img
-                        ).convert_alpha(),
+                        image=registry.image(cfg.main_scene.restart_button_img),
                         button_event_name="restart",
                     )
                 ),
@@ -57,6 +59,8 @@ class GameOver(BaseState):
     @override
     def on_enter(self, passed_groups: Mapping[str, AbstractGroup]) -> None:
         carry_over = ["bird", "pipes", "road", "score"]
+        if "sky" in passed_groups:  # ? the first one, so it's drawn behind all
+            carry_over.insert(0, "sky")
         for group_name in carry_over:
             self.groups[group_name] = passed_groups[group_name]
         self.groups["pipes"].update(scroll_speed=0)
@@ -74,6 +78,9 @@ class GameOver(BaseState):
     def on_exit(self) -> dict[str, AbstractGroup]:
         self.groups["bird"].sprites()[0].reset()
         self.groups["pipes"].empty()
+        for name in ("sky", "road"):
+            for layer in self.groups.get(name, ()):
+                layer.reset()
         return super().on_exit()
 
     @override
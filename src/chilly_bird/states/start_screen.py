@@ -8,6 +8,7 @@ from pygame.event import Event
 from typing_extensions import override
 
 from chilly_bird import game, utils
+from chilly_bird.assets import registry
 from chilly_bird.configs import MainConfig
 from chilly_bird.objects.bird import Bird
 from chilly_bird.objects.buttons import Button
@@ -19,6 +20,9 @@ from chilly_bird.states.base import BaseState
 class StartScreen(BaseState):
     """StartScreen scene with UI and instructions."""
 
+    # ? only the bird flaps, and it overlaps none of them
+    static_groups = frozenset({"text", "road", "buttons"})
+
     @override
     def __init__(
         self, cfg: MainConfig | None = None, next_state: str | None = None
@@ -31,7 +35,7 @@ class StartScreen(BaseState):
         if cfg is None:
             raise ValueError("cfg argument can't be None")  # noqa: TRY003
         self.cfg = cfg
-        self.font = pg.font.Font(cfg.fonts.text_font, cfg.fonts.text_font_size)
+        self.font = registry.font(cfg.fonts.text_font, cfg.fonts.text_font_size)
         self.font_color = (235, 221, 190)
         self.texts = [
             TextSprite(
@@ -72,9 +76,7 @@ class StartScreen(BaseState):
                             self.screen_rect.width // 2 - 40,
                             self.screen_rect.height // 2 + 25,
                         ),
-                        image=pg.image.load(
-                            cfg.main_scene.start_button_img
-                        ).convert_alpha(),
+                        image=registry.image(cfg.main_scene.start_button_img),
                         button_event_name="start",
                     ),
                     Button(
@@ -82,9 +84,7 @@ class StartScreen(BaseState):
                             self.screen_rect.width // 2 - 40,
                             self.screen_rect.height - 40,
                         ),
-                        image=pg.image.load(
-                            cfg.main_scene.reskin_button_img
-                        ).convert_alpha(),
+                        image=registry.image(cfg.main_scene.reskin_button_img),
                         button_event_name="reskin",
                     ),
                     Button(
@@ -92,9 +92,7 @@ class StartScreen(BaseState):
                             self.screen_rect.width // 4 - 40,
                             self.screen_rect.height - 40,
                         ),
-                        image=pg.image.load(
-                            cfg.main_scene.redress_button_img
-                        ).convert_alpha(),
+                        image=registry.image(cfg.main_scene.redress_button_img),
                         button_event_name="redress",
                     ),
                     Button(
@@ -102,9 +100,7 @@ class StartScreen(BaseState):
                             self.screen_rect.topright[0] - (26 + 10),
                             self.screen_rect.topright[1] + 10,
                         ),
-                        image=pg.image.load(
-                            cfg.main_scene.music_button_img
-                        ).convert_alpha(),
+                        image=registry.image(cfg.main_scene.music_button_img),
                         button_event_name="toggle_music",
                     ),
                 ),
@@ -81,6 +81,7 @@ def open_image(max_size_box: tuple[int, int]) -> pg.Surface | None:
         filetypes=[("Image files", "*.png;*.jpg;*.jpeg;*.gif;*.bmp")]
     )
     if filename:
+        # ? not cached: every pick may be a new file, kept only while it's used
         img = pg.image.load(filename).convert_alpha()
         return scale_keep_ratio(img, max_size_box)
     return None